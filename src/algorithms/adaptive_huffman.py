@@ -0,0 +1,416 @@
+from itertools import islice
+from utilities.bitstream import BitWriter
+from utilities.utils import DEFAULT_CHUNK_SIZE, calculate_padding_length, read_chunks
+
+LATIN1_BITS = 8
+UNICODE_BITS = 21
+
+
+def iterate_bits(data, bit_count: int):
+    """Iterate the bits of the packed data from the most significant bit of the first byte.
+
+    Args:
+        data (bytes or memoryview): The packed data.
+        bit_count (int): The number of bits to iterate.
+
+    Yields:
+        int: The next bit, 0 or 1.
+    """
+    for byte in data[:bit_count >> 3]:
+        for shift in range(7, -1, -1):
+            yield (byte >> shift) & 1
+    if bit_count & 7:
+        byte = data[bit_count >> 3]
+        for shift in range(7, 7 - (bit_count & 7), -1):
+            yield (byte >> shift) & 1
+
+
+class AdaptiveTree:
+    """Class for the huffman tree of the FGK algorithm.
+
+    The nodes are stored in lists indexed by their position in the implicit numbering of the
+    tree. The root is at position 0 and the weights never increase with the position, so the
+    leader of the block of nodes with the same weight is found by scanning towards the root.
+    A new tree contains only the NYT (not yet transmitted) node as the root.
+
+    Attributes:
+        weights (list): The weight of the node at each position.
+        parents (list): The position of the parent of each node.
+        lefts (list): The position of the left child of each node, or 0 for a leaf.
+        rights (list): The position of the right child of each node, or 0 for a leaf.
+        symbols (list): The symbol of each leaf, or None for the NYT node and internal nodes.
+        leaves (dict): A dictionary where keys are symbols and values are positions of their
+                        leaves.
+        nyt (int): The position of the NYT node.
+    """
+
+    def __init__(self) -> None:
+        """Create a new AdaptiveTree containing only the NYT node."""
+        self.weights = [0]
+        self.parents = [0]
+        self.lefts = [0]
+        self.rights = [0]
+        self.symbols = [None]
+        self.leaves = {}
+        self.nyt = 0
+
+    def get_code(self, node: int) -> tuple[int, int]:
+        """Return the current code of the node by following the path from the node to the root.
+
+        Args:
+            node (int): The position of the node.
+
+        Returns:
+            tuple of (int, int): The code and the length of the code in bits.
+        """
+        parents = self.parents
+        rights = self.rights
+        code = 0
+        length = 0
+        while node:
+            parent = parents[node]
+            if rights[parent] == node:
+                code |= 1 << length
+            length += 1
+            node = parent
+
+        return code, length
+
+    def add_symbol(self, symbol) -> int:
+        """Split the NYT node into a new NYT node and a leaf for the new symbol.
+
+        The new nodes are appended after all the other positions, because their weights
+        are zero.
+
+        Args:
+            symbol (str or int): The new symbol.
+
+        Returns:
+            int: The position of the new leaf.
+        """
+        parent = self.nyt
+        leaf = len(self.weights)
+        self.nyt = leaf + 1
+        for _ in range(2):
+            self.weights.append(0)
+            self.parents.append(parent)
+            self.lefts.append(0)
+            self.rights.append(0)
+            self.symbols.append(None)
+        self.symbols[leaf] = symbol
+        self.lefts[parent] = self.nyt
+        self.rights[parent] = leaf
+        self.leaves[symbol] = leaf
+
+        return leaf
+
+    def swap(self, first: int, second: int):
+        """Swap the subtrees at the given positions.
+
+        The weights of the nodes are equal, so only the children and the symbols are swapped,
+        and the parents of the moved nodes are updated.
+
+        Args:
+            first (int): The position of the first node.
+            second (int): The position of the second node.
+        """
+        lefts = self.lefts
+        rights = self.rights
+        symbols = self.symbols
+        lefts[first], lefts[second] = lefts[second], lefts[first]
+        rights[first], rights[second] = rights[second], rights[first]
+        symbols[first], symbols[second] = symbols[second], symbols[first]
+        for node in (first, second):
+            if lefts[node]:
+                self.parents[lefts[node]] = node
+                self.parents[rights[node]] = node
+            elif symbols[node] is None:
+                self.nyt = node
+            else:
+                self.leaves[symbols[node]] = node
+
+    def update(self, node: int):
+        """Increment the weights on the path from the leaf to the root.
+
+        Before a node is incremented, it is swapped with the leader of its block, unless the
+        leader is its parent, so the weights stay in the order of the positions.
+
+        Args:
+            node (int): The position of the leaf of the symbol.
+        """
+        weights = self.weights
+        while True:
+            weight = weights[node]
+            leader = node
+            while leader and weights[leader - 1] == weight:
+                leader -= 1
+            if leader not in (node, self.parents[node]):
+                self.swap(node, leader)
+                node = leader
+            weights[node] = weight + 1
+            if not node:
+                return
+            node = self.parents[node]
+
+
+class AdaptiveHuffman():
+    """Class for adaptive huffman coding with the FGK algorithm.
+
+    The huffman tree is updated after each symbol, so the text is encoded in one pass and no
+    frequencies or header are needed. The encoder and the decoder start from a tree containing
+    only the NYT (not yet transmitted) node and update their trees the same way. The first
+    occurrence of a symbol is encoded as the code of the NYT node followed by the symbol itself.
+
+    The complete data includes:
+    - The encoded symbols
+    - The padding of the last byte
+    - The length of the padding (8 bits)
+
+    Attributes:
+        name (str): The name of the algorithm.
+        prev_compress (bool): Indicates whether compression has occurred previously.
+        binary (bool): Indicates whether the data is compressed as bytes instead of text.
+        tree (AdaptiveTree): The tree of the current compression or decompression.
+    """
+
+    def __init__(self, binary=False) -> None:
+        """Create a new instance of AdaptiveHuffman.
+
+        Args:
+            binary (bool, optional): If True, the data is compressed and decompressed as bytes,
+                                    and a new symbol is written with 8 bits. Defaults to False.
+        """
+        self.name = "Huffman-adaptive-bytes" if binary else "Huffman-adaptive"
+        self.prev_compress = False
+        self.binary = binary
+        self.tree = AdaptiveTree()
+
+    def get_parameters(self) -> dict:
+        """Get the parameters needed to decompress the data compressed with this instance.
+
+        Returns:
+            parameters (dict): An empty dictionary, because the tree is rebuilt by the decoder.
+        """
+        return {}
+
+    def set_parameters(self, parameters: dict):
+        """Set the parameters needed to decompress the data.
+
+        Args:
+            parameters (dict): A dictionary returned by the method get_parameters.
+        """
+
+    def write_new_symbol(self, writer: BitWriter, symbol):
+        """Write a symbol that has not occurred before.
+
+        In binary mode the byte value is written with LATIN1_BITS bits. Otherwise a flag bit
+        tells whether the unicode point value is written with LATIN1_BITS or UNICODE_BITS bits.
+
+        Args:
+            writer (BitWriter): The writer the symbol is written into.
+            symbol (str or int): The new symbol.
+        """
+        if self.binary:
+            writer.write(symbol, LATIN1_BITS)
+        elif ord(symbol) < 1 << LATIN1_BITS:
+            writer.write(ord(symbol), 1 + LATIN1_BITS)
+        else:
+            writer.write((1 << UNICODE_BITS) | ord(symbol), 1 + UNICODE_BITS)
+
+    def read_new_symbol(self, bits):
+        """Read a symbol written with the method write_new_symbol.
+
+        Args:
+            bits (iterator of int): The bits of the compressed data.
+
+        Returns:
+            str or int: The symbol, or None if there are no more bits.
+        """
+        if self.binary:
+            width = LATIN1_BITS
+        else:
+            flag = next(bits, None)
+            if flag is None:
+                return None
+            width = UNICODE_BITS if flag else LATIN1_BITS
+        value_bits = list(islice(bits, width))
+        if len(value_bits) < width:
+            return None
+        value = 0
+        for bit in value_bits:
+            value = (value << 1) | bit
+        if self.binary:
+            return value
+
+        return chr(value)
+
+    def encode(self, text, writer: BitWriter):
+        """Encode the text into the writer and update the tree after each symbol.
+
+        Args:
+            text (str or bytes): The text to be encoded.
+            writer (BitWriter): The writer the codes are written into.
+        """
+        tree = self.tree
+        leaves = tree.leaves
+        for symbol in text:
+            node = leaves.get(symbol)
+            if node is None:
+                writer.write(*tree.get_code(tree.nyt))
+                self.write_new_symbol(writer, symbol)
+                node = tree.add_symbol(symbol)
+            else:
+                writer.write(*tree.get_code(node))
+            tree.update(node)
+
+    def write_padding(self, writer: BitWriter):
+        """Pad the last byte with zeros and write the length of the padding.
+
+        Args:
+            writer (BitWriter): The writer the codes have been written into.
+        """
+        padding_len = calculate_padding_length(len(writer))
+        writer.write(0, padding_len)
+        writer.write(padding_len, 8)
+
+    def decode(self, bits):
+        """Decode the symbols from the bits and update the tree after each symbol.
+
+        Args:
+            bits (iterator of int): The bits of the compressed data without the padding.
+
+        Yields:
+            str or int: The decoded symbols.
+        """
+        tree = self.tree
+        lefts = tree.lefts
+        rights = tree.rights
+        while True:
+            node = 0
+            while lefts[node]:
+                bit = next(bits, None)
+                if bit is None:
+                    return
+                node = rights[node] if bit else lefts[node]
+            if node == tree.nyt:
+                symbol = self.read_new_symbol(bits)
+                if symbol is None:
+                    return
+                node = tree.add_symbol(symbol)
+            else:
+                symbol = tree.symbols[node]
+            tree.update(node)
+            yield symbol
+
+    def join(self, symbols) -> str:
+        """Join the decoded symbols into text, or into bytes in binary mode.
+
+        Args:
+            symbols (iterable): The decoded symbols.
+
+        Returns:
+            str or bytes: The joined symbols.
+        """
+        if self.binary:
+            return bytes(symbols)
+        return "".join(symbols)
+
+    def compress(self, text) -> bytes:
+        """Compress the text using adaptive huffman coding.
+
+        Args:
+            text (str or bytes): The text to compress.
+
+        Returns:
+            complete_data (bytes): The compressed data packed into bytes.
+        """
+        self.tree = AdaptiveTree()
+        writer = BitWriter()
+        self.encode(text, writer)
+        self.write_padding(writer)
+        self.prev_compress = True
+
+        return writer.getvalue()
+
+    def compress_stream(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Compress the text from the reader into the writer one chunk at a time.
+
+        The text is read only once, so the reader does not need to be seekable, and the complete
+        bytes of each chunk are written as soon as the chunk is encoded.
+
+        Args:
+            reader (file object): A text file object to read the text from.
+            writer (file object): A binary file object to write the compressed data to.
+            chunk_size (int, optional): The number of characters read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+        """
+        self.tree = AdaptiveTree()
+        bit_writer = BitWriter()
+        for chunk in read_chunks(reader, chunk_size):
+            self.encode(chunk, bit_writer)
+            writer.write(bit_writer.take_bytes())
+        self.write_padding(bit_writer)
+        writer.write(bit_writer.getvalue())
+        self.prev_compress = True
+
+    def decompress(self, complete_data: bytes) -> str:
+        """Decompress the data from the compressed file.
+
+        Args:
+            complete_data (bytes or memoryview): The complete data from the compressed file.
+
+        Returns:
+            decoded_text (str or bytes): The decoded text in plain text format, or the decoded
+                                        bytes in binary mode.
+        """
+        self.tree = AdaptiveTree()
+        bit_count = 0
+        if len(complete_data):
+            bit_count = (len(complete_data) - 1) * 8 - complete_data[-1]
+        decoded_text = self.join(self.decode(iterate_bits(complete_data, bit_count)))
+        self.prev_compress = False
+
+        return decoded_text
+
+    def read_bits(self, reader, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Read the bits of the compressed data from the reader one chunk at a time.
+
+        The last two bytes read are held back until the next chunk, because the last byte is
+        the length of the padding of the byte before it.
+
+        Args:
+            reader (file object): A binary file object to read the compressed data from.
+            chunk_size (int, optional): The number of bytes read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+
+        Yields:
+            int: The next bit of the compressed data without the padding.
+        """
+        data = b""
+        for chunk in read_chunks(reader, chunk_size):
+            data = data + chunk
+            if len(data) > 2:
+                yield from iterate_bits(data, (len(data) - 2) * 8)
+                data = data[-2:]
+        if len(data) == 2:
+            yield from iterate_bits(data, 8 - data[1])
+
+    def decompress_stream(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Decompress the data from the reader into the writer one chunk at a time.
+
+        The decoded symbols are written in batches of chunk_size symbols.
+
+        Args:
+            reader (file object): A binary file object to read the compressed data from.
+            writer (file object): A text file object to write the decoded text to.
+            chunk_size (int, optional): The number of bytes read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+        """
+        self.tree = AdaptiveTree()
+        symbols = self.decode(self.read_bits(reader, chunk_size))
+        while True:
+            decoded_text = self.join(islice(symbols, chunk_size))
+            if not decoded_text:
+                break
+            writer.write(decoded_text)
+        self.prev_compress = False
@@ -0,0 +1,283 @@
+import json
+import multiprocessing
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+DEFAULT_BLOCK_SIZE = 1 << 18
+INDEX_LENGTH_BYTES = 8
+
+
+def compress_block(algorithm, text: str) -> tuple[bytes, dict]:
+    """Compress one block of text with the given algorithm.
+
+    The algorithm builds its dictionary from the block alone, so each block can be decompressed
+    independently.
+
+    Args:
+        algorithm (HuffmanCoding or LZW): The algorithm object to use for compressing.
+        text (str or bytes): The block of text to compress.
+
+    Returns:
+        tuple of (bytes, dict): A tuple containing the compressed block and the parameters
+                                needed to decompress it.
+    """
+    compressed_data = algorithm.compress(text)
+
+    return compressed_data, algorithm.get_parameters()
+
+
+def decompress_block(algorithm, compressed_data: bytes, parameters: dict) -> str:
+    """Decompress one block of data with the given algorithm.
+
+    Args:
+        algorithm (HuffmanCoding or LZW): The algorithm object to use for decompressing.
+        compressed_data (bytes): The compressed block.
+        parameters (dict): The parameters returned by compress_block for the block.
+
+    Returns:
+        str or bytes: The decoded text of the block.
+    """
+    algorithm.set_parameters(parameters)
+
+    return algorithm.decompress(compressed_data)
+
+
+class BlockCompressor():
+    """Class for compressing a text in independent blocks in parallel.
+
+    The text is split into blocks of the same number of characters, and each block is compressed
+    with its own huffman codes or LZW dictionary in a pool of processes. Decompression decodes
+    the blocks in parallel the same way. Because the blocks are independent, a range of the text
+    can be decompressed by decoding only the blocks it touches.
+
+    The complete data includes:
+    - The compressed blocks one after another
+    - The block index as JSON, containing the offset of the block in the text, the offset and
+    the length of the compressed block and the parameters of the block for each block
+    - The length of the block index (INDEX_LENGTH_BYTES bytes)
+
+    Attributes:
+        algorithm (HuffmanCoding or LZW): The algorithm used for each block. The instance itself
+                                        is never used for compressing, only copies of it.
+        name (str): The name of the algorithm.
+        block_size (int): The number of characters in a block.
+        max_workers (int): The maximum number of processes, or None to use all the processors.
+        prev_compress (bool): Indicates whether compression has occurred previously.
+        binary (bool): Indicates whether the data is compressed as bytes instead of text.
+    """
+
+    def __init__(self, algorithm, block_size=DEFAULT_BLOCK_SIZE, max_workers=None) -> None:
+        """Create a new instance of BlockCompressor.
+
+        Args:
+            algorithm (HuffmanCoding or LZW): A new instance of the algorithm used for each block.
+            block_size (int, optional): The number of characters in a block.
+                                        Defaults to DEFAULT_BLOCK_SIZE.
+            max_workers (int, optional): The maximum number of processes. Defaults to None, when
+                                        the number of processors is used.
+
+        Raises:
+            ValueError: If the block size is less than 1.
+        """
+        if block_size < 1:
+            raise ValueError("The block size must be at least 1.")
+
+        self.algorithm = algorithm
+        self.name = f"{algorithm.name}-blocks"
+        self.block_size = block_size
+        self.max_workers = max_workers
+        self.prev_compress = False
+        self.binary = algorithm.binary
+
+    def get_parameters(self) -> dict:
+        """Get the parameters needed to decompress the data compressed with this instance.
+
+        Returns:
+            parameters (dict): An empty dictionary, because the block index contains the
+                            parameters of each block.
+        """
+        return {}
+
+    def set_parameters(self, parameters: dict):
+        """Set the parameters needed to decompress the data.
+
+        Args:
+            parameters (dict): A dictionary returned by the method get_parameters.
+        """
+
+    def _uses_pool(self, block_count: int) -> bool:
+        """Check whether the blocks are processed in the process pool.
+
+        Inside a worker process the blocks are always processed serially, so a BlockCompressor
+        that is benchmarked in a process pool does not start a pool of its own in each worker.
+
+        Args:
+            block_count (int): The number of blocks.
+
+        Returns:
+            bool: False if there is only one block, only one worker is allowed or this process
+                is a worker process, True otherwise.
+        """
+        return block_count > 1 and self.max_workers != 1 and \
+            multiprocessing.parent_process() is None
+
+    def _map(self, function, *iterables) -> list:
+        """Call the function for each block in the process pool.
+
+        If the pool is not used, the function is called in this process, so no processes are
+        started.
+
+        Args:
+            function (callable): The function to call.
+            iterables (iterable): The arguments of the function for each block.
+
+        Returns:
+            list: The results of the function in the order of the blocks.
+        """
+        arguments = [list(iterable) for iterable in iterables]
+        if not self._uses_pool(len(arguments[-1])):
+            return list(map(function, *arguments))
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(function, *arguments))
+
+    def split_blocks(self, text: str) -> list:
+        """Split the text into blocks of block_size characters.
+
+        Args:
+            text (str or bytes): The text to split.
+
+        Returns:
+            blocks (list of str): The blocks of the text.
+        """
+        return [text[start:start + self.block_size]
+                for start in range(0, len(text), self.block_size)]
+
+    def compress(self, text) -> bytes:
+        """Compress the text in independent blocks.
+
+        Args:
+            text (str or bytes): The text to compress.
+
+        Returns:
+            complete_data (bytes): The compressed blocks and the block index.
+        """
+        text_blocks = self.split_blocks(text)
+        results = self._map(compress_block, repeat(self.algorithm, len(text_blocks)),
+                            text_blocks)
+
+        blocks = []
+        compressed_offset = 0
+        for block_number, (compressed_data, parameters) in enumerate(results):
+            blocks.append([block_number * self.block_size, compressed_offset,
+                           len(compressed_data), parameters])
+            compressed_offset += len(compressed_data)
+        index = json.dumps({"block_size": self.block_size, "blocks": blocks}).encode("utf-8")
+        complete_data = b"".join(compressed_data for compressed_data, _ in results)
+        complete_data += index + len(index).to_bytes(INDEX_LENGTH_BYTES, "big")
+        self.prev_compress = True
+
+        return complete_data
+
+    def parse_index(self, complete_data: bytes) -> list:
+        """Parse the block index from the end of the complete data.
+
+        Args:
+            complete_data (bytes): The complete data packed into bytes.
+
+        Returns:
+            blocks (list): A list containing [offset in the text, compressed offset,
+                        compressed length, parameters] for each block.
+        """
+        index_length = int.from_bytes(complete_data[-INDEX_LENGTH_BYTES:], "big")
+        index_start = len(complete_data) - INDEX_LENGTH_BYTES - index_length
+        index = json.loads(str(complete_data[index_start:-INDEX_LENGTH_BYTES], "utf-8"))
+
+        return index["blocks"]
+
+    def decompress(self, complete_data: bytes) -> str:
+        """Decompress the blocks of the complete data in parallel.
+
+        Args:
+            complete_data (bytes or memoryview): The complete data from the compressed file.
+
+        Returns:
+            decoded_text (str or bytes): The decoded text in plain text.
+        """
+        blocks = self.parse_index(complete_data)
+        compressed_blocks = [complete_data[offset:offset + length]
+                             for _, offset, length, _ in blocks]
+        self.prev_compress = False
+
+        return self.decompress_blocks(blocks, compressed_blocks)
+
+    def decompress_blocks(self, blocks: list, compressed_blocks: list) -> str:
+        """Decompress the given blocks in parallel and join the decoded text.
+
+        The compressed blocks can be views of a mapped file. They are copied into bytes only
+        when they are sent to other processes.
+
+        Args:
+            blocks (list): The entries of the block index for the blocks.
+            compressed_blocks (list of bytes or memoryviews): The compressed data of the blocks.
+
+        Returns:
+            str or bytes: The decoded text of the blocks.
+        """
+        if self._uses_pool(len(blocks)):
+            compressed_blocks = [bytes(block) for block in compressed_blocks]
+        decoded_blocks = self._map(decompress_block, repeat(self.algorithm, len(blocks)),
+                                   compressed_blocks,
+                                   (parameters for _, _, _, parameters in blocks))
+
+        empty = b"" if self.binary else ""
+        return empty.join(decoded_blocks)
+
+    def read_index(self, file) -> list:
+        """Read the block index from the end of the file without reading the blocks.
+
+        Args:
+            file (file object): A seekable binary file object of the complete data.
+
+        Returns:
+            blocks (list): A list containing [offset in the text, compressed offset,
+                        compressed length, parameters] for each block.
+        """
+        file.seek(-INDEX_LENGTH_BYTES, 2)
+        index_length = int.from_bytes(file.read(INDEX_LENGTH_BYTES), "big")
+        file.seek(-INDEX_LENGTH_BYTES - index_length, 2)
+
+        return self.parse_index(file.read())
+
+    def decompress_range(self, path: str, start: int, end: int) -> str:
+        """Decompress a range of the text from the compressed file.
+
+        Only the block index and the blocks that contain characters of the range are read from
+        the file and decoded.
+
+        Args:
+            path (str): The path to the file containing the complete data.
+            start (int): The index of the first character of the range.
+            end (int): The index after the last character of the range.
+
+        Returns:
+            str or bytes: The characters of the text from start to end.
+        """
+        with open(path, "rb") as file:
+            blocks = self.read_index(file)
+            text_offsets = [block[0] for block in blocks]
+            first_block = max(bisect_right(text_offsets, start) - 1, 0)
+            last_block = bisect_left(text_offsets, end)
+            blocks = blocks[first_block:last_block]
+            if start >= end or not blocks:
+                return b"" if self.binary else ""
+
+            compressed_blocks = []
+            for _, offset, length, _ in blocks:
+                file.seek(offset)
+                compressed_blocks.append(file.read(length))
+
+        decoded_text = self.decompress_blocks(blocks, compressed_blocks)
+        range_start = start - blocks[0][0]
+
+        return decoded_text[range_start:range_start + end - start]
@@ -0,0 +1,324 @@
+import heapq
+from algorithms.decode_table import DEFAULT_TABLE_BITS, MAX_TABLE_BITS, DecodeTable
+from utilities.utils import calculate_min_bits_needed
+
+CODE_LENGTH_BITS = 8
+MAX_CODE_LENGTH = (1 << CODE_LENGTH_BITS) - 1
+
+
+def create_canonical_codes(code_lengths: dict) -> dict:
+    """Create canonical huffman codes from the code lengths of the characters.
+
+    The characters are ordered by their code length and then by the character itself.
+    The first character gets a code of zeros, and each following code is the previous code
+    plus one, shifted to the left whenever the code length grows. This way the codes can be
+    reconstructed from the code lengths alone.
+
+    Args:
+        code_lengths (dict): A dictionary where keys are characters and values are
+                            the lengths of their huffman codes.
+
+    Returns:
+        codes (dict): A dictionary where keys are characters and values are tuples
+                    of (code, code length).
+    """
+    codes = {}
+    code = 0
+    previous_length = 0
+    for char, length in sorted(code_lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= length - previous_length
+        codes[char] = (code, length)
+        code += 1
+        previous_length = length
+
+    return codes
+
+
+def calculate_limited_code_lengths(frequency_dict: dict, max_code_length: int) -> dict:
+    """Calculate optimal code lengths that do not exceed the maximum code length.
+
+    The code lengths are calculated with the package-merge algorithm. The characters sorted
+    by their frequencies are the items of every level. Starting from the deepest level,
+    adjacent items are paired into packages, and the packages are merged with the items of
+    the next level, until max_code_length levels are processed. The first 2n - 2 items of
+    the last level are selected, and the code length of a character is the number of times
+    it appears in the selected items and their packages.
+
+    Args:
+        frequency_dict (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+        max_code_length (int): The maximum length of a huffman code in bits.
+
+    Returns:
+        code_lengths (dict): A dictionary where keys are characters and values are
+                            the lengths of their huffman codes.
+
+    Raises:
+        ValueError: If there are too many characters for the maximum code length.
+    """
+    chars = sorted(frequency_dict, key=lambda char: frequency_dict[char])
+    if len(chars) == 1:
+        return {chars[0]: 1}
+    if len(chars) > 2 ** max_code_length:
+        raise ValueError(
+            f"{len(chars)} characters can not be coded with at most "
+            f"{max_code_length} bits.")
+
+    leaves = [(frequency_dict[char], index) for index, char in enumerate(chars)]
+    items = leaves
+    for _ in range(max_code_length - 1):
+        packages = [(items[i][0] + items[i + 1][0], (items[i][1], items[i + 1][1]))
+                    for i in range(0, len(items) - 1, 2)]
+        items = list(heapq.merge(leaves, packages, key=lambda item: item[0]))
+
+    counts = [0] * len(chars)
+    stack = [item for _, item in items[:2 * len(chars) - 2]]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, tuple):
+            stack.extend(item)
+        else:
+            counts[item] += 1
+
+    return {char: counts[index] for index, char in enumerate(chars)}
+
+
+def create_decode_table(codes: dict, table_bits: int, binary: bool) -> DecodeTable:
+    """Create a decode table for the given huffman codes.
+
+    In binary mode the byte values are given to the decode table as bytes objects, so the
+    decoded data is bytes.
+
+    Args:
+        codes (dict): A dictionary where keys are characters, or byte values in binary
+                    mode, and values are tuples of (code, code length).
+        table_bits (int): The number of bits used to index the primary table.
+        binary (bool): Indicates whether the keys of the codes are byte values.
+
+    Returns:
+        DecodeTable: The decode table for the huffman codes.
+    """
+    if binary:
+        codes = {bytes([byte]): code for byte, code in codes.items()}
+    return DecodeTable(codes, table_bits)
+
+
+class CanonicalCodes:
+    """Class for creating canonical huffman codes and their header.
+
+    The header of canonical codes stores only the characters and their code lengths. If a trained
+    table is given, the header starts with a flag telling whether the codes of the table were
+    used, and the table writes and checks its own part of the header.
+
+    Attributes:
+        max_code_length (int): The maximum length of a huffman code in bits, or None if the
+                            code lengths are not limited.
+        binary (bool): Indicates whether the symbols are byte values instead of characters.
+        table (HuffmanTable): The trained table of code lengths, or None.
+    """
+
+    def __init__(self, max_code_length=None, binary=False, table=None):
+        """Create a new CanonicalCodes.
+
+        Args:
+            max_code_length (int, optional): The maximum length of a huffman code in bits.
+                                            Defaults to None.
+            binary (bool, optional): If True, the symbols are byte values. Defaults to False.
+            table (HuffmanTable, optional): A trained table of code lengths. Defaults to None.
+        """
+        self.max_code_length = max_code_length
+        self.binary = binary
+        self.table = table
+
+    def get_table_bits(self, codes: dict) -> int:
+        """Return the number of bits used to index the primary decode table.
+
+        The table is never indexed with more bits than the longest code has. If the code
+        lengths are limited, the table is indexed with up to MAX_TABLE_BITS bits, so every code
+        of a short enough maximum length is resolved with a single lookup.
+
+        Args:
+            codes (dict): A dictionary where keys are characters and values are tuples
+                        of (code, code length).
+
+        Returns:
+            int: The number of bits.
+        """
+        longest = max(length for _, length in codes.values())
+        return min(longest, self.max_code_length or DEFAULT_TABLE_BITS, MAX_TABLE_BITS)
+
+    def get_table_codes(self, frequency: dict):
+        """Return the codes of the trained table if every character of the text has a code in it.
+
+        Args:
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+
+        Returns:
+            codes (dict): The codes of the table, or None if the table can not be used.
+        """
+        if self.table is None or not self.table.covers(frequency):
+            return None
+        return self.table.get_codes()
+
+    def create_codes(self, code_lengths: dict, frequency: dict) -> dict:
+        """Create the canonical codes from the code lengths of a huffman tree.
+
+        If the longest code exceeds the maximum code length, the code lengths are recalculated
+        with the package-merge algorithm.
+
+        Args:
+            code_lengths (dict): A dictionary where keys are characters and values are
+                                the lengths of their codes in the huffman tree.
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+
+        Returns:
+            codes (dict): A dictionary where keys are characters and values are tuples
+                        of (code, code length).
+        """
+        if self.max_code_length is not None and \
+                max(code_lengths.values()) > self.max_code_length:
+            code_lengths = calculate_limited_code_lengths(frequency, self.max_code_length)
+
+        return create_canonical_codes(code_lengths)
+
+    def encode_header(self, codes: dict, frequency: dict) -> str:
+        """Encode the header of the codes.
+
+        The header is encoded with the following logic:
+        Without a trained table:
+            - The code lengths of the codes.
+        If every character of the text has a code in the trained table, so its codes are used:
+            - The header of the table.
+        Otherwise,
+            - "0".
+            - The code lengths of the codes.
+
+        Args:
+            codes (dict): A dictionary where keys are characters and values are tuples
+                        of (code, code length).
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+
+        Returns:
+            header (str): The header as a string of binary data.
+        """
+        if self.table is None:
+            return self.encode_code_lengths(codes)
+        if self.table.covers(frequency):
+            return self.table.encode_header()
+        return "0" + self.encode_code_lengths(codes)
+
+    def encode_code_lengths(self, codes: dict) -> str:
+        """Encode the characters and the code lengths of the canonical huffman codes.
+
+        The header is encoded with the following logic:
+            - Minimum bits needed to represent the largest unicode point value (5 bits).
+            - Length of the longest code (CODE_LENGTH_BITS bits).
+            - Minimum bits needed to represent the number of codes of one length (5 bits).
+            - For each code length from 1 to the longest, the number of codes with that length.
+            - The characters in the canonical order.
+
+        Args:
+            codes (dict): A dictionary where keys are characters and values are tuples
+                        of (code, code length).
+
+        Returns:
+            header (str): The code lengths as a string of binary data.
+        """
+        symbol_bits = max(calculate_min_bits_needed(
+            max(self._symbol_to_value(char) for char in codes)), 1)
+        max_length = max(length for _, length in codes.values())
+        counts = [0] * max_length
+        for _, length in codes.values():
+            counts[length - 1] += 1
+        count_bits = max(calculate_min_bits_needed(max(counts)), 1)
+        ordered_chars = sorted(codes, key=lambda char: codes[char])
+
+        header = [format(symbol_bits, "05b"), format(max_length, f"0{CODE_LENGTH_BITS}b"),
+                  format(count_bits, "05b")]
+        header.extend(format(count, f"0{count_bits}b") for count in counts)
+        header.extend(format(self._symbol_to_value(char), f"0{symbol_bits}b")
+                      for char in ordered_chars)
+        return "".join(header)
+
+    def parse_header(self, header: str) -> dict:
+        """Parse the code lengths of the characters from a header that does not refer to the
+        trained table.
+
+        Args:
+            header (str): A binary string representing the header data.
+
+        Returns:
+            code_lengths (dict): A dictionary where keys are characters and values are
+                                the lengths of their huffman codes.
+        """
+        code_lengths, _ = self.parse_code_lengths(header, 0 if self.table is None else 1)
+
+        return code_lengths
+
+    def parse_code_lengths(self, header: str, index: int) -> tuple[dict, int]:
+        """Parse the code lengths of the characters from the data written by the method
+        encode_code_lengths that starts at the given index.
+
+        Args:
+            header (str): A binary string containing the code lengths.
+            index (int): The index where the code lengths start.
+
+        Returns:
+            tuple of (dict, int): A tuple containing the code lengths of the characters and the
+                                index after the code lengths.
+        """
+        symbol_bits = int(header[index:index + 5], base=2)
+        max_length = int(header[index + 5:index + 13], base=2)
+        count_bits = int(header[index + 13:index + 18], base=2)
+        index += 18
+
+        counts = []
+        for _ in range(max_length):
+            counts.append(int(header[index:index + count_bits], base=2))
+            index += count_bits
+
+        code_lengths = {}
+        for length, count in enumerate(counts, start=1):
+            for _ in range(count):
+                value = int(header[index:index + symbol_bits], base=2)
+                code_lengths[value if self.binary else chr(value)] = length
+                index += symbol_bits
+
+        return code_lengths, index
+
+    def create_decode_table(self, header: str) -> tuple[dict, DecodeTable]:
+        """Create the codes from the header and a decode table for them.
+
+        If the header refers to the trained table, the table checks its ID and returns its own
+        codes and decode table, which are created only once.
+
+        Args:
+            header (str): A binary string representing the header data.
+
+        Returns:
+            tuple of (dict, DecodeTable): A tuple containing the codes and the decode table.
+
+        Raises:
+            ValueError: If the header refers to a different table than the trained table.
+        """
+        if self.table is not None and header[:1] == "1":
+            self.table.check_header(header)
+            codes = self.table.get_codes()
+            return codes, self.table.get_decode_table(self.get_table_bits(codes))
+
+        codes = create_canonical_codes(self.parse_header(header))
+        return codes, create_decode_table(codes, self.get_table_bits(codes), self.binary)
+
+    def _symbol_to_value(self, symbol) -> int:
+        """Return the integer value of the symbol written into the header.
+
+        Args:
+            symbol (str or int): A character, or a byte value in binary mode.
+
+        Returns:
+            int: The unicode point value of the character, or the byte value.
+        """
+        return symbol if self.binary else ord(symbol)
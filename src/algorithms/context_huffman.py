@@ -0,0 +1,313 @@
+import math
+from collections import Counter, defaultdict
+from itertools import islice
+from algorithms.canonical_codes import create_canonical_codes
+from algorithms.decode_table import DecodeTable, refill_accumulator
+from algorithms.huffman import HuffmanCoding
+from utilities.bitstream import read_frame, write_frame
+from utilities.utils import calculate_min_bits_needed
+
+TABLE_COUNT_BITS = 32
+CONTEXT_TABLE_BITS = 10
+DEFAULT_MIN_CONTEXT_COUNT = 32
+
+
+class ContextHuffman():
+    """Class for order-1 context modelled huffman coding.
+
+    Each character is encoded with canonical huffman codes selected by the previous character,
+    so the codes follow the statistics of the characters that usually come after it. A context
+    gets its own codes only if it occurs at least min_context_count times and its own codes are
+    estimated to save more bits than its table takes in the header. The characters after the
+    other contexts and the first character of the text share one fallback table, which keeps
+    the header small.
+
+    The complete data includes:
+    - The length of the header in bits (FRAME_LENGTH_BYTES bytes)
+    - The number of characters in the text (FRAME_LENGTH_BYTES bytes)
+    - The padded header, containing the minimum bits needed to represent the largest context
+    (5 bits), the number of tables (TABLE_COUNT_BITS bits), the canonical header of the fallback
+    table and the context and the canonical header of each other table
+    - The compressed data, padded with zeros
+
+    Attributes:
+        name (str): The name of the algorithm.
+        prev_compress (bool): Indicates whether compression has occurred previously.
+        binary (bool): Indicates whether the data is compressed as bytes instead of text.
+        min_context_count (int): The number of occurrences needed for a context to get its
+                                own table.
+        huffman (HuffmanCoding): The canonical huffman coding used to create the codes and the
+                                header of each table.
+        context_codes (dict): A dictionary where keys are contexts, or None for the fallback
+                            table, and values are dictionaries of the canonical codes.
+    """
+
+    def __init__(self, min_context_count=DEFAULT_MIN_CONTEXT_COUNT, max_code_length=None,
+                 binary=False) -> None:
+        """Create a new instance of ContextHuffman.
+
+        Args:
+            min_context_count (int, optional): The number of occurrences needed for a context
+                                            to get its own table.
+                                            Defaults to DEFAULT_MIN_CONTEXT_COUNT.
+            max_code_length (int, optional): The maximum length of a huffman code in bits.
+                                            Defaults to None.
+            binary (bool, optional): If True, the data is compressed and decompressed as bytes.
+                                    Defaults to False.
+        """
+        self.name = "Huffman-order1-bytes" if binary else "Huffman-order1"
+        self.prev_compress = False
+        self.binary = binary
+        self.min_context_count = min_context_count
+        self.huffman = HuffmanCoding(canonical=True, max_code_length=max_code_length,
+                                     binary=binary)
+        self.context_codes = {}
+
+    def get_parameters(self) -> dict:
+        """Get the parameters needed to decompress the data compressed with this instance.
+
+        Returns:
+            parameters (dict): An empty dictionary, because the header contains the tables.
+        """
+        return {}
+
+    def set_parameters(self, parameters: dict):
+        """Set the parameters needed to decompress the data.
+
+        Args:
+            parameters (dict): A dictionary returned by the method get_parameters.
+        """
+
+    def count_contexts(self, text) -> dict:
+        """Count the frequencies of the characters after each context.
+
+        The pairs of adjacent characters are counted at once with a Counter. The counts of the
+        contexts that occur less than min_context_count times, or whose own table is not
+        estimated to be worth it, are merged into the fallback table.
+
+        Args:
+            text (str or bytes): The text to count the frequencies from.
+
+        Returns:
+            frequencies (dict): A dictionary where keys are contexts, or None for the fallback
+                                table, and values are the frequencies of the characters.
+        """
+        frequencies = {None: Counter(islice(text, 1))}
+        for (context, char), count in Counter(zip(text, islice(text, 1, None))).items():
+            frequencies.setdefault(context, Counter())[char] = count
+
+        order0_lengths = self.estimate_code_lengths(Counter(text))
+        for context in list(frequencies):
+            if context is None:
+                continue
+            frequency = frequencies[context]
+            if frequency.total() < self.min_context_count or \
+                    self.estimate_table_cost(frequency) >= sum(
+                        order0_lengths[char] * count for char, count in frequency.items()):
+                frequencies[None].update(frequencies.pop(context))
+
+        return frequencies
+
+    def estimate_code_lengths(self, frequency) -> dict:
+        """Estimate the code lengths of the characters from their information content.
+
+        Args:
+            frequency (Counter): The frequencies of the characters.
+
+        Returns:
+            dict: A dictionary where keys are characters and values are their estimated code
+                lengths in bits.
+        """
+        total = frequency.total()
+        return {char: max(math.log2(total / count), 1) for char, count in frequency.items()}
+
+    def estimate_table_cost(self, frequency) -> float:
+        """Estimate the number of bits needed for the characters after a context with its own
+        table, including the table in the header.
+
+        The table is estimated to take the fixed fields of the canonical header, the counts of
+        eight code lengths with eight bits each, and the characters and the context with the
+        bits needed for the largest character.
+
+        Args:
+            frequency (Counter): The frequencies of the characters after the context.
+
+        Returns:
+            float: The estimated number of bits.
+        """
+        lengths = self.estimate_code_lengths(frequency)
+        symbol_bits = max(calculate_min_bits_needed(
+            max(char if self.binary else ord(char) for char in frequency)), 1)
+        header_bits = 18 + 8 * 8 + len(frequency) * symbol_bits + symbol_bits
+
+        return sum(lengths[char] * count for char, count in frequency.items()) + header_bits
+
+    def create_codes(self, frequency) -> dict:
+        """Create the canonical huffman codes for the frequencies of one context.
+
+        Args:
+            frequency (dict): A dictionary where keys are characters and values are their
+                            frequencies after the context.
+
+        Returns:
+            codes (dict): A dictionary where keys are characters and values are tuples
+                        of (code, code length).
+        """
+        self.huffman.build_huffman_tree_from_frequency(frequency)
+        self.huffman.create_codes(frequency)
+
+        return self.huffman.codes
+
+    def encode_header(self) -> str:
+        """Encode the contexts and the code lengths of all the tables.
+
+        Returns:
+            header (str): The header as a string of binary data, or an empty string if there are
+                        no tables.
+        """
+        if not self.context_codes:
+            return ""
+
+        contexts = sorted(context for context in self.context_codes if context is not None)
+        values = [context if self.binary else ord(context) for context in contexts]
+        context_bits = max(calculate_min_bits_needed(max(values, default=0)), 1)
+        header = [format(context_bits, "05b"), format(len(contexts) + 1, f"0{TABLE_COUNT_BITS}b")]
+        for context, value in zip([None] + contexts, [None] + values):
+            if context is not None:
+                header.append(format(value, f"0{context_bits}b"))
+            header.append(self.huffman.canonical_codes.encode_code_lengths(
+                self.context_codes[context]))
+
+        return "".join(header)
+
+    def parse_header(self, header: str) -> dict:
+        """Parse the contexts and create the canonical codes of all the tables.
+
+        Args:
+            header (str): The header as a string of binary data.
+
+        Returns:
+            context_codes (dict): A dictionary where keys are contexts, or None for the fallback
+                                table, and values are dictionaries of the canonical codes.
+        """
+        if not header:
+            return {}
+
+        context_bits = int(header[:5], base=2)
+        table_count = int(header[5:5 + TABLE_COUNT_BITS], base=2)
+        index = 5 + TABLE_COUNT_BITS
+        context_codes = {}
+        for table_number in range(table_count):
+            context = None
+            if table_number:
+                value = int(header[index:index + context_bits], base=2)
+                context = value if self.binary else chr(value)
+                index += context_bits
+            code_lengths, index = self.huffman.canonical_codes.parse_code_lengths(header, index)
+            context_codes[context] = create_canonical_codes(code_lengths)
+
+        return context_codes
+
+    def compress(self, text) -> bytes:
+        """Compress the text using order-1 context modelled huffman coding.
+
+        Args:
+            text (str or bytes): The text to compress.
+
+        Returns:
+            complete_data (bytes): The compressed data packed into bytes.
+        """
+        frequencies = self.count_contexts(text)
+        self.context_codes = {context: self.create_codes(frequency)
+                              for context, frequency in frequencies.items() if frequency}
+        writer = write_frame(self.encode_header(), len(text))
+        if text:
+            fallback_codes = self.context_codes[None]
+            writer.write_symbols_in_context(
+                text, defaultdict(lambda: fallback_codes, self.context_codes), None)
+        self.prev_compress = True
+
+        return writer.getvalue()
+
+    def create_decode_tables(self) -> dict:
+        """Create a decode table for the codes of each context.
+
+        Each decode table decodes one character at a time, because the next character is
+        decoded with the table of its own context. The primary tables are indexed with at most
+        CONTEXT_TABLE_BITS bits, so the tables of the many contexts stay small. In binary mode the
+        contexts and the symbols are bytes objects, so the decoded data is bytes.
+
+        Returns:
+            decode_tables (dict): A dictionary where keys are contexts, or None for the fallback
+                                table, and values are decode tables.
+        """
+        decode_tables = {}
+        for context, codes in self.context_codes.items():
+            if self.binary:
+                codes = {bytes([byte]): code for byte, code in codes.items()}
+                context = bytes([context]) if context is not None else None
+            max_length = max(length for _, length in codes.values())
+            decode_tables[context] = DecodeTable(
+                codes, min(max_length, CONTEXT_TABLE_BITS), multi_symbol=False)
+
+        return decode_tables
+
+    def decode_text(self, data, start: int, count: int, decode_tables: dict):
+        """Decode the given number of characters from the packed data.
+
+        Each character is decoded with the decode table of the previous character. The
+        accumulator is refilled eight bytes at a time, and the bits after the end of the data
+        are read as zeros, so the last characters need no special handling.
+
+        Args:
+            data (bytes or memoryview): The packed data.
+            start (int): The index of the byte where the compressed data starts.
+            count (int): The number of characters to decode.
+            decode_tables (dict): The decode tables created by the method create_decode_tables.
+
+        Returns:
+            str or bytes: The decoded text.
+
+        Raises:
+            ValueError: If the data contains an invalid code.
+        """
+        fallback_decoder = decode_tables[None].decode_symbol
+        decoders = defaultdict(lambda: fallback_decoder, {
+            context: table.decode_symbol for context, table in decode_tables.items()})
+        needed = max(max(table.table_bits, table.max_length) for table in decode_tables.values())
+
+        position = start
+        accumulator = bit_count = 0
+        context = None
+        decoded = []
+        for _ in range(count):
+            while bit_count < needed:
+                accumulator, bit_count = refill_accumulator(data, position, accumulator, bit_count)
+                position += 8
+            context, length = decoders[context](accumulator, bit_count)
+            decoded.append(context)
+            bit_count -= length
+
+        return (b"" if self.binary else "").join(decoded)
+
+    def decompress(self, complete_data: bytes) -> str:
+        """Decompress the data from the compressed file.
+
+        Args:
+            complete_data (bytes or memoryview): The complete data from the compressed file.
+
+        Returns:
+            decoded_text (str or bytes): The decoded text in plain text format, or the decoded
+                                        bytes in binary mode.
+        """
+        header, text_length, data_start = read_frame(complete_data)
+        self.context_codes = self.parse_header(header)
+
+        if text_length:
+            decoded_text = self.decode_text(
+                complete_data, data_start, text_length, self.create_decode_tables())
+        else:
+            decoded_text = b"" if self.binary else ""
+        self.prev_compress = False
+
+        return decoded_text
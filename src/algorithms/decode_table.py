@@ -0,0 +1,327 @@
+DEFAULT_TABLE_BITS = 12
+MAX_TABLE_BITS = 16
+
+
+class DecodeTable:
+    """Class for table-driven decoding of prefix codes.
+
+    The decoder reads table_bits bits at a time from a packed byte buffer and resolves them
+    with a single lookup. Each entry of the primary table contains all the symbols whose codes
+    fit completely into those bits, so one lookup can decode several symbols. Codes longer than
+    table_bits are resolved with a secondary table selected by the first table_bits bits.
+
+    Attributes:
+        table_bits (int): The number of bits used to index the primary table.
+        max_length (int): The length of the longest code in bits.
+        symbols (list): The decoded symbols for each index of the primary table.
+        lengths (list): The number of bits consumed for each index of the primary table.
+                        The value is 0 if the index is a prefix of a longer code.
+        subtables (dict): A dictionary mapping primary table indices to tuples of
+                        (number of index bits, symbols, total code lengths).
+        reverse_codes (dict): A dictionary mapping codes as strings of binary data to
+                            their symbols. It is used to decode the last bits of the data.
+        empty (str or bytes): An empty sequence of the same type as the symbols, used to join
+                            the decoded symbols.
+    """
+
+    def __init__(self, codes: dict, table_bits=DEFAULT_TABLE_BITS, multi_symbol=True):
+        """Create a new decode table from the given codes.
+
+        Args:
+            codes (dict): A dictionary where keys are symbols and values are tuples
+                        of (code, length of the code in bits). The symbols are strings or
+                        bytes objects.
+            table_bits (int, optional): The number of bits read for each lookup.
+                                        Defaults to DEFAULT_TABLE_BITS.
+            multi_symbol (bool, optional): If True, an entry of the primary table contains as
+                                        many symbols as fit into the looked up bits. Otherwise
+                                        each entry contains only one symbol. Defaults to True.
+        """
+        self.table_bits = table_bits
+        self.empty = next(iter(codes))[:0]
+        self.max_length = max(length for _, length in codes.values())
+        self.symbols = [None] * (1 << table_bits)
+        self.lengths = [0] * (1 << table_bits)
+        self.subtables = {}
+        self.reverse_codes = {format(code, f"0{length}b"): symbol
+                              for symbol, (code, length) in codes.items()}
+
+        self._fill_primary_table(codes)
+        self._fill_subtables(codes)
+        if multi_symbol:
+            self._combine_entries()
+
+    def _fill_primary_table(self, codes):
+        """Fill the primary table entries of all the codes that are at most table_bits long.
+
+        Each code of length l fills 2^(table_bits - l) consecutive entries, because the bits
+        following the code can have any value.
+
+        Args:
+            codes (dict): A dictionary where keys are symbols and values are tuples
+                        of (code, length of the code in bits).
+        """
+        for symbol, (code, length) in codes.items():
+            if length > self.table_bits:
+                continue
+            free_bits = self.table_bits - length
+            first_index = code << free_bits
+            for index in range(first_index, first_index + (1 << free_bits)):
+                self.symbols[index] = symbol
+                self.lengths[index] = length
+
+    def _fill_subtables(self, codes):
+        """Create the secondary tables for the codes that are longer than table_bits.
+
+        The codes are grouped by their first table_bits bits, and each group gets its own table.
+
+        Args:
+            codes (dict): A dictionary where keys are symbols and values are tuples
+                        of (code, length of the code in bits).
+        """
+        long_codes = {}
+        for symbol, (code, length) in codes.items():
+            if length > self.table_bits:
+                prefix = code >> (length - self.table_bits)
+                long_codes.setdefault(prefix, []).append((symbol, code, length))
+
+        for prefix, group in long_codes.items():
+            self.subtables[prefix] = self._create_subtable(group)
+
+    def _create_subtable(self, group) -> tuple:
+        """Create the secondary table for a group of codes that share their first table_bits bits.
+
+        The table is indexed by the bits following the first table_bits bits, and the size of
+        the table is set by the longest code in the group.
+
+        Args:
+            group (list): A list of tuples of (symbol, code, length of the code in bits).
+
+        Returns:
+            tuple of (int, list, list): A tuple containing the number of index bits, the symbols
+                                        and the total code lengths of the table.
+        """
+        sub_bits = max(length for _, _, length in group) - self.table_bits
+        sub_symbols = [None] * (1 << sub_bits)
+        sub_lengths = [0] * (1 << sub_bits)
+        for symbol, code, length in group:
+            suffix_length = length - self.table_bits
+            free_bits = sub_bits - suffix_length
+            first_index = (code & ((1 << suffix_length) - 1)) << free_bits
+            for index in range(first_index, first_index + (1 << free_bits)):
+                sub_symbols[index] = symbol
+                sub_lengths[index] = length
+
+        return sub_bits, sub_symbols, sub_lengths
+
+    def _combine_entries(self):
+        """Extend every primary table entry with the symbols that follow the first one.
+
+        The remaining bits of an index are shifted to the top of the index and looked up again
+        as long as the next code fits completely into the remaining bits.
+        """
+        mask = (1 << self.table_bits) - 1
+        symbols = self.symbols[:]
+        lengths = self.lengths[:]
+        for index, length in enumerate(lengths):
+            if not length:
+                continue
+            sequence = [symbols[index]]
+            consumed = length
+            while consumed < self.table_bits:
+                next_index = (index << consumed) & mask
+                next_length = lengths[next_index]
+                if not next_length or consumed + next_length > self.table_bits:
+                    break
+                sequence.append(symbols[next_index])
+                consumed += next_length
+            self.symbols[index] = self.empty.join(sequence)
+            self.lengths[index] = consumed
+
+    def decode(self, data, start: int, end: int):
+        """Decode the symbols from the given bits of the packed data.
+
+        Most of the data is decoded with decode_partial. The last bits, which are fewer than
+        max(table_bits, max_length), are decoded one bit at a time with the reverse_codes
+        dictionary.
+
+        Args:
+            data (bytes): The packed data.
+            start (int): The index of the first bit to decode.
+            end (int): The index after the last bit to decode.
+
+        Returns:
+            str or bytes: The decoded symbols.
+        """
+        decoded, position = self.decode_partial(data, start, end)
+        remaining = end - position
+        if not remaining:
+            return decoded
+
+        last_byte = (end + 7) >> 3
+        tail = int.from_bytes(data[position >> 3:last_byte], "big")
+        tail = (tail >> ((last_byte << 3) - end)) & ((1 << remaining) - 1)
+
+        return decoded + self._decode_bits(format(tail, f"0{remaining}b"))
+
+    def decode_partial(self, data, start: int, end: int) -> tuple:
+        """Decode the symbols from the given bits of the packed data as long as a whole
+        code is guaranteed to be available.
+
+        While at least max(table_bits, max_length) bits are remaining, the next table_bits bits
+        are looked up from the primary table, falling back to a secondary table for long codes.
+        The remaining bits are left for the caller, so data that is read in chunks can be
+        decoded by appending the next chunk to them.
+
+        Args:
+            data (bytes): The packed data.
+            start (int): The index of the first bit to decode.
+            end (int): The index after the last bit that is available.
+
+        Returns:
+            tuple of (str or bytes, int): A tuple containing the decoded symbols and the index
+                                        of the first bit that was not decoded.
+
+        Raises:
+            ValueError: If the data contains an invalid code.
+        """
+        position = start >> 3
+        accumulator = data[position] & (0xFF >> (start & 7)) if start < end else 0
+        decoded, remaining = self._decode_codes(
+            data, position + 1, accumulator, 8 - (start & 7), end - start)
+
+        return self.empty.join(decoded), end - remaining
+
+    def _decode_codes(self, data, position: int, accumulator: int, bit_count: int,
+                      remaining: int) -> tuple:
+        """Decode codes from the accumulator while at least max(table_bits, max_length) bits
+        are remaining.
+
+        The accumulator is refilled eight bytes at a time from the given byte position.
+
+        Args:
+            data (bytes): The packed data.
+            position (int): The index of the next byte to be read into the accumulator.
+            accumulator (int): The bits read from the data so far.
+            bit_count (int): The number of bits in the accumulator that are not decoded yet.
+            remaining (int): The number of bits that are available for decoding.
+
+        Returns:
+            tuple of (list, int): A tuple containing the decoded symbols and the number of
+                                bits that were not decoded.
+
+        Raises:
+            ValueError: If the data contains an invalid code.
+        """
+        table_bits = self.table_bits
+        mask = (1 << table_bits) - 1
+        symbols = self.symbols
+        lengths = self.lengths
+        needed = max(table_bits, self.max_length)
+        decoded = []
+
+        while remaining >= needed:
+            if bit_count < needed:
+                accumulator, bit_count = refill_accumulator(data, position, accumulator, bit_count)
+                position += 8
+            index = (accumulator >> (bit_count - table_bits)) & mask
+            length = lengths[index]
+            if length:
+                decoded.append(symbols[index])
+            else:
+                symbol, length = self._decode_long_code(index, accumulator, bit_count)
+                decoded.append(symbol)
+            bit_count -= length
+            remaining -= length
+
+        return decoded, remaining
+
+    def decode_symbol(self, accumulator: int, bit_count: int) -> tuple:
+        """Decode the next symbol from the accumulator.
+
+        The accumulator must contain at least max(table_bits, max_length) bits that are not
+        decoded yet.
+
+        Args:
+            accumulator (int): The bits read from the data so far.
+            bit_count (int): The number of bits in the accumulator that are not decoded yet.
+
+        Returns:
+            tuple of (str or bytes, int): A tuple containing the decoded symbol and the length
+                                        of its code.
+
+        Raises:
+            ValueError: If the data contains an invalid code.
+        """
+        index = (accumulator >> (bit_count - self.table_bits)) & ((1 << self.table_bits) - 1)
+        if self.lengths[index]:
+            return self.symbols[index], self.lengths[index]
+        return self._decode_long_code(index, accumulator, bit_count)
+
+    def _decode_long_code(self, index: int, accumulator: int, bit_count: int) -> tuple:
+        """Decode a code that is longer than table_bits with its secondary table.
+
+        Args:
+            index (int): The first table_bits bits of the code.
+            accumulator (int): The bits read from the data so far.
+            bit_count (int): The number of bits in the accumulator that are not decoded yet.
+
+        Returns:
+            tuple of (str or bytes, int): A tuple containing the decoded symbol and the length
+                                        of its code.
+
+        Raises:
+            ValueError: If the data contains an invalid code.
+        """
+        subtable = self.subtables.get(index)
+        if subtable is None:
+            raise ValueError("Invalid code in the compressed data.")
+        sub_bits, sub_symbols, sub_lengths = subtable
+        sub_index = (accumulator >> (bit_count - self.table_bits - sub_bits)) & (
+            (1 << sub_bits) - 1)
+        if not sub_lengths[sub_index]:
+            raise ValueError("Invalid code in the compressed data.")
+
+        return sub_symbols[sub_index], sub_lengths[sub_index]
+
+    def _decode_bits(self, bits: str):
+        """Decode a short string of binary data one bit at a time.
+
+        Args:
+            bits (str): The string of binary data to decode.
+
+        Returns:
+            str or bytes: The decoded symbols.
+        """
+        decoded = []
+        sequence = ""
+        for bit in bits:
+            sequence += bit
+            if sequence in self.reverse_codes:
+                decoded.append(self.reverse_codes[sequence])
+                sequence = ""
+
+        return self.empty.join(decoded)
+
+
+def refill_accumulator(data, position: int, accumulator: int, bit_count: int) -> tuple:
+    """Append the next eight bytes of the packed data to the bits left in the accumulator.
+
+    The bits that are already decoded are dropped from the accumulator. The bytes after the end
+    of the data are read as zeros.
+
+    Args:
+        data (bytes): The packed data.
+        position (int): The index of the first byte to read.
+        accumulator (int): The bits read from the data so far.
+        bit_count (int): The number of bits in the accumulator that are not decoded yet.
+
+    Returns:
+        tuple of (int, int): A tuple containing the refilled accumulator and the number of bits
+                            in it that are not decoded yet.
+    """
+    chunk = data[position:position + 8]
+    accumulator = ((accumulator & ((1 << bit_count) - 1)) << 64
+                   | int.from_bytes(chunk, "big") << ((8 - len(chunk)) * 8))
+
+    return accumulator, bit_count + 64
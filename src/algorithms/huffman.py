@@ -1,5 +1,16 @@
 import heapq
-from utilities.utils import add_padding, calculate_min_bits_needed
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from algorithms.canonical_codes import MAX_CODE_LENGTH, CanonicalCodes, create_decode_table
+from algorithms.decode_table import DEFAULT_TABLE_BITS, DecodeTable
+from algorithms import huffman_stream
+from utilities.instrumentation import phase
+from utilities.bitstream import BitWriter, bytes_to_bit_string
+from utilities.utils import DEFAULT_CHUNK_SIZE, calculate_padding_length, calculate_min_bits_needed
+
+BYTE_BITS = 8
+PARALLEL_COUNT_MIN_SIZE = 1 << 22
 
 
 class Node:
@@ -47,51 +58,123 @@ class Node:
         return self.freq < other.freq
 
 
-class HuffmanCoding:
-    """Class for huffman coding algorithm.
+class HuffmanTree:
+    """Class for building a huffman tree and the codes of its characters.
 
-    Implements the Huffman coding algorithm for text compression and decompression.
+    The tree is built from the frequencies of the characters, and the codes are the paths from
+    the root to the leaves. The tree can be written into a header and rebuilt from it.
 
     Attributes:
-        bit_strings (dict): A dictionary mapping unique characters to their Huffman codes.
-        reverse_bit_strings (dict): A dictionary mapping Huffman codes to their unique characters.
+        codes (dict): A dictionary mapping unique characters to tuples of (code, code length).
         root (Node): The root node of the Huffman tree.
         header (str): The header data as a string of binary data.
-        name (str): The name of the algorithm.
-        prev_compress (bool): Indicates whether compression has occurred previously.
-        min_bits (int): The minimum bits needed to represents the length of the header.
         min_bits_char (int): The minimum bits needed to represents the largest unicode point value.
+        binary (bool): Indicates whether the symbols are byte values instead of characters.
     """
 
-    def __init__(self):
-        """Create a new instance of Huffman coding algorithm."""
-        self.bit_strings = {}
-        self.reverse_bit_strings = {}
+    def __init__(self, binary=False):
+        """Create a new HuffmanTree.
+
+        Args:
+            binary (bool, optional): If True, the symbols are the byte values 0-255 instead of
+                                    characters. Defaults to False.
+        """
+        self.codes = {}
         self.root = None
         self.header = ""
-        self.name = "Huffman"
-        self.prev_compress = False
-        self.min_bits = 0
         self.min_bits_char = 0
+        self.binary = binary
+
+    @property
+    def bit_strings(self) -> dict:
+        """A dictionary mapping unique characters to their Huffman codes as strings of binary
+        data. It is derived from the codes."""
+        return {char: format(code, f"0{length}b") for char, (code, length) in self.codes.items()}
 
-    def create_frequency_dict(self, text):
+    @property
+    def reverse_bit_strings(self) -> dict:
+        """A dictionary mapping Huffman codes as strings of binary data to their unique
+        characters. It is derived from the codes."""
+        return {format(code, f"0{length}b"): char for char, (code, length) in self.codes.items()}
+
+    def create_frequency_dict(self, text, frequency=None):
         """Calculate the frequencies of characters in a text and return a dictionary.
 
+        The characters are counted with a Counter, which counts them in C. The characters are
+        in the order of their first appearance in the text, like in a dictionary filled one
+        character at a time.
+
         Args:
-            text (str): The text to calculate for character frequencies.
+            text (str or bytes): The text to calculate for character frequencies.
+            frequency (Counter, optional): The frequencies to be updated, so the frequencies of
+                                        a text read in chunks can be counted one chunk at a time.
+                                        Defaults to None, when a new Counter is created.
 
         Returns:
-            frequency (dict): A dictionary where keys are characters found in the text
-                            and values are the frequencies of those characters.
+            frequency (Counter): A dictionary where keys are characters found in the text
+                                and values are the frequencies of those characters.
         """
-        frequency = {}
-        for char in text:
-            if char not in frequency:
-                frequency[char] = 0
-            frequency[char] += 1
+        if frequency is None:
+            frequency = Counter()
+        frequency.update(text)
 
         return frequency
 
+    def create_frequency_dict_in_parallel(self, text, max_workers=None,
+                                          min_size=PARALLEL_COUNT_MIN_SIZE):
+        """Calculate the frequencies of characters in a text in a pool of processes.
+
+        The text is split into one chunk for each worker, each chunk is counted in its own
+        process and the frequencies of the chunks are added together in the order of the chunks.
+        Sending a chunk to a worker costs about as much as counting it, so the text is counted
+        in this process if it is shorter than min_size or only one worker is available.
+
+        Args:
+            text (str or bytes): The text to calculate for character frequencies.
+            max_workers (int, optional): The maximum number of processes. Defaults to None,
+                                        when the number of processors is used.
+            min_size (int, optional): The smallest text that is counted in the pool.
+                                    Defaults to PARALLEL_COUNT_MIN_SIZE.
+
+        Returns:
+            frequency (Counter): A dictionary where keys are characters found in the text
+                                and values are the frequencies of those characters.
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(text) < max(min_size, 2):
+            return self.create_frequency_dict(text)
+
+        chunk_size = -(-len(text) // workers)
+        chunks = [text[start:start + chunk_size] for start in range(0, len(text), chunk_size)]
+        frequency = Counter()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_frequency in executor.map(Counter, chunks):
+                frequency.update(chunk_frequency)
+
+        return frequency
+
+    def _symbol_to_value(self, symbol) -> int:
+        """Return the integer value of the symbol written into the header.
+
+        Args:
+            symbol (str or int): A character, or a byte value in binary mode.
+
+        Returns:
+            int: The unicode point value of the character, or the byte value.
+        """
+        return symbol if self.binary else ord(symbol)
+
+    def _value_to_symbol(self, value: int):
+        """Return the symbol of the integer value read from the header.
+
+        Args:
+            value (int): The unicode point value of a character, or a byte value in binary mode.
+
+        Returns:
+            str or int: The character, or the byte value.
+        """
+        return value if self.binary else chr(value)
+
     def _find_largest_unicode_value(self, frequency_dict):
         """Find the largest unicode point value from the frequency dictionary of the
         characters in the text.
@@ -103,7 +186,7 @@ class HuffmanCoding:
         Returns:
             largest_value (int): The largest unicode point value from the dictionary.
         """
-        largest_value = max(ord(key) for key in frequency_dict.keys())
+        largest_value = max(self._symbol_to_value(key) for key in frequency_dict.keys())
         return largest_value
 
     def set_min_bits_char(self, min_bits):
@@ -127,15 +210,20 @@ class HuffmanCoding:
         character.
 
         This method calculates the minimum bits needed and rounds the value up to the nearest
-        multiple of 8, and stores the value to the attribute "self.min_bits_char".
+        multiple of 8, and stores the value to the attribute "self.min_bits_char". A symbol
+        takes at least 8 bits, so a text of only NUL characters still has a symbol width. In
+        binary mode the alphabet is the 256 byte values, so the width is always 8 bits.
 
         Args:
             frequency (dict): A dictionary where keys are characters found in the text
                             and values are the frequencies of those characters.
         """
+        if self.binary:
+            self.set_min_bits_char(BYTE_BITS)
+            return
         max_unicode_point = self._find_largest_unicode_value(frequency)
         min_bits_needed = calculate_min_bits_needed(max_unicode_point)
-        min_bits = self._round_min_bits_dividable_by_eight(min_bits_needed)
+        min_bits = self._round_min_bits_dividable_by_eight(max(min_bits_needed, BYTE_BITS))
         self.set_min_bits_char(min_bits)
 
     def create_min_heap(self, frequency_dict) -> list:
@@ -197,7 +285,18 @@ class HuffmanCoding:
         Returns:
             root (Node): The root node of the constructed Huffman tree.
         """
-        frequency = self.create_frequency_dict(text)
+        return self.build_huffman_tree_from_frequency(self.create_frequency_dict(text))
+
+    def build_huffman_tree_from_frequency(self, frequency):
+        """Build a Huffman tree based on the given frequencies of the characters.
+
+        Args:
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+
+        Returns:
+            root (Node): The root node of the constructed Huffman tree.
+        """
         self._calculate_and_set_min_bits_for_char(frequency)
         min_heap = self.create_min_heap(frequency)
         self.merge_nodes(min_heap)
@@ -222,12 +321,15 @@ class HuffmanCoding:
             bit_strings (dict): A dictionary where keys are characters and values are the
                             constructed Huffman codes.
         """
+        bit_strings = {}
         bit_string = ""
-        self._create_bit_string(self.root, bit_string)
+        self._create_bit_string(self.root, bit_string, bit_strings)
+        self.codes = {char: (int(bits, base=2), len(bits))
+                      for char, bits in bit_strings.items()}
 
-        return self.bit_strings
+        return bit_strings
 
-    def _create_bit_string(self, node, bit_string):
+    def _create_bit_string(self, node, bit_string, bit_strings):
         """Recursively creates bit strings for each character.
 
         Creates a bit string for each character in the tree that represents its encoding.
@@ -241,36 +343,42 @@ class HuffmanCoding:
         Args:
             node (Node): The current node in the tree being processed.
             bit_string (str): The constructed bit string so far.
+            bit_strings (dict): The dictionary where the bit strings are stored.
 
         Returns:
-            None. Function traverses the tree recursively and updates the bit_strings and
-            the reverse_bit_strings dictionaries.
+            None. Function traverses the tree recursively and updates the bit_strings
+            dictionary.
         """
         if node.char is not None:
             if bit_string == "":
                 bit_string = "0"
-            self.bit_strings[node.char] = bit_string
-            self.reverse_bit_strings[bit_string] = node.char
+            bit_strings[node.char] = bit_string
             return
 
-        self._create_bit_string(node.left, bit_string + "0")
-        self._create_bit_string(node.right, bit_string + "1")
+        self._create_bit_string(node.left, bit_string + "0", bit_strings)
+        self._create_bit_string(node.right, bit_string + "1", bit_strings)
 
-    def encode_text(self, text):
-        """Encode the given text using huffman codes.
+    def calculate_code_lengths(self):
+        """Calculate the code length of each character from the depth of its leaf node.
 
-        Args:
-            text (str): The plain text to be encoded.
+        The tree is traversed iteratively with a stack, so deep trees do not hit the recursion
+        limit. If the tree contains only one node, the code length defaults to one.
 
         Returns:
-            encoded_text (str): The encoded text where characters are replaced
-                            by their huffman codes.
+            code_lengths (dict): A dictionary where keys are characters and values are
+                                the lengths of their huffman codes.
         """
-        encoded_text = ""
-        for char in text:
-            encoded_text += self.bit_strings[char]
-
-        return encoded_text
+        code_lengths = {}
+        stack = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node.is_leaf_node():
+                code_lengths[node.char] = max(depth, 1)
+            else:
+                stack.append((node.right, depth + 1))
+                stack.append((node.left, depth + 1))
+
+        return code_lengths
 
     def encode_header(self, node):
         """Encode the generated huffman tree so it can be rebuilt and the data decoded.
@@ -289,12 +397,149 @@ class HuffmanCoding:
         """
         if node.is_leaf_node():
             self.header += "1"
-            self.header += format(ord(node.char), f"0{self.min_bits_char}b")
+            self.header += format(self._symbol_to_value(node.char), f"0{self.min_bits_char}b")
         else:
             self.header += "0"
             self.encode_header(node.left)
             self.encode_header(node.right)
 
+    def rebuild_huffman_tree(self, header: str, index: int) -> tuple[Node, int]:
+        """Rebuild the huffman tree based on the header data.
+
+        Args:
+            header (str): A binary string representing the header data used to rebuild the tree.
+            index (int): Pointing the current position of the the header data.
+
+        Returns:
+            tuple of (Node, int): A tuple containing the root of the tree and the next position
+                                to process.
+        """
+        if index >= len(header):
+            return None, index
+
+        bit = header[index]
+        index += 1
+
+        if bit == "1":
+            char_bits = header[index:index + self.min_bits_char]
+            char = self._value_to_symbol(int(char_bits, base=2))
+            index += self.min_bits_char
+            node = Node(char)
+        else:
+            left_node, index = self.rebuild_huffman_tree(header, index)
+            right_node, index = self.rebuild_huffman_tree(header, index)
+            node = Node()
+            node.left = left_node
+            node.right = right_node
+
+        return node, index
+
+    def _round_min_bits_dividable_by_eight(self, value):
+        """Round the minimum bits needed value to be dividable by 8.
+
+        If the value is not dividable by 8, it is rounded up to the nearest multiple of 8.
+
+        Args:
+            value (int): The integer value to be round.
+
+        Returns:
+            value (int): The rounded integer value of minimum bits.
+        """
+        if value % 8 != 0:
+            value += (8 - value % 8)
+        return value
+
+
+class HuffmanCoding(HuffmanTree):
+    """Class for huffman coding algorithm.
+
+    Implements the Huffman coding algorithm for text compression and decompression. The codes
+    are created from the huffman tree, or as canonical codes by a CanonicalCodes instance.
+
+    Attributes:
+        prev_compress (bool): Indicates whether compression has occurred previously.
+        min_bits (int): The minimum bits needed to represents the length of the header.
+        canonical_codes (CanonicalCodes): Creates the canonical codes and their header, or None
+                                        if the codes are the paths of the tree.
+    """
+
+    def __init__(self, canonical=False, max_code_length=None, binary=False, table=None):
+        """Create a new instance of Huffman coding algorithm.
+
+        Args:
+            canonical (bool, optional): If True, canonical huffman codes are used and the header
+                                        stores only the characters and their code lengths.
+                                        Defaults to False.
+            max_code_length (int, optional): The maximum length of a huffman code in bits.
+                                            Limiting the code lengths requires canonical codes,
+                                            so they are always used when this is given.
+                                            Defaults to None.
+            binary (bool, optional): If True, the data is compressed and decompressed as bytes,
+                                    and the symbols are the byte values 0-255 instead of
+                                    characters. Defaults to False.
+            table (HuffmanTable, optional): A trained table of code lengths. If every character
+                                            of a text has a code in the table, the text is
+                                            encoded with the codes of the table and the header
+                                            stores only the ID of the table. Otherwise the codes
+                                            are created from the text as canonical codes.
+                                            Defaults to None.
+
+        Raises:
+            ValueError: If the table is not trained for the same mode as this instance, or the
+                        maximum code length is not between 1 and MAX_CODE_LENGTH.
+        """
+        if table is not None and table.binary != binary:
+            raise ValueError("The table and the algorithm must both use binary mode or text.")
+        if max_code_length is not None and not 1 <= max_code_length <= MAX_CODE_LENGTH:
+            raise ValueError(f"The maximum code length must be between 1 and {MAX_CODE_LENGTH}.")
+
+        super().__init__(binary)
+        self.prev_compress = False
+        self.min_bits = 0
+        self.canonical_codes = None
+        if canonical or max_code_length is not None or table is not None:
+            self.canonical_codes = CanonicalCodes(max_code_length, binary, table)
+
+    @property
+    def name(self) -> str:
+        """The name of the algorithm, which tells how the codes are created."""
+        canonical_codes = self.canonical_codes
+        if canonical_codes is None:
+            name = "Huffman"
+        elif canonical_codes.table is not None:
+            name = f"Huffman-table-{canonical_codes.table.table_id}"
+        elif canonical_codes.max_code_length is not None:
+            name = f"Huffman-L{canonical_codes.max_code_length}"
+        else:
+            name = "Huffman-canonical"
+
+        return name + "-bytes" if self.binary else name
+
+    @property
+    def table_used(self) -> bool:
+        """Indicates whether the codes of the trained table were used for the previous
+        compression. It is derived from the header."""
+        return self.canonical_codes is not None and \
+            self.canonical_codes.table is not None and self.header[:1] == "1"
+
+    def encode_text(self, text):
+        """Encode the given text using huffman codes.
+
+        The codes are packed with a BitWriter like in the method create_complete_data, and only
+        the packed bits are formatted to a string.
+
+        Args:
+            text (str): The plain text to be encoded.
+
+        Returns:
+            encoded_text (str): The encoded text where characters are replaced
+                            by their huffman codes.
+        """
+        writer = BitWriter()
+        writer.write_symbols(text, self.codes)
+
+        return bytes_to_bit_string(writer.getvalue())[:len(writer)]
+
     def set_min_bits_needed(self, bits_needed):
         """Set min_bits to the bits_needed.
 
@@ -313,20 +558,23 @@ class HuffmanCoding:
         """
         return self.min_bits
 
-    def _round_min_bits_dividable_by_eight(self, value):
-        """Round the minimum bits needed value to be dividable by 8.
+    def get_parameters(self) -> dict:
+        """Get the parameters needed to decompress the data compressed with this instance.
 
-        If the value is not dividable by 8, it is rounded up to the nearest multiple of 8.
+        Returns:
+            parameters (dict): A dictionary containing the minimum bits needed to represent the
+                            length of the header and the largest unicode point value.
+        """
+        return {"min_bits": self.min_bits, "min_bits_char": self.min_bits_char}
 
-        Args:
-            value (int): The integer value to be round.
+    def set_parameters(self, parameters: dict):
+        """Set the parameters needed to decompress the data.
 
-        Returns:
-            value (int): The rounded integer value of minimum bits.
+        Args:
+            parameters (dict): A dictionary returned by the method get_parameters.
         """
-        if value % 8 != 0:
-            value += (8 - value % 8)
-        return value
+        self.set_min_bits_needed(parameters["min_bits"])
+        self.set_min_bits_char(parameters["min_bits_char"])
 
     def _calculate_and_set_min_bits(self):
         """Calculate and set the minimum bits needed to represent the lenght of the header.
@@ -339,11 +587,51 @@ class HuffmanCoding:
         min_bits = self._round_min_bits_dividable_by_eight(min_bits_needed)
         self.set_min_bits_needed(min_bits)
 
-    def create_complete_data(self, text):
-        """Create a complete data with a string representation of binary data.
+    def _calculate_encoded_text_length(self, frequency):
+        """Calculate the length of the encoded text in bits from the character frequencies.
+
+        Args:
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+
+        Returns:
+            int: The sum of the code lengths of all the characters in the text.
+        """
+        return sum(self.codes[char][1] * freq for char, freq in frequency.items())
+
+    def create_complete_data(self, text, frequency=None) -> bytes:
+        """Create the complete data packed into bytes.
+
+        The header is written with the method write_header, and the huffman codes are packed
+        directly into bytes after it, so the encoded text is never built as a string of binary
+        data.
+
+        Args:
+            text (str): The text to encode and create a header for.
+            frequency (dict, optional): The character frequencies of the text. Defaults to
+                                        None, when they are counted from the text.
+
+        Returns:
+            complete data (bytes): The complete data packed into bytes.
+        """
+        if frequency is None:
+            frequency = self.create_frequency_dict(text)
+        with phase("write_header") as record:
+            writer = self.write_header(frequency)
+            record.bytes_out = len(writer) // 8
+        with phase("encode_text", len(text)) as record:
+            writer.write_symbols(text, self.codes)
+            complete_data = writer.getvalue()
+            record.bytes_out = len(complete_data)
+
+        return complete_data
+
+    def write_header(self, frequency) -> BitWriter:
+        """Write everything that comes before the compressed data into a new BitWriter.
 
         First this method calculates the minimum number of bits needed to represent the length
-        of the header, and then creates the complete data.
+        of the header. The length of the encoded text is calculated from the character
+        frequencies, so the padding can be written before the compressed data.
 
         The complete data is formatted with the following logic:
             - Length of the header (minimum bits).
@@ -353,132 +641,147 @@ class HuffmanCoding:
             - Compressed data.
 
         Args:
-            text (str): The text to encode and create a header for.
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
 
         Returns:
-            complete data (str): The complete data represented as a string of binary data.
+            writer (BitWriter): A BitWriter containing all the data before the compressed data.
         """
         self.header = ""
-        encoded_text = self.encode_text(text)
-        self.encode_header(self.root)
-        len_encoded_text = len(encoded_text)
+        if self.canonical_codes is None:
+            self.encode_header(self.root)
+        else:
+            self.header = self.canonical_codes.encode_header(self.codes, frequency)
 
         length_header = len(self.header)
         self._calculate_and_set_min_bits()
-        len_header_bin = format(length_header, f"0{self.min_bits}b")
-
-        padding_len_header, padded_header = add_padding(
-            self.header, length_header)
-        padding_len_header_bin = format(padding_len_header, "08b")
-        padding_len_data, padded_data = add_padding(
-            encoded_text, len_encoded_text)
-        padding_len_data_bin = format(padding_len_data, "08b")
+        padding_len_header = calculate_padding_length(length_header)
+        padding_len_data = calculate_padding_length(
+            self._calculate_encoded_text_length(frequency))
 
-        data_array = []
-        data_array.append(len_header_bin)
-        data_array.append(padding_len_header_bin)
-        data_array.append(padding_len_data_bin)
+        writer = BitWriter()
+        writer.write(length_header, self.min_bits)
+        writer.write(padding_len_header, 8)
+        writer.write(padding_len_data, 8)
+        writer.write(int(self.header, base=2), padding_len_header + length_header)
+        writer.write(0, padding_len_data)
 
-        data_array.append(padded_header)
-        data_array.append(padded_data)
-
-        complete_data = "".join(data for data in data_array)
-
-        return complete_data
+        return writer
 
     def compress(self, text):
         """Compress the text using Huffman-coding algorithm.
 
-        This method builds the huffman tree, creates a dictionary mapping the huffman codes and
-        then generates a complete data as a string of binary data representing that huffman tree.
+        This method builds the huffman tree, creates a dictionary mapping the huffman codes with
+        the method create_codes and then generates a complete data packed into bytes. If the
+        trained table can be used, the codes of the table are used and no tree is built.
+        Each step is measured as a phase when the instrumentation is enabled.
 
         Args:
             text (str): The text to be compressed.
 
         Returns:
-            complete_data (str): The complete data represented as a string of binary data.
+            complete_data (bytes): The complete data packed into bytes. An empty text is
+                                compressed into empty data.
         """
-
-        self.build_huffman_tree(text)
-        self.create_bit_strings_dict()
-        complete_data = self.create_complete_data(text)
         self.prev_compress = True
-        return complete_data
+        if not text:
+            self.codes = {}
+            return b""
 
-    def parse_int_from_binary(self, binary_string):
-        """Parse integer value from the given binary string.
+        with phase("count_frequencies", len(text)) as record:
+            frequency = self.create_frequency_dict(text)
+            record.bytes_out = len(frequency)
+        if not self.use_table(frequency):
+            with phase("build_tree", len(frequency)):
+                self.build_huffman_tree_from_frequency(frequency)
+            with phase("create_codes", len(frequency)):
+                self.create_codes(frequency)
+        return self.create_complete_data(text, frequency)
 
-        Args:
-            binary_string (str): The binary data represented as a string.
+    def compress_stream(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Compress the text from the reader into the writer one chunk at a time.
 
-        Returns:
-            value (int): The integer value of the given binary string.
+        The compression is done by the function compress_stream of the module huffman_stream.
+
+        Args:
+            reader (file object): A seekable text file object to read the text from.
+            writer (file object): A binary file object to write the compressed data to.
+            chunk_size (int, optional): The number of characters read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
         """
-        value = int(binary_string, base=2)
-        return value
+        huffman_stream.compress_stream(self, reader, writer, chunk_size)
 
-    def parse_data(self, complete_data: str) -> tuple[str, str]:
-        """Parse header data representing the huffman tree and the compressed data
-        from the given complete data.
+    def use_table(self, frequency) -> bool:
+        """Use the codes of the trained table if every character of the text has a code in it.
 
         Args:
-            complete_data (str): The binary data represented as a string.
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
 
         Returns:
-            tuple of (str, str): A tuple containing the header data and the compressed data.
+            bool: True if the codes of the table are used, False otherwise.
         """
+        if self.canonical_codes is None:
+            return False
+        codes = self.canonical_codes.get_table_codes(frequency)
+        if codes is not None:
+            self.codes = codes
 
-        len_of_header = self.parse_int_from_binary(
-            complete_data[:self.min_bits])
-        padding_len_of_header = self.parse_int_from_binary(
-            complete_data[self.min_bits+1:self.min_bits+8])
-        padding_len_of_compressed_data = self.parse_int_from_binary(
-            complete_data[self.min_bits+8:self.min_bits+16])
+        return codes is not None
 
-        header_start_index = self.min_bits + 16 + padding_len_of_header
-        header_end_index = self.min_bits + 16 + len_of_header + padding_len_of_header
-        header_data = complete_data[header_start_index:header_end_index]
+    def create_codes(self, frequency):
+        """Create the huffman codes from the built huffman tree.
 
-        compressed_data_starting_index = header_end_index + padding_len_of_compressed_data
-        compressed_data = complete_data[compressed_data_starting_index:]
+        If canonical codes are used, the codes are created from the code lengths of the
+        characters by the CanonicalCodes instance instead of the paths of the tree.
+
+        Args:
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+        """
+        if self.canonical_codes is None:
+            self.create_bit_strings_dict()
+        else:
+            self.codes = self.canonical_codes.create_codes(self.calculate_code_lengths(), frequency)
 
-        return header_data, compressed_data
+    def parse_data(self, complete_data: bytes) -> tuple[str, int]:
+        """Parse header data representing the huffman tree and the starting position of the
+        compressed data from the given complete data.
 
-    def rebuild_huffman_tree(self, header: str, index: int) -> tuple[Node, int]:
-        """Rebuild the huffman tree based on the header data.
+        Only the bytes of the header are formatted to a string of binary data. The compressed
+        data is left packed, and its position is returned as an index of a bit.
 
         Args:
-            header (str): A binary string representing the header data used to rebuild the tree.
-            index (int): Pointing the current position of the the header data.
+            complete_data (bytes): The complete data packed into bytes.
 
         Returns:
-            tuple of (Node, int): A tuple containing the root of the tree and the next position
-                                to process.
+            tuple of (str, int): A tuple containing the header data and the index of the first
+                                bit of the compressed data.
         """
-        if index >= len(header):
-            return None, index
+        len_bytes = self.min_bits // 8
+        len_of_header = int.from_bytes(complete_data[:len_bytes], "big")
+        padding_len_of_header = complete_data[len_bytes]
+        padding_len_of_compressed_data = complete_data[len_bytes + 1]
 
-        bit = header[index]
-        index += 1
+        header_start_index = len_bytes + 2
+        header_end_index = header_start_index + \
+            (padding_len_of_header + len_of_header) // 8
+        header_bits = bytes_to_bit_string(
+            complete_data[header_start_index:header_end_index])
+        header_data = header_bits[padding_len_of_header:]
 
-        if bit == "1":
-            char_bits = header[index:index + self.min_bits_char]
-            char = chr(int(char_bits, base=2))
-            index += self.min_bits_char
-            node = Node(char)
-        else:
-            left_node, index = self.rebuild_huffman_tree(header, index)
-            right_node, index = self.rebuild_huffman_tree(header, index)
-            node = Node()
-            node.left = left_node
-            node.right = right_node
+        compressed_data_starting_index = header_end_index * \
+            8 + padding_len_of_compressed_data
 
-        return node, index
+        return header_data, compressed_data_starting_index
 
     def decode_text(self, compressed_data: str, reverse_bit_strings: dict) -> str:
         """Decode the text from the compressed data by swapping the huffman codes with their
         corresponding characters.
 
+        The compressed data is packed into bytes and decoded with a decode table, like in the
+        method decompress.
+
         Args:
             compressed_data (str): The compressed data as a string representing the binary data.
             reverse_bit_strings (dictionary): A dictionary where keys are huffman codes and
@@ -487,37 +790,84 @@ class HuffmanCoding:
         Returns:
             decoded_text (str): The decoded text in plain text.
         """
-        decoded_text = ""
-        sequence = ""
+        codes = {char: (int(bits, base=2), len(bits))
+                 for bits, char in reverse_bit_strings.items()}
+        padding_length = calculate_padding_length(len(compressed_data))
+        data = int(compressed_data or "0", base=2).to_bytes(
+            (padding_length + len(compressed_data)) // 8, "big")
 
-        for bit in compressed_data:
-            sequence += bit
+        return create_decode_table(codes, DEFAULT_TABLE_BITS, self.binary).decode(
+            data, padding_length, len(data) * 8)
 
-            if sequence in reverse_bit_strings:
-                decoded_text += reverse_bit_strings[sequence]
-                sequence = ""
-
-        return decoded_text
-
-    def decompress(self, complete_data: str) -> str:
+    def decompress(self, complete_data: bytes) -> str:
         """Decompress the data from the compressed file.
 
         This function parses the data given from the compressed file, rebuilds the huffman tree
         and creates the dictionary mapping the  huffman codes and their characters, and then
-        decodes the text using the rebuilt huffman tree. Finally, this method sets the attribute
-        "self.prev_compress" to False.
+        decodes the text with a decode table built from those codes. If the code lengths are
+        limited, the decode table is indexed with up to the longest code length, so short
+        enough codes are resolved with a single lookup. If canonical codes are used,
+        the codes are reconstructed from the code lengths in the header without building the
+        tree. The decode table reads several bits at a time directly from the packed data.
+        Finally, this method sets the attribute "self.prev_compress" to False.
 
         Args:
-            complete_data (str): The complete data from the compressed file.
+            complete_data (bytes or memoryview): The complete data from the compressed file.
 
         Returns:
-            decoded_text (str): The decoded text in plain text.
+            decoded_text (str or bytes): The decoded text in plain text, or the decoded bytes in
+                                        binary mode.
         """
-        header_data, compressed_data = self.parse_data(complete_data)
-        root, _ = self.rebuild_huffman_tree(header_data, 0)
-        self.root = root
-        self.create_bit_strings_dict()
-        decoded_text = self.decode_text(
-            compressed_data, self.reverse_bit_strings)
         self.prev_compress = False
+        if not complete_data:
+            return b"" if self.binary else ""
+
+        with phase("parse_header", len(complete_data)) as record:
+            header_data, compressed_data_starting_index = self.parse_data(complete_data)
+            record.bytes_out = len(header_data)
+        with phase("create_decode_table", len(header_data)):
+            decode_table = self.create_decode_table(header_data)
+        with phase("decode", len(complete_data) - compressed_data_starting_index // 8) as record:
+            decoded_text = decode_table.decode(
+                complete_data, compressed_data_starting_index, len(complete_data) * 8)
+            record.bytes_out = len(decoded_text)
         return decoded_text
+
+    def decompress_stream(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Decompress the data from the reader into the writer one chunk at a time.
+
+        The decompression is done by the function decompress_stream of the module huffman_stream.
+
+        Args:
+            reader (file object): A binary file object to read the compressed data from.
+            writer (file object): A text file object to write the decoded text to.
+            chunk_size (int, optional): The number of bytes read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+        """
+        huffman_stream.decompress_stream(self, reader, writer, chunk_size)
+
+    def create_decode_table(self, header_data: str) -> DecodeTable:
+        """Create the huffman codes from the header data and a decode table for them.
+
+        In binary mode the byte values are given to the decode table as bytes objects, so the
+        decoded data is bytes.
+
+        If canonical codes are used, the codes and the decode table are created by the
+        CanonicalCodes instance, which reuses the decode table of the trained table.
+
+        Args:
+            header_data (str): The header data as a string of binary data.
+
+        Returns:
+            DecodeTable: The decode table for the huffman codes.
+
+        Raises:
+            ValueError: If the header refers to a different table than the trained table.
+        """
+        if self.canonical_codes is None:
+            self.root, _ = self.rebuild_huffman_tree(header_data, 0)
+            self.create_bit_strings_dict()
+            return create_decode_table(self.codes, DEFAULT_TABLE_BITS, self.binary)
+
+        self.codes, decode_table = self.canonical_codes.create_decode_table(header_data)
+        return decode_table
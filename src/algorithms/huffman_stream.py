@@ -0,0 +1,71 @@
+from utilities.utils import DEFAULT_CHUNK_SIZE, read_chunks
+
+
+def compress_stream(huffman, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Compress the text from the reader into the writer one chunk at a time.
+
+    The text is read twice. The first pass counts the character frequencies and the huffman
+    codes are created from them, and the second pass encodes the chunks and writes the
+    complete bytes as soon as they are available. Only one chunk of the text is kept in
+    memory, and the written data is the same as the data returned by the method
+    HuffmanCoding.compress, so an empty text is written as empty data.
+
+    Args:
+        huffman (HuffmanCoding): The algorithm used for the compression.
+        reader (file object): A seekable text file object to read the text from.
+        writer (file object): A binary file object to write the compressed data to.
+        chunk_size (int, optional): The number of characters read at a time.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+    """
+    start = reader.tell()
+    frequency = None
+    for chunk in read_chunks(reader, chunk_size):
+        frequency = huffman.create_frequency_dict(chunk, frequency)
+    reader.seek(start)
+    huffman.prev_compress = True
+    if frequency is None:
+        return
+
+    if not huffman.use_table(frequency):
+        huffman.build_huffman_tree_from_frequency(frequency)
+        huffman.create_codes(frequency)
+    bit_writer = huffman.write_header(frequency)
+    for chunk in read_chunks(reader, chunk_size):
+        bit_writer.write_symbols(chunk, huffman.codes)
+        writer.write(bit_writer.take_bytes())
+    writer.write(bit_writer.getvalue())
+
+
+def decompress_stream(huffman, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Decompress the data from the reader into the writer one chunk at a time.
+
+    First the header is read and parsed, and then the compressed data is read in chunks.
+    Each chunk is appended to the bits left over from the previous chunk, and all the codes
+    that are known to be complete are decoded and written. The last bits are decoded after
+    the whole data is read.
+
+    Args:
+        huffman (HuffmanCoding): The algorithm used for the decompression.
+        reader (file object): A binary file object to read the compressed data from.
+        writer (file object): A text file object to write the decoded text to.
+        chunk_size (int, optional): The number of bytes read at a time.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+    """
+    huffman.prev_compress = False
+    len_bytes = huffman.min_bits // 8
+    header_prefix = reader.read(len_bytes + 2)
+    if not header_prefix:
+        return
+    len_of_header = int.from_bytes(header_prefix[:len_bytes], "big")
+    padding_len_of_header = header_prefix[len_bytes]
+    header_prefix += reader.read((padding_len_of_header + len_of_header) // 8)
+    header_data, position = huffman.parse_data(header_prefix)
+    decode_table = huffman.create_decode_table(header_data)
+
+    data = header_prefix
+    for chunk in read_chunks(reader, chunk_size):
+        data = data[position >> 3:] + chunk
+        position &= 7
+        decoded_text, position = decode_table.decode_partial(data, position, len(data) * 8)
+        writer.write(decoded_text)
+    writer.write(decode_table.decode(data, position, len(data) * 8))
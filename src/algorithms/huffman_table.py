@@ -0,0 +1,172 @@
+import json
+from collections import Counter
+from algorithms.canonical_codes import create_canonical_codes, create_decode_table
+from algorithms.huffman import HuffmanCoding
+
+TABLE_ID_BITS = 16
+
+
+class HuffmanTable:
+    """Class for a trained table of canonical huffman code lengths.
+
+    The table is trained once on a sample corpus and saved to a file. Texts with similar
+    statistics can then be compressed with the codes of the table, so no tree is built and the
+    header stores only the ID of the table.
+
+    The header of a text compressed with the codes of the table is "1" followed by the ID of
+    the table (TABLE_ID_BITS bits).
+
+    Attributes:
+        table_id (int): The ID of the table stored in the header of the compressed data.
+        code_lengths (dict): A dictionary where keys are characters, or byte values in binary
+                            mode, and values are the lengths of their huffman codes.
+        binary (bool): Indicates whether the table is trained for bytes instead of text.
+        decode_tables (dict): The decode tables of the codes of the table, keyed by the number
+                            of bits used to index the primary table. A decode table is
+                            created when it is needed for the first time.
+    """
+
+    def __init__(self, table_id: int, code_lengths: dict, binary=False):
+        """Create a new HuffmanTable.
+
+        Args:
+            table_id (int): The ID of the table.
+            code_lengths (dict): A dictionary where keys are characters, or byte values in
+                                binary mode, and values are the lengths of their huffman codes.
+            binary (bool, optional): If True, the table is trained for bytes. Defaults to False.
+
+        Raises:
+            ValueError: If the ID does not fit into TABLE_ID_BITS bits.
+        """
+        if not 0 <= table_id < 1 << TABLE_ID_BITS:
+            raise ValueError(f"The table ID must fit into {TABLE_ID_BITS} bits.")
+
+        self.table_id = table_id
+        self.code_lengths = code_lengths
+        self.binary = binary
+        self.decode_tables = {}
+
+    def covers(self, frequency: dict) -> bool:
+        """Check if every character of a text has a code in the table.
+
+        Args:
+            frequency (dict): A dictionary where keys are characters found in the text
+                            and values are the frequencies of those characters.
+
+        Returns:
+            bool: True if the codes of the table can be used for the text, False otherwise.
+        """
+        return frequency.keys() <= self.code_lengths.keys()
+
+    def get_codes(self) -> dict:
+        """Return the canonical codes of the table.
+
+        Returns:
+            codes (dict): A dictionary where keys are characters, or byte values in binary
+                        mode, and values are tuples of (code, code length).
+        """
+        return create_canonical_codes(self.code_lengths)
+
+    def get_decode_table(self, table_bits: int):
+        """Return the decode table of the codes of the table.
+
+        The decode table is created only once for each number of bits and reused.
+
+        Args:
+            table_bits (int): The number of bits used to index the primary table.
+
+        Returns:
+            DecodeTable: The decode table for the codes of the table.
+        """
+        if table_bits not in self.decode_tables:
+            self.decode_tables[table_bits] = create_decode_table(
+                self.get_codes(), table_bits, self.binary)
+
+        return self.decode_tables[table_bits]
+
+    def encode_header(self) -> str:
+        """Encode the header of a text compressed with the codes of the table.
+
+        Returns:
+            header (str): "1" followed by the ID of the table as a string of binary data.
+        """
+        return "1" + format(self.table_id, f"0{TABLE_ID_BITS}b")
+
+    def check_header(self, header: str):
+        """Check that the header refers to this table.
+
+        Args:
+            header (str): The header written by the method encode_header.
+
+        Raises:
+            ValueError: If the header refers to a different table.
+        """
+        table_id = int(header[1:1 + TABLE_ID_BITS], base=2)
+        if table_id != self.table_id:
+            raise ValueError(
+                f"The data is compressed with the table {table_id}, "
+                f"not with the table {self.table_id}.")
+
+    def save(self, path: str):
+        """Save the table to a JSON file.
+
+        The symbols are stored as their unicode point values or byte values.
+
+        Args:
+            path (str): The path to the file.
+        """
+        code_lengths = [[symbol if self.binary else ord(symbol), length]
+                        for symbol, length in self.code_lengths.items()]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"table_id": self.table_id, "binary": self.binary,
+                       "code_lengths": code_lengths}, file)
+
+
+def load_huffman_table(path: str) -> HuffmanTable:
+    """Load a table saved with the method HuffmanTable.save.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        HuffmanTable: The loaded table.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    binary = data["binary"]
+    code_lengths = {value if binary else chr(value): length
+                    for value, length in data["code_lengths"]}
+
+    return HuffmanTable(data["table_id"], code_lengths, binary)
+
+
+def train_huffman_table(texts, table_id: int, max_code_length=None,
+                        binary=False) -> HuffmanTable:
+    """Train a table of code lengths on the given sample texts.
+
+    The frequencies of all the texts are counted together. Every character in the range of
+    0-255 unicode points, or every byte value in binary mode, gets a frequency of at least one,
+    so the table can be used for texts containing characters that are rare in the samples.
+
+    Args:
+        texts (iterable of str or bytes): The sample texts.
+        table_id (int): The ID of the table.
+        max_code_length (int, optional): The maximum length of a huffman code in bits.
+                                        Defaults to None.
+        binary (bool, optional): If True, the table is trained for bytes. Defaults to False.
+
+    Returns:
+        HuffmanTable: The trained table.
+    """
+    huffman = HuffmanCoding(max_code_length=max_code_length, canonical=True, binary=binary)
+    frequency = Counter()
+    for text in texts:
+        huffman.create_frequency_dict(text, frequency)
+    frequency.update(range(256) if binary else map(chr, range(256)))
+
+    huffman.build_huffman_tree_from_frequency(frequency)
+    huffman.create_codes(frequency)
+    code_lengths = {symbol: length for symbol, (_, length) in huffman.codes.items()}
+
+    return HuffmanTable(table_id, code_lengths, binary)
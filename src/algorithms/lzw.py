@@ -1,4 +1,14 @@
-from utilities.utils import add_padding, calculate_min_bits_needed
+from array import array
+from algorithms.lzw_codes import CodeSpace
+from algorithms.lzw_integer import decode_text_with_arrays, encode_stream, encode_with_integer_keys
+from utilities.bitstream import BitWriter, unpack_fixed_width
+from utilities.instrumentation import phase
+from utilities.utils import (DEFAULT_CHUNK_SIZE, calculate_padding_length,
+                             calculate_min_bits_needed, find_extra_supported_symbols,
+                             read_chunks)
+
+
+ENGINES = ("string", "integer")
 
 
 class LZW():
@@ -9,26 +19,63 @@ class LZW():
     Attributes: 
         table (dict): The dictionary for characters and their corresponding code values.
         name (str): The name of the algorithm.
-        extra_supported_symbols (list): The additional symbols to extend the dictionary.
         min_bits (int): The minimum bits needed to represents the biggest value.
         prev_compress (bool): Indicates whether compression has occurred previously.
+        engine (str): The implementation used for encoding and decoding, one of ENGINES.
+        next_code (int): The next free code of the dictionary after encoding.
+        binary (bool): Indicates whether the data is compressed as bytes instead of text.
+        code_space (CodeSpace): The layout of the codes, which holds the maximum width of a
+                                code, the extra supported symbols and the preset.
     """
 
-    def __init__(self) -> None:
-        """Create a new instance of LZW-algorithm. """
+    def __init__(self, max_bits=None, engine="string", binary=False, preset=None) -> None:
+        """Create a new instance of LZW-algorithm.
+
+        Args:
+            max_bits (int, optional): The maximum width of a code in bits. If given, the
+                                    dictionary is bounded to 2^max_bits codes and cleared when
+                                    it gets full, and the width of the codes grows as the
+                                    dictionary grows. Otherwise the dictionary grows without
+                                    limit and all codes have the same width. Defaults to None.
+            engine (str, optional): The implementation used for encoding and decoding. "string"
+                                    keys the dictionary with the sequences themselves, and
+                                    "integer" keys it with pairs of a prefix code and a
+                                    character and decodes into a preallocated array. Both
+                                    produce the same codes. Defaults to "string".
+            binary (bool, optional): If True, the data is compressed and decompressed as bytes.
+                                    The dictionary is initialized with the 256 byte values, so
+                                    no extra supported symbols are needed. Defaults to False.
+            preset (LZWPreset, optional): Trained phrases that are added to the dictionary
+                                        after the initial characters, both when encoding and
+                                        decoding and again after every clear code. Defaults to
+                                        None.
+
+        Raises:
+            ValueError: If the engine is unknown, or the preset is not trained for the same mode
+                        as this instance.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine}, expected one of {ENGINES}.")
+        if preset is not None and preset.binary != binary:
+            raise ValueError("The preset and the algorithm must both use binary mode or text.")
 
         self.table = None
-        self.name = "LZW"
-        self.extra_supported_symbols = []
+        self.name = _create_name(max_bits, engine, preset is not None, binary)
         self.min_bits = 0
         self.prev_compress = False
+        self.engine = engine
+        self.next_code = 0
+        self.binary = binary
+        self.code_space = CodeSpace(max_bits, preset)
 
     def _init_table(self, compress=True):
         """Initialize the dictionary for mapping characters and their corresponding code values.
 
         This method initializes the mapping table for characters and codes within the range of
         0-255. Additionally all symbols in the extra_supported_symbols list is added to the table
-        with the codes starting from 256.
+        with the codes starting from 256. In binary mode the symbols are bytes objects instead
+        of characters. The phrases of the preset follow with the codes starting from
+        CodeSpace.get_preset_code.
 
         Method initializes the table based on the boolean value given:
         - If the value is true, table is initialized for compression, and then the keys are 
@@ -43,24 +90,25 @@ class LZW():
                                     If True, initialize table for compression, otherwise
                                     initialize for decompression. Defaults to True.
         """
-        table = {}
-        for i in range(0, 256):
-            char = ""
-            char += chr(i)
-            if compress:
-                table[char] = i
-            else:
-                table[i] = char
+        self.table = self.code_space.create_table(self.binary, compress)
 
-        code = 256
-        for extra_symbol in self.extra_supported_symbols:
-            if compress:
-                table[extra_symbol] = code
-            else:
-                table[code] = extra_symbol
-            code += 1
+    def reset_table(self, compress=True):
+        """Reset the dictionary to the initial characters, the extra supported symbols and the
+        phrases of the preset.
 
-        self.table = table
+        The table is initialized like before a compression or a decompression, so the method
+        encode can be called directly after this method.
+
+        Args:
+            compress (bool, optional): If True, reset the table for compression, otherwise for
+                                    decompression. Defaults to True.
+        """
+        self._init_table(compress)
+
+    @property
+    def extra_supported_symbols(self) -> list:
+        """The additional symbols to extend the dictionary, stored in the code space."""
+        return self.code_space.extra_supported_symbols
 
     def set_extra_supported_symbols(self, supported_symbols):
         """Set extra supported symbols to the given list.
@@ -69,7 +117,7 @@ class LZW():
             supported_symbols (list): A list containing all the symbols outside the range of
                                     0-255 unicode points that are found in the text.
         """
-        self.extra_supported_symbols = supported_symbols
+        self.code_space.extra_supported_symbols = supported_symbols
 
     def get_table(self) -> dict:
         """Return the initialized dictionary for characters and their corresponding code values.
@@ -89,75 +137,97 @@ class LZW():
         The list containing encoded text is constructed at the same time, adding the code value for
         character/sequence to it.
 
+        If the dictionary is bounded and it gets full, the clear code is added to the encoded text
+        and the dictionary is initialized again. The new sequences are added with the method
+        CodeDictionary.emit, which is shared with the integer engine.
+
+        The characters are taken from the text stream as slices, so the same loop encodes both
+        text and bytes.
+
         Args:
-            text_stream (str): The plain text to be encoded.
+            text_stream (str or bytes): The plain text to be encoded.
 
         Returns:
             encoded_text (list): The encoded text as a list, where characters/sequences are 
-                                replaced with their code values.
+                                replaced with their code values. The list is empty if the text
+                                is empty.
         """
-        first_char = text_stream[0]
-        index = 0
-        code = 256 + len(self.extra_supported_symbols)
+        table = self.table
+        dictionary = self.code_space.create_dictionary(table)
+        self.next_code = dictionary.next_code
+        if not text_stream:
+            return []
+        first_char = text_stream[:1]
         encoded_text = []
 
-        while index < len(text_stream):
-            if index != len(text_stream)-1:
-                next_char = text_stream[index+1]
-            else:
-                next_char = ""
+        for index in range(len(text_stream)):
+            next_char = text_stream[index+1:index+2]
 
-            if first_char + next_char in self.table:
+            if first_char + next_char in table:
                 first_char += next_char
             else:
-                encoded_text.append(self.table[first_char])
-                self.table[first_char + next_char] = code
-                code += 1
+                dictionary.emit(table[first_char], first_char + next_char, encoded_text)
                 first_char = next_char
-            index += 1
-        encoded_text.append(self.table[first_char])
+        encoded_text.append(table[first_char])
+        self.next_code = dictionary.next_code
 
         return encoded_text
 
-    def create_header(self, code_values: list) -> str:
-        """Create a complete header data with a string representation of binary data.
+    def create_header(self, code_values: list) -> bytes:
+        """Create a complete data packed into bytes.
 
-        This method calculates the minimum number of bits needed to represent the largest value in
-        the table. It then converts each code value in the "code_values" list to a binary
-        representation with the minimum required length and concatenates them into a single string.
+        If the dictionary is bounded, the codes are written with variable widths by the method
+        write_variable_width_codes.
 
-        The add_padding method is called to add padding to the binary string. That method returns
-        tuple containing the length of the padding, the padded binary string. These are then added
-        to the data_array list. Finally, the contents of the data_array list are concatenated into
-        a single string to form the complete data.
+        Otherwise this method calculates the minimum number of bits needed to represent the
+        largest code given by the encoder, and writes each code value in the "code_values" list with
+        that number of bits. The length of the padding is calculated from the number of codes,
+        so it can be written before the codes.
 
         The complete data includes:
         - The length of the padding of the data (in 8 bits)
-        - The padded binary data
+        - The padded data
 
         Args:
             code_values (list): The encoded text as a list, where characters/sequences are 
                                 replaced with their code values.
 
         Returns:
-            complete data (str): The complete data represented as a string of binary data.
+            complete data (bytes): The complete data packed into bytes.
         """
-        max_value = max(self.table.values())
+        if self.code_space.max_bits is not None:
+            return self.write_variable_width_codes(code_values)
+
+        max_value = self.next_code - 1
         self.min_bits = calculate_min_bits_needed(max_value)
+        padding_len = calculate_padding_length(len(code_values) * self.min_bits)
 
-        binary_string = "".join(
-            format(code_value, f"0{self.min_bits}b") for code_value in code_values)
-        length_data = len(binary_string)
-        len_header = length_data + 8
-        padding_len, padded_data = add_padding(binary_string, len_header)
-        padding_len_bin = format(padding_len, "08b")
+        writer = BitWriter()
+        writer.write(padding_len, 8)
+        writer.write(0, padding_len)
+        writer.write_fixed_width(code_values, self.min_bits)
 
-        data_array = []
-        data_array.append(padding_len_bin)
-        data_array.append(padded_data)
-        complete_data = "".join(data for data in data_array)
+        return writer.getvalue()
 
-        return complete_data
+    def write_variable_width_codes(self, code_values: list) -> bytes:
+        """Write the code values with the width of the current dictionary size.
+
+        Each code is written with the minimum number of bits needed to represent the largest
+        code that the encoder could have produced at that point, so the width grows by one bit
+        whenever the dictionary size reaches the next power of two, and returns to the initial
+        width after the clear code. The last byte is padded with zeros. The padding is shorter
+        than any code, so no length of the padding is needed.
+
+        Args:
+            code_values (list): The encoded text as a list of code values.
+
+        Returns:
+            complete data (bytes): The complete data packed into bytes.
+        """
+        writer = BitWriter()
+        self.code_space.write_codes(writer, code_values, self.code_space.get_first_free_code())
+
+        return writer.getvalue()
 
     def set_min_bits_needed(self, bits_needed):
         """Set min_bits to the bits_needed.
@@ -177,116 +247,320 @@ class LZW():
         """
         return self.min_bits
 
-    def compress(self, text) -> str:
+    def get_parameters(self) -> dict:
+        """Get the parameters needed to decompress the data compressed with this instance.
+
+        Returns:
+            parameters (dict): A dictionary containing the minimum bits needed to represent the
+                            largest value and the extra supported symbols.
+        """
+        return {"min_bits": self.min_bits,
+                "extra_supported_symbols": self.extra_supported_symbols}
+
+    def set_parameters(self, parameters: dict):
+        """Set the parameters needed to decompress the data.
+
+        Args:
+            parameters (dict): A dictionary returned by the method get_parameters.
+        """
+        self.set_min_bits_needed(parameters["min_bits"])
+        self.set_extra_supported_symbols(parameters["extra_supported_symbols"])
+
+    def compress(self, text) -> bytes:
         """Compress the text using the LZW-algorithm.
 
-        This method initializes the table, encodes the text, generates a header as a string of
-        binary data that represents the compressed data, and sets the attribute "self.prev_compress"
-        to True.
+        This method finds the extra supported symbols from the text that is already in memory
+        and the phrases of the preset, initializes the table, encodes the text with the chosen
+        engine, generates a complete data packed into bytes, and sets the attribute
+        "self.prev_compress" to True. Each step is measured as a phase when the instrumentation
+        is enabled.
 
         Args:
-            text (str): The text to compress.
+            text (str or bytes): The text to compress.
 
         Returns:
-            complete_data (str): The compressed data represented as a string of binary data.
+            complete_data (bytes): The compressed data packed into bytes.
         """
+        if not self.binary:
+            with phase("find_symbols", len(text)) as record:
+                self._find_extra_supported_symbols(set(text))
+                record.bytes_out = len(self.extra_supported_symbols)
+        with phase("init_table") as record:
+            self._init_table(compress=True)
+            record.bytes_out = self.code_space.get_first_free_code()
+        with phase("encode", len(text)) as record:
+            if self.engine == "integer":
+                encoded_text = encode_with_integer_keys(self, text)
+            else:
+                encoded_text = self.encode(text)
+            record.bytes_out = len(encoded_text)
+        with phase("write_codes", len(encoded_text)) as record:
+            complete_data = self.create_header(encoded_text)
+            record.bytes_out = len(complete_data)
+        self.prev_compress = True
+        return complete_data
+
+    def _find_extra_supported_symbols(self, symbols: set):
+        """Set the extra supported symbols from the symbols of the text and the preset.
+
+        Args:
+            symbols (set): The distinct characters of the text.
+        """
+        if self.code_space.preset is not None:
+            symbols |= self.code_space.preset.get_symbols()
+        self.set_extra_supported_symbols(find_extra_supported_symbols(symbols))
+
+    def compress_stream(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Compress the text from the reader into the writer one chunk at a time.
+
+        The dictionary must be bounded, because the widths of the codes are then known while
+        they are written and the size of the dictionary does not grow with the text. First the
+        text is read once to find the extra supported symbols unless it is read as bytes, and
+        then the chunks are encoded with the function encode_stream of the integer engine and
+        the complete bytes are written as soon as they are available. The written data is the
+        same as the data returned by the method compress.
+
+        Args:
+            reader (file object): A seekable text file object to read the text from.
+            writer (file object): A binary file object to write the compressed data to.
+            chunk_size (int, optional): The number of characters read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+
+        Raises:
+            ValueError: If the dictionary is not bounded.
+        """
+        if self.code_space.max_bits is None:
+            raise ValueError("Streaming compression requires a bounded dictionary.")
+
+        if not self.binary:
+            start = reader.tell()
+            found_symbols = set()
+            for chunk in read_chunks(reader, chunk_size):
+                found_symbols.update(chunk)
+            reader.seek(start)
+            self._find_extra_supported_symbols(found_symbols)
 
         self._init_table(compress=True)
-        encoded_text = self.encode(text)
-        complete_data = self.create_header(encoded_text)
+        bit_writer = BitWriter()
+        next_code = self.code_space.get_first_free_code()
+        for code_values in encode_stream(self, read_chunks(reader, chunk_size)):
+            next_code = self.code_space.write_codes(bit_writer, code_values, next_code)
+            writer.write(bit_writer.take_bytes())
+        writer.write(bit_writer.getvalue())
         self.prev_compress = True
-        return complete_data
 
     def decode_text(self, compressed_codes: list) -> str:
         """Decode the compressed codes to text.
 
-        When the decoding starts, there are all possible single characters in the table mapped
-        with their code values. While decoding is processed, the table is updated for each
-        character. The text is decoded by reading the compressed codes and replacing them with
-        their corresponding characters/sequences.
+        The codes are decoded with the method decode_stream as a single chunk.
 
         Args:
             compressed_code (list of int): The list containing code values for
                                         characters/sequences.
 
         Returns:
-            text (str): The decoded text, where code values are replaced with their
+            text (str or bytes): The decoded text, where code values are replaced with their
                     characters/sequences.
         """
-        old = compressed_codes[0]
-        sequence = self.table[old]
-        code = 256 + len(self.extra_supported_symbols)
-        text = ""
-        char = sequence[0]
-        text += char
-        for i in range(len(compressed_codes)-1):
-            new = compressed_codes[i+1]
-            if new not in self.table:
-                sequence = self.table[old] + char
-            else:
+        empty = b"" if self.binary else ""
+        return empty.join(self.decode_stream([compressed_codes]))
+
+    def decode_stream(self, code_chunks):
+        """Decode the given chunks of compressed codes to text.
+
+        When the decoding starts, there are all possible single characters in the table mapped
+        with their code values. The chunks are decoded with the method _decode_codes, and the
+        next free code, the previous code and the first character of the previous sequence are
+        carried from one chunk to the next.
+
+        Args:
+            code_chunks (iterable of lists of int): The code values for characters/sequences
+                                                    in chunks.
+
+        Yields:
+            text (str or bytes): The decoded text of each chunk.
+        """
+        state = (self.code_space.get_first_free_code(), None, "")
+        for compressed_codes in code_chunks:
+            text, state = self._decode_codes(compressed_codes, state)
+            yield text
+
+    def _decode_codes(self, compressed_codes, state: tuple) -> tuple:
+        """Decode one chunk of compressed codes to text.
+
+        While decoding is processed, the table is updated for each character. The text is
+        decoded by reading the compressed codes and replacing them with their corresponding
+        characters/sequences. If the dictionary is bounded and a clear code is read, the table
+        is initialized again and the next code starts a new sequence.
+
+        Args:
+            compressed_codes (list of int): The code values for characters/sequences.
+            state (tuple): The next free code, the previous code or None, and the first
+                        character of the previous sequence.
+
+        Returns:
+            tuple of (str or bytes, tuple): A tuple containing the decoded text and the state
+                                        after the last code.
+        """
+        code, old, char = state
+        clear_code = self.code_space.get_clear_code() \
+            if self.code_space.max_bits is not None else None
+        text = []
+        for new in compressed_codes:
+            if new == clear_code:
+                self._init_table(compress=False)
+                code, old = self.code_space.get_first_free_code(), None
+                continue
+            if old is None or new in self.table:
                 sequence = self.table[new]
-            text += sequence
-            char = sequence[0]
-            self.table[code] = self.table[old] + char
-            code += 1
+            else:
+                sequence = self.table[old] + char
+            text.append(sequence)
+            char = sequence[:1]
+            if old is not None:
+                self.table[code] = self.table[old] + char
+                code += 1
             old = new
 
-        return text
+        return (b"" if self.binary else "").join(text), (code, old, char)
+
+    def decode_variable_width_data(self, complete_data: bytes) -> array:
+        """Decode the variable width code values from the complete data.
+
+        Args:
+            complete_data (bytes): The complete data packed into bytes.
+
+        Returns:
+            code_values (array of int): An array containing the values for characters/sequences.
+        """
+        code_values, _, _ = self.code_space.unpack_codes(
+            complete_data, 0, self.code_space.get_first_free_code())
+
+        return code_values
+
+    def decode_data(self, complete_data: bytes, starting_index: int) -> array:
+        """Decode the code values from the complete data.
 
-    def decode_data(self, compressed_data: str) -> list:
-        """Decode the code values from the compressed data.
+        The codes are unpacked directly from the bytes with unpack_fixed_width, and each code
+        is represented with the minimum length of bits.
 
         Args:
-            compressed_data (str): The compressed codes as a string representing the binary data.
-                                Each code is represented with the minimum length of bits.
+            complete_data (bytes): The complete data packed into bytes.
+            starting_index (int): The index of the bit where the first code starts.
 
         Returns:
-            code_values (list of int): A list containing the values for characters/sequences.
+            code_values (array of int): An array containing the values for characters/sequences.
         """
-        code_values = []
-        for i in range(0, len(compressed_data), self.min_bits):
-            char_bin = compressed_data[i:i+self.min_bits]
-            char_int = int(char_bin, 2)
-            code_values.append(char_int)
+        code_count = (len(complete_data) * 8 - starting_index) // self.min_bits
+        code_values = unpack_fixed_width(
+            complete_data, self.min_bits, starting_index, code_count)
 
         return code_values
 
-    def parse_data(self, complete_data: str) -> str:
-        """Parse the compressed data from the given complete data.
+    def parse_data(self, complete_data: bytes) -> int:
+        """Parse the starting position of the compressed codes from the given complete data.
 
         The complete data includes:
         - The length of the padding of the data (8 bits)
         - The padded data
 
         Args:
-            complete_data (str): The binary data represented as a string.
+            complete_data (bytes): The complete data packed into bytes.
 
         Returns:
-            compressed_data (str): The compressed binary data represented as a string.
+            starting_index (int): The index of the bit where the first code starts.
         """
-        padding_len = complete_data[:8]
-        padding_len_base = int(padding_len, base=2)
-        compressed_data = complete_data[8+padding_len_base:]
+        padding_len = complete_data[0]
+        starting_index = 8 + padding_len
 
-        return compressed_data
+        return starting_index
 
-    def decompress(self, binary_data: str) -> str:
+    def decompress(self, complete_data: bytes) -> str:
         """Decompress the data from the compressed file.
 
         This method initializes the table, parses the data given from the compressed file,
         decodes the code values from the parsed data and then decodes the values to their
-        corresponding characters/sequences.
+        corresponding characters/sequences with the chosen engine. Each step is measured as a
+        phase when the instrumentation is enabled.
 
         Args:
-            binary_data (str): The complete header data from the compressed file.
+            complete_data (bytes or memoryview): The complete data from the compressed file.
 
         Returns:
-           decoded_text (str): The decoded text in plain text format.
+           decoded_text (str or bytes): The decoded text in plain text format, or the decoded
+                                        bytes in binary mode.
         """
-        self._init_table(compress=False)
-        compressed_data = self.parse_data(binary_data)
-        decoded_data = self.decode_data(compressed_data)
-        decoded_text = self.decode_text(decoded_data)
+        with phase("init_table") as record:
+            self._init_table(compress=False)
+            record.bytes_out = self.code_space.get_first_free_code()
+        with phase("unpack_codes", len(complete_data)) as record:
+            decoded_data = self._unpack_codes(complete_data)
+            record.bytes_out = len(decoded_data)
+        with phase("decode", len(decoded_data)) as record:
+            if self.engine == "integer":
+                decoded_text = decode_text_with_arrays(self, decoded_data)
+            else:
+                decoded_text = self.decode_text(decoded_data)
+            record.bytes_out = len(decoded_text)
         self.prev_compress = False
 
         return decoded_text
+
+    def _unpack_codes(self, complete_data: bytes) -> array:
+        """Unpack the code values from the complete data with variable or fixed widths.
+
+        Args:
+            complete_data (bytes): The complete data packed into bytes.
+
+        Returns:
+            code_values (array of int): An array containing the values for characters/sequences.
+        """
+        if self.code_space.max_bits is not None:
+            return self.decode_variable_width_data(complete_data)
+        return self.decode_data(complete_data, self.parse_data(complete_data))
+
+    def decompress_stream(self, reader, writer, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Decompress the data from the reader into the writer one chunk at a time.
+
+        The codes are read with the method CodeSpace.read_codes and decoded with the method
+        decode_stream, so the table and the previous code are carried from one chunk to the next.
+
+        Args:
+            reader (file object): A binary file object to read the compressed data from.
+            writer (file object): A text file object to write the decoded text to.
+            chunk_size (int, optional): The number of bytes read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+
+        Raises:
+            ValueError: If the dictionary is not bounded.
+        """
+        if self.code_space.max_bits is None:
+            raise ValueError("Streaming decompression requires a bounded dictionary.")
+
+        self._init_table(compress=False)
+        code_chunks = self.code_space.read_codes(reader, chunk_size)
+        for decoded_text in self.decode_stream(code_chunks):
+            writer.write(decoded_text)
+        self.prev_compress = False
+
+
+def _create_name(max_bits, engine: str, preset: bool, binary: bool) -> str:
+    """Create the name of an LZW instance from its options.
+
+    Args:
+        max_bits (int): The maximum width of a code in bits, or None.
+        engine (str): The implementation used for encoding and decoding.
+        preset (bool): Indicates whether the dictionary is seeded with a preset.
+        binary (bool): Indicates whether the data is compressed as bytes.
+
+    Returns:
+        str: The name of the algorithm.
+    """
+    name = f"LZW-{max_bits}" if max_bits is not None else "LZW"
+    if engine != "string":
+        name += f"-{engine}"
+    if preset:
+        name += "-preset"
+    if binary:
+        name += "-bytes"
+    return name
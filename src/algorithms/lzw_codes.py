@@ -0,0 +1,308 @@
+from array import array
+from utilities.bitstream import BitWriter, unpack_fixed_width
+from utilities.utils import DEFAULT_CHUNK_SIZE, read_chunks
+
+
+class CodeDictionary:
+    """Class for the dictionary of the LZW encoder.
+
+    Every time the encoder emits the code of a sequence, the sequence extended with the next
+    character gets the next free code. If the dictionary is bounded and it is full, the clear
+    code is emitted instead and the dictionary starts again from its initial entries. Both the
+    encoder that keys the dictionary with strings and the encoder that keys it with integers use
+    this class, so they produce the same codes.
+
+    Attributes:
+        sequences (dict): The dictionary mapping sequences, or their integer keys, to their codes.
+        initial (dict): The entries of the dictionary after it is initialized or cleared.
+        next_code (int): The next free code of the dictionary.
+        first_free_code (int): The first free code after the dictionary is initialized.
+        code_limit (int): The number of codes in a full dictionary, or None if the dictionary is
+                        not bounded.
+        clear_code (int): The code emitted when the dictionary is cleared.
+    """
+
+    def __init__(self, sequences: dict, first_free_code: int, code_limit, clear_code: int):
+        """Create a new CodeDictionary.
+
+        Args:
+            sequences (dict): The initialized dictionary. The same dictionary is updated while
+                            encoding, and a copy of it is kept as the initial entries.
+            first_free_code (int): The first free code after the dictionary is initialized.
+            code_limit (int): The number of codes in a full dictionary, or None if the
+                            dictionary is not bounded.
+            clear_code (int): The code emitted when the dictionary is cleared.
+        """
+        self.sequences = sequences
+        self.initial = dict(sequences)
+        self.next_code = first_free_code
+        self.first_free_code = first_free_code
+        self.code_limit = code_limit
+        self.clear_code = clear_code
+
+    def emit(self, code: int, key, encoded_text: list):
+        """Emit the code of a sequence and add the extended sequence to the dictionary.
+
+        If the dictionary is full, the clear code is emitted after the code instead, and the
+        dictionary is reset in place, so the callers can keep a reference to the sequences.
+
+        Args:
+            code (int): The code of the sequence that was found in the dictionary.
+            key (str or bytes or int): The key of the sequence extended with the next character.
+            encoded_text (list): The list the codes are appended to.
+        """
+        encoded_text.append(code)
+        if self.next_code == self.code_limit:
+            encoded_text.append(self.clear_code)
+            self.sequences.clear()
+            self.sequences.update(self.initial)
+            self.next_code = self.first_free_code
+        else:
+            self.sequences[key] = self.next_code
+            self.next_code += 1
+
+
+class CodeSpace:
+    """Class for the layout of the LZW codes.
+
+    The codes 0-255 are the single characters, or the byte values in binary mode, and the extra
+    supported symbols follow them. If the dictionary is bounded, the next code is the clear
+    code. The phrases of the preset come next, and the rest of the codes are given to new
+    sequences. The codes of a bounded dictionary are written with the width of the current
+    dictionary size, which both the writer and the reader follow with the same rules.
+
+    Attributes:
+        max_bits (int): The maximum width of a code in bits, or None if the dictionary is not
+                        bounded.
+        extra_supported_symbols (list): The additional symbols to extend the dictionary.
+        preset (LZWPreset): The trained phrases that seed the dictionary, or None.
+    """
+
+    def __init__(self, max_bits=None, preset=None):
+        """Create a new CodeSpace.
+
+        Args:
+            max_bits (int, optional): The maximum width of a code in bits. Defaults to None.
+            preset (LZWPreset, optional): The trained phrases that seed the dictionary.
+                                        Defaults to None.
+        """
+        self.max_bits = max_bits
+        self.extra_supported_symbols = []
+        self.preset = preset
+
+    def get_clear_code(self) -> int:
+        """Return the code that clears the dictionary.
+
+        The clear code is the first code after the initial characters. It is used only if the
+        dictionary is bounded.
+
+        Returns:
+            int: The clear code.
+        """
+        return 256 + len(self.extra_supported_symbols)
+
+    def get_preset_phrases(self) -> list:
+        """Return the phrases of the preset.
+
+        Returns:
+            list: The phrases in the order of their codes, or an empty list without a preset.
+        """
+        return self.preset.phrases if self.preset is not None else []
+
+    def get_preset_code(self) -> int:
+        """Return the code of the first phrase of the preset.
+
+        The phrases follow the initial characters and the clear code.
+
+        Returns:
+            int: The code of the first phrase.
+        """
+        if self.max_bits is None:
+            return self.get_clear_code()
+        return self.get_clear_code() + 1
+
+    def get_first_free_code(self) -> int:
+        """Return the first code given to a new sequence after the dictionary is initialized.
+
+        Returns:
+            int: The first free code.
+        """
+        return self.get_preset_code() + len(self.get_preset_phrases())
+
+    def get_code_limit(self):
+        """Return the number of codes in a full dictionary.
+
+        Returns:
+            int: The number of codes, or None if the dictionary is not bounded.
+
+        Raises:
+            ValueError: If the initial characters do not fit into the dictionary.
+        """
+        if self.max_bits is None:
+            return None
+        code_limit = 1 << self.max_bits
+        if self.get_first_free_code() >= code_limit:
+            raise ValueError(
+                f"{self.get_clear_code()} initial characters do not fit into codes of "
+                f"{self.max_bits} bits.")
+        return code_limit
+
+    def create_table(self, binary: bool, compress: bool) -> dict:
+        """Create the initialized dictionary of the initial characters and the preset phrases.
+
+        Args:
+            binary (bool): If True, the initial characters are bytes objects.
+            compress (bool): If True, the keys are the characters and the values are their
+                            codes. Otherwise the keys are the codes.
+
+        Returns:
+            table (dict): The initialized dictionary.
+        """
+        symbols = [bytes([i]) if binary else chr(i) for i in range(256)]
+        entries = list(enumerate(symbols + self.extra_supported_symbols))
+        entries.extend(enumerate(self.get_preset_phrases(), start=self.get_preset_code()))
+        if compress:
+            return {symbol: code for code, symbol in entries}
+        return dict(entries)
+
+    def create_dictionary(self, sequences: dict) -> CodeDictionary:
+        """Create the dictionary of the encoder from the given initial sequences.
+
+        Args:
+            sequences (dict): The initialized dictionary mapping sequences, or their integer
+                            keys, to their codes.
+
+        Returns:
+            CodeDictionary: The dictionary that grows and is cleared like this layout defines.
+        """
+        return CodeDictionary(sequences, self.get_first_free_code(), self.get_code_limit(),
+                              self.get_clear_code())
+
+    def next_code_width(self, code_value, next_code, code_limit) -> tuple[int, int]:
+        """Update the next free code of the dictionary after the given code value.
+
+        Both the writer and the reader of variable width codes follow the free codes of the
+        encoder with this method. After the clear code the dictionary starts from the first
+        free code, otherwise one code is added until the dictionary is full.
+
+        Args:
+            code_value (int): The code value that was written or read.
+            next_code (int): The next free code before the code value.
+            code_limit (int): The number of codes in a full dictionary.
+
+        Returns:
+            tuple of (int, int): The next free code and the width of the next code value.
+        """
+        if code_value == self.get_clear_code():
+            next_code = self.get_first_free_code()
+        elif next_code < code_limit:
+            next_code += 1
+
+        return next_code, (next_code - 1).bit_length()
+
+    def write_codes(self, writer: BitWriter, code_values: list, next_code: int) -> int:
+        """Write the code values into the writer with variable widths.
+
+        Args:
+            writer (BitWriter): The writer the codes are written into.
+            code_values (list): The code values to be written.
+            next_code (int): The next free code of the dictionary before the first code value.
+
+        Returns:
+            int: The next free code of the dictionary after the last code value.
+        """
+        code_limit = self.get_code_limit()
+        width = (next_code - 1).bit_length()
+        for code_value in code_values:
+            writer.write(code_value, width)
+            next_code, width = self.next_code_width(code_value, next_code, code_limit)
+
+        return next_code
+
+    def unpack_codes(self, data: bytes, position: int, next_code: int) -> tuple[array, int, int]:
+        """Unpack all the complete variable width codes from the data.
+
+        The width of the codes changes only when the dictionary size reaches the next power of
+        two or after a clear code. That is why the codes are unpacked in runs of the same width
+        with unpack_fixed_width. The number of codes in a run is calculated from the next free
+        code, and if the run contains a clear code, the run is cut after it and the next run
+        starts from the initial width. At the maximum width the dictionary is full after a few
+        more codes, and the clear code follows, so the run is limited to those codes instead of
+        all the remaining data.
+
+        Args:
+            data (bytes): The packed codes.
+            position (int): The index of the bit where the first code starts.
+            next_code (int): The next free code of the dictionary before the first code.
+
+        Returns:
+            tuple of (array, int, int): A tuple containing the code values, the index of the
+                                        first bit that was not unpacked and the next free code
+                                        of the dictionary after the last code.
+        """
+        clear_code = self.get_clear_code()
+        code_limit = self.get_code_limit()
+        end = len(data) * 8
+        code_values = array("I")
+
+        while True:
+            width = (next_code - 1).bit_length()
+            run_length = min((end - position) // width,
+                             _count_codes_of_width(width, next_code, code_limit))
+            if run_length == 0:
+                break
+
+            run = unpack_fixed_width(data, width, position, run_length)
+            try:
+                run_length = run.index(clear_code) + 1
+                next_code = self.get_first_free_code()
+                code_values.extend(run[:run_length])
+            except ValueError:
+                next_code = min(next_code + run_length, code_limit)
+                code_values.extend(run)
+            position += run_length * width
+
+        return code_values, position, next_code
+
+    def read_codes(self, reader, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Read and unpack the variable width codes from the reader one chunk at a time.
+
+        Each chunk is appended to the bits left over from the previous chunk. The bits left
+        over after the last chunk are the padding.
+
+        Args:
+            reader (file object): A binary file object to read the compressed data from.
+            chunk_size (int, optional): The number of bytes read at a time.
+                                        Defaults to DEFAULT_CHUNK_SIZE.
+
+        Yields:
+            code_values (array of int): The code values unpacked from each chunk.
+        """
+        next_code = self.get_first_free_code()
+        data = b""
+        position = 0
+        for chunk in read_chunks(reader, chunk_size):
+            data = data[position >> 3:] + chunk
+            position &= 7
+            code_values, position, next_code = self.unpack_codes(data, position, next_code)
+            yield code_values
+
+
+def _count_codes_of_width(width: int, next_code: int, code_limit: int) -> int:
+    """Return the number of codes that are written with the same width.
+
+    Below the maximum width the width grows when the dictionary size reaches the next power of
+    two. At the maximum width the dictionary is full after the remaining free codes, and the
+    code after it is followed by the clear code.
+
+    Args:
+        width (int): The width of the next code.
+        next_code (int): The next free code of the dictionary.
+        code_limit (int): The number of codes in a full dictionary.
+
+    Returns:
+        int: The largest number of codes before the width can change.
+    """
+    if (1 << width) < code_limit:
+        return (1 << width) - next_code + 1
+    return code_limit - next_code + 2
@@ -0,0 +1,255 @@
+import sys
+from array import array
+from algorithms.lzw_codes import CodeDictionary
+
+
+def encode_with_integer_keys(lzw, text_stream) -> list:
+    """Encode the given text by replacing the characters with their code values.
+
+    This function produces the same codes as the method LZW.encode, but the new sequences are
+    not stored as strings. The text is encoded with the function encode_stream as a single
+    chunk.
+
+    Args:
+        lzw (LZW): The algorithm whose table is initialized for compression.
+        text_stream (str or bytes): The plain text to be encoded.
+
+    Returns:
+        encoded_text (list): The encoded text as a list, where characters/sequences are
+                            replaced with their code values.
+    """
+    encoded_text = []
+    for code_values in encode_stream(lzw, [text_stream]):
+        encoded_text.extend(code_values)
+
+    return encoded_text
+
+
+def encode_stream(lzw, chunks):
+    """Encode the given chunks of text by replacing the characters with their code values.
+
+    A sequence is identified by the code of its prefix and the code of its last character,
+    which are combined into one integer key. This way no strings are concatenated or hashed
+    while the text is processed, and the dictionary stores only integers. The dictionary
+    and the current prefix are carried from one chunk to the next, so the codes are the same
+    as if the whole text was encoded at once. The next free code is stored to lzw.next_code
+    after the last chunk.
+
+    In binary mode the code of a byte is the value of the byte itself. The keys of the
+    phrases of the preset are created from the initialized table, and the dictionary starts
+    from them again after every clear code.
+
+    Args:
+        lzw (LZW): The algorithm whose table is initialized for compression.
+        chunks (iterable of str or bytes): The plain text to be encoded in chunks.
+
+    Yields:
+        encoded_text (list): The code values that are complete after each chunk. The code of
+                            the last sequence is yielded after all the chunks.
+    """
+    char_codes = list(range(256)) if lzw.binary else lzw.table
+    shift = lzw.code_space.get_clear_code().bit_length()
+    dictionary = lzw.code_space.create_dictionary(
+        _create_preset_keys(lzw, char_codes, shift))
+    prefix = None
+
+    for chunk in chunks:
+        chars = iter(chunk)
+        if prefix is None:
+            first_char = next(chars, None)
+            if first_char is None:
+                continue
+            prefix = char_codes[first_char]
+        encoded_text, prefix = _encode_chars(chars, prefix, dictionary, char_codes, shift)
+        yield encoded_text
+    if prefix is not None:
+        yield [prefix]
+    lzw.next_code = dictionary.next_code
+
+
+def _encode_chars(chars, prefix: int, dictionary: CodeDictionary, char_codes,
+                  shift: int) -> tuple[list, int]:
+    """Encode the characters of one chunk with the integer keys.
+
+    Args:
+        chars (iterator): The characters of the chunk.
+        prefix (int): The code of the sequence found before the first character.
+        dictionary (CodeDictionary): The dictionary of the integer keys.
+        char_codes (dict or list): The codes of the single characters.
+        shift (int): The number of bits the code of the prefix is shifted by in a key.
+
+    Returns:
+        tuple of (list, int): A tuple containing the code values that are complete and the
+                            code of the sequence found after the last character.
+    """
+    sequences = dictionary.sequences
+    encoded_text = []
+    for char in chars:
+        char_code = char_codes[char]
+        key = (prefix << shift) | char_code
+        sequence_code = sequences.get(key)
+        if sequence_code is not None:
+            prefix = sequence_code
+            continue
+        dictionary.emit(prefix, key, encoded_text)
+        prefix = char_code
+
+    return encoded_text, prefix
+
+
+def _create_preset_keys(lzw, char_codes, shift: int) -> dict:
+    """Create the integer keys of the phrases of the preset from the initialized table.
+
+    Args:
+        lzw (LZW): The algorithm whose table is initialized for compression.
+        char_codes (dict or list): The codes of the single characters.
+        shift (int): The number of bits the code of the prefix is shifted by in a key.
+
+    Returns:
+        dict: A dictionary where keys are the integer keys of the phrases and values are
+            their codes.
+    """
+    return {(lzw.table[phrase[:-1]] << shift) | char_codes[phrase[-1]]: lzw.table[phrase]
+            for phrase in lzw.code_space.get_preset_phrases()}
+
+
+def decode_text_with_arrays(lzw, compressed_codes) -> str:
+    """Decode the compressed codes to text without storing the sequences as strings.
+
+    The codes are decoded with an ArrayDecoder. If the dictionary is bounded, the codes are
+    split at the clear codes, and each run of codes between them is decoded from the
+    initialized dictionary.
+
+    Args:
+        lzw (LZW): The algorithm whose table is initialized for decompression.
+        compressed_codes (list of int): The list containing code values for
+                                        characters/sequences.
+
+    Returns:
+        text (str or bytes): The decoded text, where code values are replaced with their
+                characters/sequences.
+    """
+    code_space = lzw.code_space
+    decoder = ArrayDecoder(lzw.table, code_space, lzw.binary, len(compressed_codes))
+    clear_code = code_space.get_clear_code() if code_space.max_bits is not None else None
+    start = 0
+    while start < len(compressed_codes):
+        end = _find_clear_code(compressed_codes, clear_code, start)
+        decoder.decode(compressed_codes[start:end], code_space.get_first_free_code())
+        start = end + 1
+
+    return decoder.get_text()
+
+
+def _find_clear_code(compressed_codes, clear_code, start: int) -> int:
+    """Find the index of the next clear code.
+
+    Args:
+        compressed_codes (list or array of int): The code values.
+        clear_code (int): The clear code, or None if the dictionary is not bounded.
+        start (int): The index where the search starts.
+
+    Returns:
+        int: The index of the next clear code, or the number of codes if there is none.
+    """
+    if clear_code is None:
+        return len(compressed_codes)
+    try:
+        return compressed_codes.index(clear_code, start)
+    except ValueError:
+        return len(compressed_codes)
+
+
+class ArrayDecoder:
+    """Class for decoding LZW codes into a preallocated array.
+
+    The characters are decoded as unicode point values into a preallocated array, which is
+    doubled in size when needed. The sequence of a new code is always the previous sequence
+    followed by the first character of the next one, and those are written next to each
+    other in the output. That is why an entry of the dictionary is stored only as the offset
+    of its sequence in the output and its length, in two compact arrays. Decoding a code is
+    then a single slice copy inside the output array, so the decoding time is linear in the
+    length of the text. In binary mode the output array contains the byte values.
+
+    The single characters and the phrases of the preset are written at the start of the output
+    before the decoded text, so they are entries of the dictionary like any other sequence.
+
+    Attributes:
+        offsets (array): The offset of the sequence of each code in the output.
+        lengths (array): The length of the sequence of each code.
+        output (array): The initial entries of the dictionary followed by the decoded text.
+        text_start (int): The offset of the decoded text in the output.
+        position (int): The offset after the last decoded sequence.
+        binary (bool): Indicates whether the output contains byte values.
+    """
+
+    def __init__(self, table: dict, code_space, binary: bool, code_count: int):
+        """Create a new ArrayDecoder.
+
+        Args:
+            table (dict): The table initialized for decompression.
+            code_space (CodeSpace): The layout of the codes.
+            binary (bool): If True, the output contains byte values.
+            code_count (int): The number of codes to be decoded, used to preallocate the
+                            output and the dictionary of an unbounded dictionary.
+        """
+        typecode = "B" if binary else "I"
+        capacity = code_space.get_code_limit() or code_space.get_first_free_code() + code_count
+        char_count = code_space.get_clear_code()
+
+        self.offsets = array("I", range(char_count)) + array("I", [0]) * capacity
+        self.lengths = array("I", [1]) * char_count + array("I", [0]) * capacity
+        self.output = array(typecode, (ord(table[code]) for code in range(char_count)))
+        for code in range(code_space.get_preset_code(), code_space.get_first_free_code()):
+            phrase = table[code]
+            self.offsets[code] = len(self.output)
+            self.lengths[code] = len(phrase)
+            self.output.extend(phrase if binary else map(ord, phrase))
+        self.text_start = self.position = len(self.output)
+        self.output.extend(array(typecode, [0]) * (code_count + 1))
+        self.binary = binary
+
+    def decode(self, compressed_codes, code: int):
+        """Decode a run of codes that starts from the initialized dictionary.
+
+        Each decoded code adds the previous sequence followed by the first character of its
+        own sequence to the dictionary. The first character of a sequence is also written
+        after it, so a code that is not in the dictionary yet, which is the previous sequence
+        followed by its own first character, is copied like any other sequence.
+
+        Args:
+            compressed_codes (list of int): The code values without clear codes.
+            code (int): The first free code of the initialized dictionary.
+        """
+        offsets = self.offsets
+        lengths = self.lengths
+        output = self.output
+        position = self.position
+        previous_offset = previous_length = 0
+        for new in compressed_codes:
+            if new < code:
+                offset, length = offsets[new], lengths[new]
+            else:
+                offset, length = previous_offset, previous_length + 1
+            if position + length >= len(output):
+                output.extend(array(output.typecode, [0]) * (len(output) + length))
+            output[position:position + length] = output[offset:offset + length]
+            output[position + length] = output[position]
+            if previous_length:
+                offsets[code], lengths[code] = previous_offset, previous_length + 1
+                code += 1
+            previous_offset, previous_length = position, length
+            position += length
+        self.position = position
+
+    def get_text(self):
+        """Return the decoded text from the output.
+
+        Returns:
+            text (str or bytes): The decoded text, or the decoded bytes in binary mode.
+        """
+        text = self.output[self.text_start:self.position].tobytes()
+        if self.binary:
+            return text
+        encoding = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+        return text.decode(encoding, errors="surrogatepass")
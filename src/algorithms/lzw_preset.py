@@ -0,0 +1,117 @@
+import json
+from collections import Counter
+from algorithms.lzw import LZW
+from utilities.utils import find_extra_supported_symbols
+
+
+class LZWPreset:
+    """Class for a trained list of phrases that seeds the LZW dictionary.
+
+    The phrases are trained once on a sample corpus and saved to a file. The dictionary of the
+    encoder and the decoder starts with the phrases, so short texts with similar content are
+    encoded with long sequences from the first character on.
+
+    Attributes:
+        phrases (list): The phrases in the order of their codes. Every phrase is at least two
+                        characters long, and the phrase without its last character is a single
+                        character or an earlier phrase of the list.
+        binary (bool): Indicates whether the phrases are bytes instead of text.
+    """
+
+    def __init__(self, phrases: list, binary=False):
+        """Create a new LZWPreset.
+
+        Args:
+            phrases (list of str or bytes): The phrases in the order of their codes.
+            binary (bool, optional): If True, the phrases are bytes. Defaults to False.
+
+        Raises:
+            ValueError: If a phrase is shorter than two characters or its prefix is not a
+                        single character or an earlier phrase.
+        """
+        known_phrases = set()
+        for phrase in phrases:
+            if len(phrase) < 2 or (len(phrase) > 2 and phrase[:-1] not in known_phrases):
+                raise ValueError(
+                    "Every phrase must be longer than one character and its prefix must be "
+                    "an earlier phrase.")
+            known_phrases.add(phrase)
+
+        self.phrases = phrases
+        self.binary = binary
+
+    def get_symbols(self) -> set:
+        """Return the distinct characters of the phrases.
+
+        Returns:
+            set: The characters of the phrases, or the byte values in binary mode.
+        """
+        return set().union(*self.phrases)
+
+    def save(self, path: str):
+        """Save the phrases to a JSON file.
+
+        In binary mode the phrases are stored as lists of byte values.
+
+        Args:
+            path (str): The path to the file.
+        """
+        phrases = [list(phrase) if self.binary else phrase for phrase in self.phrases]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"binary": self.binary, "phrases": phrases}, file)
+
+
+def load_lzw_preset(path: str) -> LZWPreset:
+    """Load the phrases saved with the method LZWPreset.save.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        LZWPreset: The loaded phrases.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    binary = data["binary"]
+    phrases = [bytes(phrase) if binary else phrase for phrase in data["phrases"]]
+
+    return LZWPreset(phrases, binary)
+
+
+def train_lzw_preset(texts, max_phrases: int, binary=False) -> LZWPreset:
+    """Train a list of phrases on the given sample texts.
+
+    Each text is encoded with an unbounded dictionary, and the sequences of the emitted codes
+    are counted. The sequences are chosen by the number of characters they save, together with
+    all their prefixes, until max_phrases phrases are chosen. The phrases are ordered by their
+    length, so every prefix gets its code before the phrases that extend it.
+
+    Args:
+        texts (iterable of str or bytes): The sample texts.
+        max_phrases (int): The maximum number of phrases.
+        binary (bool, optional): If True, the phrases are trained for bytes. Defaults to False.
+
+    Returns:
+        LZWPreset: The trained phrases.
+    """
+    usage = Counter()
+    for text in texts:
+        lzw = LZW(binary=binary)
+        if not binary:
+            lzw.set_extra_supported_symbols(find_extra_supported_symbols(text))
+        lzw.reset_table(compress=True)
+        encoded_text = lzw.encode(text)
+        sequences = {code: sequence for sequence, code in lzw.get_table().items()}
+        usage.update(sequences[code] for code in encoded_text)
+
+    selected = set()
+    for sequence in sorted(usage, key=lambda sequence: usage[sequence] * (len(sequence) - 1),
+                           reverse=True):
+        if len(sequence) < 2:
+            break
+        prefixes = {sequence[:end] for end in range(2, len(sequence) + 1)} - selected
+        if len(selected) + len(prefixes) <= max_phrases:
+            selected |= prefixes
+
+    return LZWPreset(sorted(selected, key=lambda phrase: (len(phrase), phrase)), binary)
@@ -0,0 +1,352 @@
+from collections import Counter
+from utilities.bitstream import read_frame, write_frame
+from utilities.utils import calculate_min_bits_needed
+
+SYMBOL_COUNT_BITS = 32
+MIN_TOTAL_BITS = 16
+RANGE_BITS = 32
+TOP = 1 << 24
+RANGE_MASK = (1 << RANGE_BITS) - 1
+
+
+class RangeCoder():
+    """Class for static order-0 range coding.
+
+    The frequencies of the characters are scaled so that they sum up to a power of two, and
+    each character narrows the current range in proportion to its scaled frequency. Unlike
+    huffman codes, a character does not need a whole number of bits, so skewed distributions
+    are encoded close to their entropy.
+
+    The coder works with integers only. The range is kept in RANGE_BITS bits and renormalized
+    one byte at a time whenever it gets smaller than TOP, see the classes RangeEncoder and
+    RangeDecoder.
+
+    The complete data includes:
+    - The length of the header in bits (FRAME_LENGTH_BYTES bytes)
+    - The number of characters in the text (FRAME_LENGTH_BYTES bytes)
+    - The padded header, containing the number of bits of the total frequency (5 bits), the
+    minimum bits needed to represent the largest character (5 bits) and the largest scaled
+    frequency (5 bits), the number of characters (SYMBOL_COUNT_BITS bits), and each character
+    with its scaled frequency
+    - The bytes of the range coder
+
+    Attributes:
+        name (str): The name of the algorithm.
+        prev_compress (bool): Indicates whether compression has occurred previously.
+        binary (bool): Indicates whether the data is compressed as bytes instead of text.
+        frequencies (dict): A dictionary where keys are characters and values are their scaled
+                            frequencies.
+        total_bits (int): The scaled frequencies sum up to 2^total_bits.
+    """
+
+    def __init__(self, binary=False) -> None:
+        """Create a new instance of RangeCoder.
+
+        Args:
+            binary (bool, optional): If True, the data is compressed and decompressed as bytes.
+                                    Defaults to False.
+        """
+        self.name = "RangeCoder-bytes" if binary else "RangeCoder"
+        self.prev_compress = False
+        self.binary = binary
+        self.frequencies = {}
+        self.total_bits = MIN_TOTAL_BITS
+
+    def get_parameters(self) -> dict:
+        """Get the parameters needed to decompress the data compressed with this instance.
+
+        Returns:
+            parameters (dict): An empty dictionary, because the header contains the frequencies.
+        """
+        return {}
+
+    def set_parameters(self, parameters: dict):
+        """Set the parameters needed to decompress the data.
+
+        Args:
+            parameters (dict): A dictionary returned by the method get_parameters.
+        """
+
+    def scale_frequencies(self, frequency) -> dict:
+        """Scale the frequencies of the characters to sum up to a power of two.
+
+        The total is at least twice the number of characters, so every character gets a
+        frequency of at least one. The rest of the total is divided in proportion to the
+        frequencies, and the rounding error is given to the most frequent character.
+
+        Args:
+            frequency (Counter): The frequencies of the characters in the text.
+
+        Returns:
+            frequencies (dict): A dictionary where keys are characters and values are their
+                                scaled frequencies.
+        """
+        self.total_bits = max(MIN_TOTAL_BITS, (2 * len(frequency) - 1).bit_length())
+        total = 1 << self.total_bits
+        spare = total - len(frequency)
+        count = frequency.total()
+        self.frequencies = {char: 1 + freq * spare // count for char, freq in frequency.items()}
+        if self.frequencies:
+            most_common = max(frequency, key=frequency.get)
+            self.frequencies[most_common] += total - sum(self.frequencies.values())
+
+        return self.frequencies
+
+    def create_intervals(self) -> dict:
+        """Create the interval of each character from the scaled frequencies.
+
+        Returns:
+            intervals (dict): A dictionary where keys are characters and values are tuples
+                            of (cumulative frequency of the previous characters, frequency).
+        """
+        intervals = {}
+        cumulative = 0
+        for char in sorted(self.frequencies):
+            intervals[char] = (cumulative, self.frequencies[char])
+            cumulative += self.frequencies[char]
+
+        return intervals
+
+    def encode_header(self) -> str:
+        """Encode the characters and their scaled frequencies.
+
+        Returns:
+            header (str): The header as a string of binary data.
+        """
+        chars = sorted(self.frequencies)
+        values = [char if self.binary else ord(char) for char in chars]
+        symbol_bits = max(calculate_min_bits_needed(max(values, default=0)), 1)
+        frequency_bits = max(calculate_min_bits_needed(
+            max(self.frequencies.values(), default=0)), 1)
+
+        header = [format(self.total_bits, "05b"), format(symbol_bits, "05b"),
+                  format(frequency_bits, "05b"), format(len(chars), f"0{SYMBOL_COUNT_BITS}b")]
+        for char, value in zip(chars, values):
+            header.append(format(value, f"0{symbol_bits}b"))
+            header.append(format(self.frequencies[char], f"0{frequency_bits}b"))
+
+        return "".join(header)
+
+    def parse_header(self, header: str) -> dict:
+        """Parse the characters and their scaled frequencies from the header.
+
+        Args:
+            header (str): The header as a string of binary data.
+
+        Returns:
+            frequencies (dict): A dictionary where keys are characters and values are their
+                                scaled frequencies.
+        """
+        self.total_bits = int(header[:5], base=2)
+        symbol_bits = int(header[5:10], base=2)
+        frequency_bits = int(header[10:15], base=2)
+        symbol_count = int(header[15:15 + SYMBOL_COUNT_BITS], base=2)
+        index = 15 + SYMBOL_COUNT_BITS
+
+        self.frequencies = {}
+        for _ in range(symbol_count):
+            value = int(header[index:index + symbol_bits], base=2)
+            index += symbol_bits
+            char = value if self.binary else chr(value)
+            self.frequencies[char] = int(header[index:index + frequency_bits], base=2)
+            index += frequency_bits
+
+        return self.frequencies
+
+    def encode(self, text) -> bytearray:
+        """Encode the text with the range coder.
+
+        Args:
+            text (str or bytes): The text to be encoded.
+
+        Returns:
+            output (bytearray): The bytes of the range coder.
+        """
+        intervals = self.create_intervals()
+        encoder = RangeEncoder(self.total_bits)
+        for char in text:
+            encoder.encode(*intervals[char])
+
+        return encoder.finish()
+
+    def decode(self, data, start: int, count: int):
+        """Decode the given number of characters from the bytes of the range coder.
+
+        The character of a value of the scaled total is found from a lookup list that contains
+        each character as many times as its scaled frequency. The bytes after the end of the
+        data are read as zeros.
+
+        Args:
+            data (bytes or memoryview): The complete data.
+            start (int): The index of the first byte of the range coder.
+            count (int): The number of characters to decode.
+
+        Returns:
+            str or bytes: The decoded text.
+        """
+        intervals = self.create_intervals()
+        lookup = []
+        for char, (_, frequency) in intervals.items():
+            lookup.extend([char] * frequency)
+        decode_char = RangeDecoder(data, start, self.total_bits).decode_char
+        decoded = [decode_char(lookup, intervals) for _ in range(count)]
+
+        if self.binary:
+            return bytes(decoded)
+        return "".join(decoded)
+
+    def compress(self, text) -> bytes:
+        """Compress the text using static range coding.
+
+        Args:
+            text (str or bytes): The text to compress.
+
+        Returns:
+            complete_data (bytes): The compressed data packed into bytes.
+        """
+        self.scale_frequencies(Counter(text))
+        complete_data = write_frame(self.encode_header(), len(text)).getvalue()
+        if text:
+            complete_data += self.encode(text)
+        self.prev_compress = True
+
+        return complete_data
+
+    def decompress(self, complete_data: bytes) -> str:
+        """Decompress the data from the compressed file.
+
+        Args:
+            complete_data (bytes or memoryview): The complete data from the compressed file.
+
+        Returns:
+            decoded_text (str or bytes): The decoded text in plain text format, or the decoded
+                                        bytes in binary mode.
+        """
+        header, text_length, data_start = read_frame(complete_data)
+        self.parse_header(header)
+        decoded_text = self.decode(complete_data, data_start, text_length)
+        self.prev_compress = False
+
+        return decoded_text
+
+
+class RangeEncoder():
+    """Class for the state of the range encoder.
+
+    A carry from the low end of the range is propagated into the bytes that are still cached,
+    like in the range coder of LZMA.
+
+    Attributes:
+        total_bits (int): The frequencies of the intervals sum up to 2^total_bits.
+        output (bytearray): The bytes written so far.
+        low (int): The low end of the current range, with a possible carry bit above RANGE_BITS.
+        range_ (int): The size of the current range.
+        cache (int): The last byte that may still be changed by a carry.
+        cache_size (int): The number of cached bytes, including the 0xFF bytes after the cache.
+    """
+
+    def __init__(self, total_bits: int) -> None:
+        """Create a new RangeEncoder.
+
+        Args:
+            total_bits (int): The frequencies of the intervals sum up to 2^total_bits.
+        """
+        self.total_bits = total_bits
+        self.output = bytearray()
+        self.low = 0
+        self.range_ = RANGE_MASK
+        self.cache = 0
+        self.cache_size = 1
+
+    def encode(self, cumulative: int, frequency: int):
+        """Narrow the range to the interval of a character.
+
+        Args:
+            cumulative (int): The cumulative frequency of the previous characters.
+            frequency (int): The scaled frequency of the character.
+        """
+        step = self.range_ >> self.total_bits
+        self.low += step * cumulative
+        self.range_ = step * frequency
+        while self.range_ < TOP:
+            self.range_ <<= 8
+            self.shift_low()
+
+    def shift_low(self):
+        """Shift the top byte out of the low end of the range.
+
+        The byte is cached as long as a carry can still change it. A run of 0xFF bytes is only
+        counted, because a carry would turn all of them into zeros.
+        """
+        if self.low < 0xFF000000 or self.low > RANGE_MASK:
+            carry = self.low >> RANGE_BITS
+            self.output.append((self.cache + carry) & 0xFF)
+            self.output.extend(bytes([(0xFF + carry) & 0xFF]) * (self.cache_size - 1))
+            self.cache_size = 0
+            self.cache = (self.low >> 24) & 0xFF
+        self.cache_size += 1
+        self.low = (self.low & 0x00FFFFFF) << 8
+
+    def finish(self) -> bytearray:
+        """Flush the low end of the range into the output.
+
+        Returns:
+            output (bytearray): The bytes of the range coder.
+        """
+        for _ in range(5):
+            self.shift_low()
+
+        return self.output
+
+
+class RangeDecoder():
+    """Class for the state of the range decoder.
+
+    The bytes after the end of the data are read as zeros.
+
+    Attributes:
+        data (bytes or memoryview): The complete data.
+        position (int): The index of the next byte to read.
+        total_bits (int): The frequencies of the intervals sum up to 2^total_bits.
+        code (int): The offset of the encoded value from the low end of the current range.
+        range_ (int): The size of the current range.
+    """
+
+    def __init__(self, data, start: int, total_bits: int) -> None:
+        """Create a new RangeDecoder.
+
+        Args:
+            data (bytes or memoryview): The complete data.
+            start (int): The index of the first byte of the range coder.
+            total_bits (int): The frequencies of the intervals sum up to 2^total_bits.
+        """
+        self.data = data
+        self.position = start + 5
+        self.total_bits = total_bits
+        self.code = int.from_bytes(data[start:start + 5], "big")
+        self.range_ = RANGE_MASK
+
+    def decode_char(self, lookup: list, intervals: dict):
+        """Decode the next character and narrow the range to its interval.
+
+        Args:
+            lookup (list): A list that contains each character as many times as its scaled
+                        frequency.
+            intervals (dict): A dictionary where keys are characters and values are tuples
+                            of (cumulative frequency of the previous characters, frequency).
+
+        Returns:
+            str or int: The decoded character, or the byte value in binary mode.
+        """
+        step = self.range_ >> self.total_bits
+        char = lookup[min(self.code // step, len(lookup) - 1)]
+        cumulative, frequency = intervals[char]
+        self.code -= step * cumulative
+        self.range_ = step * frequency
+        while self.range_ < TOP:
+            byte = self.data[self.position] if self.position < len(self.data) else 0
+            self.position += 1
+            self.code = ((self.code << 8) | byte) & RANGE_MASK
+            self.range_ <<= 8
+
+        return char
@@ -0,0 +1,363 @@
+import argparse
+import csv
+import json
+import math
+import statistics
+import sys
+import time
+from utilities.filehandler import FileHandler
+from utilities.utils import list_non_empty_text_files, non_negative_int, positive_int
+from algorithms.huffman import HuffmanCoding
+from algorithms.context_huffman import ContextHuffman
+from algorithms.adaptive_huffman import AdaptiveHuffman
+from algorithms.lzw import LZW
+from algorithms.range_coder import RangeCoder
+from algorithms.block_compressor import BlockCompressor
+
+DEFAULT_REPETITIONS = 5
+DEFAULT_WARMUP = 1
+DEFAULT_THRESHOLD = 0.1
+CSV_FIELDS = ["algorithm", "file", "original_size", "compressed_size", "compression_ratio",
+              "compress_median_ms", "compress_p95_ms", "compress_stddev_ms",
+              "compress_throughput_mb_s", "decompress_median_ms", "decompress_p95_ms",
+              "decompress_stddev_ms", "decompress_throughput_mb_s"]
+
+
+def create_algorithms(engine_variants=True) -> list:
+    """Create the algorithms and engine variants that are benchmarked.
+
+    Args:
+        engine_variants (bool, optional): If True, LZW and bounded LZW are created with each
+                                        engine. Otherwise only the string engine is used.
+                                        Defaults to True.
+
+    Returns:
+        algorithms (list): New instances of HuffmanCoding, length-limited HuffmanCoding, order-1
+                        context HuffmanCoding, LZW, bounded LZW, block-parallel bounded LZW,
+                        range coder and adaptive HuffmanCoding.
+    """
+    engines = ("string", "integer") if engine_variants else ("string",)
+    lzw_variants = [LZW(max_bits=max_bits, engine=engine)
+                    for max_bits in (None, 16) for engine in engines]
+
+    return [HuffmanCoding(), HuffmanCoding(max_code_length=15), ContextHuffman(),
+            *lzw_variants, BlockCompressor(LZW(max_bits=16)), RangeCoder(), AdaptiveHuffman()]
+
+
+def measure(function, argument, repetitions=DEFAULT_REPETITIONS, warmup=DEFAULT_WARMUP):
+    """Call the function repeatedly and measure the time of each call.
+
+    The warm-up calls are not measured, so the caches and the allocator are in a steady state
+    when the measured calls are made.
+
+    Args:
+        function (callable): The function to measure.
+        argument: The argument given to the function.
+        repetitions (int, optional): The number of measured calls.
+                                    Defaults to DEFAULT_REPETITIONS.
+        warmup (int, optional): The number of calls before the measured calls.
+                                Defaults to DEFAULT_WARMUP.
+
+    Returns:
+        tuple of (list, any): A tuple containing the time of each measured call in nanoseconds
+                            and the return value of the last call.
+
+    Raises:
+        ValueError: If the number of measured calls is less than 1.
+    """
+    if repetitions < 1:
+        raise ValueError("At least one measured call is needed.")
+
+    result = None
+    for _ in range(warmup):
+        result = function(argument)
+
+    samples = []
+    for _ in range(repetitions):
+        start = time.perf_counter_ns()
+        result = function(argument)
+        samples.append(time.perf_counter_ns() - start)
+
+    return samples, result
+
+
+def summarize(samples: list, size: int) -> dict:
+    """Calculate the statistics of the measured times.
+
+    The 95th percentile is calculated with the nearest-rank method, and the throughput is
+    calculated from the median time.
+
+    Args:
+        samples (list): The measured times in nanoseconds.
+        size (int): The size of the original file in bytes.
+
+    Returns:
+        statistics (dict): A dictionary containing the median, the 95th percentile and the
+                        standard deviation in milliseconds, and the throughput in MB/s.
+    """
+    ordered = sorted(samples)
+    median = statistics.median(ordered)
+    p95 = ordered[math.ceil(0.95 * len(ordered)) - 1]
+    stddev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+
+    return {"median_ms": median / 1e6, "p95_ms": p95 / 1e6, "stddev_ms": stddev / 1e6,
+            "throughput_mb_s": size / 1e6 / (median / 1e9) if median else 0.0}
+
+
+def benchmark_text(algorithm, filename: str, text, size: int, repetitions=DEFAULT_REPETITIONS,
+                   warmup=DEFAULT_WARMUP) -> dict:
+    """Benchmark the compression and decompression of a text that is already in memory.
+
+    Args:
+        algorithm (HuffmanCoding, LZW or another algorithm): The algorithm to benchmark.
+        filename (str): The name of the file of the text, used in the result.
+        text (str or bytes): The text to compress, as bytes if the algorithm is binary.
+        size (int): The size of the file in bytes.
+        repetitions (int, optional): The number of measured calls.
+                                    Defaults to DEFAULT_REPETITIONS.
+        warmup (int, optional): The number of calls before the measured calls.
+                                Defaults to DEFAULT_WARMUP.
+
+    Returns:
+        result (dict): A dictionary containing the name of the algorithm and the file, the
+                    sizes, the compression ratio and the statistics of both directions.
+
+    Raises:
+        ValueError: If the decompressed text differs from the original.
+    """
+    compress_samples, compressed_data = measure(algorithm.compress, text, repetitions, warmup)
+    decompress_samples, decompressed_text = measure(
+        algorithm.decompress, compressed_data, repetitions, warmup)
+    if decompressed_text != text:
+        raise ValueError(f"{algorithm.name} did not decompress {filename} correctly.")
+
+    result = {"algorithm": algorithm.name, "file": filename, "original_size": size,
+              "compressed_size": len(compressed_data),
+              "compression_ratio": (1 - len(compressed_data) / size) * 100}
+    for direction, samples in (("compress", compress_samples),
+                               ("decompress", decompress_samples)):
+        for key, value in summarize(samples, size).items():
+            result[f"{direction}_{key}"] = value
+
+    return result
+
+
+def benchmark_file(algorithm, filename: str, repetitions=DEFAULT_REPETITIONS,
+                   warmup=DEFAULT_WARMUP) -> dict:
+    """Benchmark the compression and decompression of one file with one algorithm.
+
+    The file is read once before the measurements, and the data is compressed and decompressed
+    in memory by the function benchmark_text, so the file operations are not included in the
+    times.
+
+    Args:
+        algorithm (HuffmanCoding, LZW or another algorithm): The algorithm to benchmark.
+        filename (str): The name of the file in the text file directory.
+        repetitions (int, optional): The number of measured calls.
+                                    Defaults to DEFAULT_REPETITIONS.
+        warmup (int, optional): The number of calls before the measured calls.
+                                Defaults to DEFAULT_WARMUP.
+
+    Returns:
+        result (dict): The result returned by benchmark_text.
+
+    Raises:
+        ValueError: If the decompressed text differs from the original.
+    """
+    filehandler = FileHandler(filename)
+    if algorithm.binary:
+        text = filehandler.read_file_as_bytes()
+    else:
+        text = filehandler.read_file()
+
+    return benchmark_text(algorithm, filename, text, filehandler.get_file_size(),
+                          repetitions, warmup)
+
+
+def format_result(result: dict) -> str:
+    """Format one result as a line of text.
+
+    Args:
+        result (dict): A result returned by benchmark_text.
+
+    Returns:
+        str: The algorithm, the file, the compression ratio and the median times.
+    """
+    return (f"{result['algorithm']:<24} {result['file']:<36} "
+            f"ratio {result['compression_ratio']:6.2f} % "
+            f"compress {result['compress_median_ms']:10.2f} ms "
+            f"({result['compress_throughput_mb_s']:6.2f} MB/s) "
+            f"decompress {result['decompress_median_ms']:10.2f} ms "
+            f"({result['decompress_throughput_mb_s']:6.2f} MB/s)")
+
+
+def run_benchmarks(algorithms: list, filenames: list, repetitions=DEFAULT_REPETITIONS,
+                   warmup=DEFAULT_WARMUP) -> list:
+    """Benchmark each algorithm with each file.
+
+    Args:
+        algorithms (list): The algorithms to benchmark.
+        filenames (list): The names of the files in the text file directory.
+        repetitions (int, optional): The number of measured calls.
+                                    Defaults to DEFAULT_REPETITIONS.
+        warmup (int, optional): The number of calls before the measured calls.
+                                Defaults to DEFAULT_WARMUP.
+
+    Returns:
+        results (list): A list of the dictionaries returned by benchmark_file.
+    """
+    return [benchmark_file(algorithm, filename, repetitions, warmup)
+            for filename in filenames for algorithm in algorithms]
+
+
+def write_json(results: list, path: str):
+    """Write the results into a JSON file.
+
+    Args:
+        results (list): The results returned by run_benchmarks.
+        path (str): The path to the file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+
+
+def write_csv(results: list, path: str):
+    """Write the results into a CSV file with one row for each algorithm and file.
+
+    Args:
+        results (list): The results returned by run_benchmarks.
+        path (str): The path to the file.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_baseline(path: str) -> list:
+    """Load the results saved earlier with the function write_json.
+
+    Args:
+        path (str): The path to the file.
+
+    Returns:
+        results (list): The saved results.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def find_regressions(results: list, baseline: list, threshold=DEFAULT_THRESHOLD) -> list:
+    """Compare the results with the baseline and find the regressions.
+
+    A result regresses if its median compression or decompression time is more than the
+    threshold slower than in the baseline, or if the compressed data is larger. Results that are
+    not in the baseline are skipped.
+
+    Args:
+        results (list): The results returned by run_benchmarks.
+        baseline (list): The saved results of an earlier run.
+        threshold (float, optional): The allowed relative slowdown.
+                                    Defaults to DEFAULT_THRESHOLD.
+
+    Returns:
+        regressions (list): A list of messages describing the regressions.
+    """
+    baseline_results = {(result["algorithm"], result["file"]): result for result in baseline}
+    regressions = []
+    for result in results:
+        previous = baseline_results.get((result["algorithm"], result["file"]))
+        if previous is None:
+            continue
+        name = f"{result['algorithm']} {result['file']}"
+        for key in ("compress_median_ms", "decompress_median_ms"):
+            if result[key] > previous[key] * (1 + threshold):
+                regressions.append(
+                    f"{name}: {key} {previous[key]:.2f} -> {result[key]:.2f}")
+        if result["compressed_size"] > previous["compressed_size"]:
+            regressions.append(
+                f"{name}: compressed_size {previous['compressed_size']} -> "
+                f"{result['compressed_size']}")
+
+    return regressions
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The parser of the benchmark.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the compression algorithms.")
+    parser.add_argument("files", nargs="*",
+                        help="The files to benchmark. Defaults to all the non-empty text files.")
+    parser.add_argument("--repetitions", type=positive_int, default=DEFAULT_REPETITIONS)
+    parser.add_argument("--warmup", type=non_negative_int, default=DEFAULT_WARMUP)
+    parser.add_argument("--json", help="Write the results into this JSON file.")
+    parser.add_argument("--csv", help="Write the results into this CSV file.")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="The allowed relative slowdown compared with the baseline.")
+
+    return parser
+
+
+def report_results(results: list, options):
+    """Print a row for each result and write the results into the requested files.
+
+    Args:
+        results (list): The results returned by run_benchmarks.
+        options (argparse.Namespace): The parsed command line arguments.
+    """
+    for result in results:
+        print(format_result(result))
+    if options.json:
+        write_json(results, options.json)
+    if options.csv:
+        write_csv(results, options.csv)
+
+
+def compare_with_baseline(results: list, path: str, threshold: float) -> bool:
+    """Print the regressions compared with the baseline.
+
+    Args:
+        results (list): The results returned by run_benchmarks.
+        path (str): The path to the JSON file of the baseline.
+        threshold (float): The allowed relative slowdown.
+
+    Returns:
+        bool: True if regressions were found, False otherwise.
+    """
+    regressions = find_regressions(results, load_baseline(path), threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+
+    return bool(regressions)
+
+
+def main(arguments=None) -> int:
+    """Run the benchmarks from the command line.
+
+    Args:
+        arguments (list, optional): The command line arguments. Defaults to None, when the
+                                    arguments of the process are used.
+
+    Returns:
+        int: 1 if regressions were found compared with the baseline, 0 otherwise.
+    """
+    options = create_parser().parse_args(arguments)
+
+    filenames = options.files or sorted(file[1] for file in list_non_empty_text_files())
+    results = run_benchmarks(create_algorithms(), filenames, options.repetitions,
+                             options.warmup)
+    report_results(results, options)
+
+    if options.baseline and compare_with_baseline(results, options.baseline,
+                                                  options.threshold):
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
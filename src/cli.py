@@ -0,0 +1,509 @@
+import argparse
+import glob
+import json
+import os
+import sys
+from benchmark import (DEFAULT_REPETITIONS, DEFAULT_WARMUP, benchmark_text, create_algorithms,
+                       report_results)
+from utilities.utils import non_negative_int, positive_int
+from algorithms.huffman import HuffmanCoding
+from algorithms.context_huffman import ContextHuffman
+from algorithms.adaptive_huffman import AdaptiveHuffman
+from algorithms.lzw import ENGINES, LZW
+from algorithms.range_coder import RangeCoder
+from algorithms.block_compressor import BlockCompressor
+
+ALGORITHMS = {
+    "huffman": lambda options: HuffmanCoding(max_code_length=options.get("max_code_length"),
+                                             binary=bool(options.get("binary"))),
+    "context-huffman": lambda options: ContextHuffman(
+        max_code_length=options.get("max_code_length"), binary=bool(options.get("binary"))),
+    "adaptive-huffman": lambda options: AdaptiveHuffman(binary=bool(options.get("binary"))),
+    "lzw": lambda options: LZW(max_bits=options.get("max_bits"),
+                               engine=options.get("engine") or "string",
+                               binary=bool(options.get("binary"))),
+    "range": lambda options: RangeCoder(binary=bool(options.get("binary"))),
+}
+DEFAULT_ALGORITHM = "huffman"
+CONTAINER_LENGTH_BYTES = 8
+COMPRESSED_SUFFIX = ".bin"
+DECOMPRESSED_SUFFIX = ".out"
+STDIO = "-"
+
+
+def validate_algorithm_options(options: dict):
+    """Check that the algorithm is known and supports all the given options.
+
+    Args:
+        options (dict): A dictionary containing the name of the algorithm and the values of
+                        "engine", "max_bits", "max_code_length", "binary" and "block_size".
+
+    Raises:
+        ValueError: If the algorithm is unknown or it does not support one of the options.
+    """
+    name = options.get("algorithm")
+    if name not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm {name}, expected one of {list(ALGORITHMS)}.")
+    if (options.get("engine") is not None or options.get("max_bits") is not None) and \
+            name != "lzw":
+        raise ValueError("The engine and the maximum bits can be used only with lzw.")
+    if options.get("max_code_length") is not None and \
+            name not in ("huffman", "context-huffman"):
+        raise ValueError(
+            "The maximum code length can be used only with huffman and context-huffman.")
+
+
+def create_algorithm(options: dict):
+    """Create an instance of the algorithm described by the options.
+
+    Args:
+        options (dict): A dictionary containing the name of the algorithm and the values of
+                        "engine", "max_bits", "max_code_length", "binary" and "block_size". The
+                        options that are None are not used.
+
+    Returns:
+        HuffmanCoding, LZW or another algorithm: A new instance of the algorithm. If the block
+                                                size is given, the algorithm is wrapped in a
+                                                BlockCompressor.
+
+    Raises:
+        ValueError: If the algorithm is unknown or it does not support one of the options.
+    """
+    validate_algorithm_options(options)
+    algorithm = ALGORITHMS[options["algorithm"]](options)
+    if options.get("block_size") is not None:
+        algorithm = BlockCompressor(algorithm, block_size=options["block_size"])
+
+    return algorithm
+
+
+def has_algorithm_options(options) -> bool:
+    """Check whether any option of an algorithm is given in the command line arguments.
+
+    Args:
+        options (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        bool: True if any option other than the algorithm itself is given, False otherwise.
+    """
+    return options.binary or any(value is not None for value in (
+        options.engine, options.max_bits, options.max_code_length, options.block_size))
+
+
+def get_algorithm_options(options) -> dict:
+    """Collect the options of the algorithm from the parsed command line arguments.
+
+    Args:
+        options (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        dict: A dictionary that can be given to the function create_algorithm.
+    """
+    return {"algorithm": options.algorithm or DEFAULT_ALGORITHM, "engine": options.engine,
+            "max_bits": options.max_bits, "max_code_length": options.max_code_length,
+            "binary": options.binary, "block_size": options.block_size}
+
+
+def compress_data(data: bytes, options: dict) -> bytes:
+    """Compress the data into a container that can be decompressed without any options.
+
+    The container includes:
+    - The length of the container header (CONTAINER_LENGTH_BYTES bytes)
+    - The container header as JSON, containing the options of the algorithm and the parameters
+    returned by the method get_parameters of the algorithm
+    - The compressed data
+
+    Args:
+        data (bytes): The data to compress. It is decoded as UTF-8 unless the binary option
+                    is set.
+        options (dict): The options of the algorithm, see the function create_algorithm.
+
+    Returns:
+        bytes: The container.
+
+    Raises:
+        ValueError: If the options are invalid or the data is not valid UTF-8 text.
+    """
+    algorithm = create_algorithm(options)
+    text = data if algorithm.binary else data.decode("utf-8")
+    compressed_data = algorithm.compress(text)
+    header = json.dumps({"options": options,
+                         "parameters": algorithm.get_parameters()}).encode("utf-8")
+
+    return len(header).to_bytes(CONTAINER_LENGTH_BYTES, "big") + header + compressed_data
+
+
+def decompress_data(data: bytes) -> bytes:
+    """Decompress the container created by the function compress_data.
+
+    Args:
+        data (bytes): The container.
+
+    Returns:
+        bytes: The decompressed data. Text is encoded as UTF-8.
+
+    Raises:
+        ValueError: If the data is not a valid container.
+    """
+    header_length = int.from_bytes(data[:CONTAINER_LENGTH_BYTES], "big")
+    data_start = CONTAINER_LENGTH_BYTES + header_length
+    if len(data) < data_start:
+        raise ValueError("The data is not a compressed container.")
+    header = json.loads(str(data[CONTAINER_LENGTH_BYTES:data_start], "utf-8"))
+    if not isinstance(header, dict) or not {"options", "parameters"} <= header.keys():
+        raise ValueError("The header of the container is invalid.")
+
+    algorithm = create_algorithm(header["options"])
+    algorithm.set_parameters(header["parameters"])
+    text = algorithm.decompress(memoryview(data)[data_start:])
+
+    return text if algorithm.binary else text.encode("utf-8")
+
+
+def expand_paths(patterns: list) -> list:
+    """Expand the glob patterns into the paths of the matching files.
+
+    A pattern that matches no files is kept as it is, so it is reported as a missing file when
+    it is read. STDIO means the standard input.
+
+    Args:
+        patterns (list): The paths and glob patterns. "**" matches any number of directories.
+
+    Returns:
+        paths (list): The paths of the files in the order of the patterns, each pattern sorted.
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(path for path in glob.glob(pattern, recursive=True)
+                         if os.path.isfile(path))
+        paths.extend(matches or [pattern])
+
+    return paths
+
+
+def find_input_root(paths: list):
+    """Find the deepest directory that contains all the input files.
+
+    Args:
+        paths (list): The paths of the input files.
+
+    Returns:
+        str: The absolute path of the directory, or None if all the inputs are STDIO.
+    """
+    directories = [os.path.dirname(os.path.abspath(path)) for path in paths if path != STDIO]
+
+    return os.path.commonpath(directories) if directories else None
+
+
+def create_output_path(path: str, options, compress: bool, root=None) -> str:
+    """Create the path of the output file for the input file.
+
+    The compressed file gets the suffix COMPRESSED_SUFFIX. The suffix is removed from the
+    decompressed file, or DECOMPRESSED_SUFFIX is added if the name does not have it. In the
+    output directory the input file keeps its path relative to the root, so files with the same
+    name in different directories do not overwrite each other.
+
+    Args:
+        path (str): The path of the input file, or STDIO.
+        options (argparse.Namespace): The parsed command line arguments.
+        compress (bool): True if the file is compressed, False if it is decompressed.
+        root (str, optional): The directory that the paths in the output directory are relative
+                            to, see the function find_input_root. Defaults to None, when only
+                            the name of the file is used.
+
+    Returns:
+        str: The path of the output file, or STDIO if the output is written to the standard
+            output.
+    """
+    if options.output is not None:
+        return options.output
+    if path == STDIO:
+        return STDIO
+
+    name = os.path.basename(path)
+    if compress:
+        name += COMPRESSED_SUFFIX
+    elif name.endswith(COMPRESSED_SUFFIX):
+        name = name[:-len(COMPRESSED_SUFFIX)]
+    else:
+        name += DECOMPRESSED_SUFFIX
+
+    if options.output_dir is None:
+        return os.path.join(os.path.dirname(path), name)
+    directory = options.output_dir
+    if root is not None:
+        relative = os.path.relpath(os.path.dirname(os.path.abspath(path)), root)
+        if relative != os.curdir:
+            directory = os.path.join(directory, relative)
+
+    return os.path.join(directory, name)
+
+
+def read_input(path: str) -> bytes:
+    """Read all the bytes of the input file.
+
+    Args:
+        path (str): The path of the file, or STDIO to read the standard input.
+
+    Returns:
+        bytes: The contents of the file.
+    """
+    if path == STDIO:
+        return sys.stdin.buffer.read()
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def write_output(path: str, data: bytes, force=False):
+    """Write the bytes into the output file.
+
+    The directories of the file are created if they do not exist.
+
+    Args:
+        path (str): The path of the file, or STDIO to write to the standard output.
+        data (bytes): The data to write.
+        force (bool, optional): If True, an existing file is overwritten. Defaults to False.
+
+    Raises:
+        FileExistsError: If the file exists and force is False.
+    """
+    if path == STDIO:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+        return
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb" if force else "xb") as file:
+        file.write(data)
+
+
+def convert_file(path: str, options, compress: bool, root: str):
+    """Compress or decompress one file into its output file.
+
+    Args:
+        path (str): The path of the input file, or STDIO.
+        options (argparse.Namespace): The parsed command line arguments.
+        compress (bool): True to compress the file, False to decompress it.
+        root (str): The directory returned by the function find_input_root.
+
+    Raises:
+        OSError: If the file can not be read or written.
+        ValueError: If the data can not be compressed or decompressed.
+    """
+    data = read_input(path)
+    if compress:
+        data = compress_data(data, get_algorithm_options(options))
+    else:
+        data = decompress_data(data)
+    write_output(create_output_path(path, options, compress, root), data, options.force)
+
+
+def convert_files(paths: list, options, compress: bool) -> int:
+    """Compress or decompress each file into its output file.
+
+    An error in one file is printed to the standard error and the rest of the files are still
+    converted. An unexpected error is printed with its type, so a bug in one of the algorithms
+    does not stop the whole batch either.
+
+    Args:
+        paths (list): The paths of the input files.
+        options (argparse.Namespace): The parsed command line arguments.
+        compress (bool): True to compress the files, False to decompress them.
+
+    Returns:
+        int: 1 if any of the files failed, 0 otherwise.
+    """
+    status = 0
+    root = find_input_root(paths)
+    for path in paths:
+        try:
+            convert_file(path, options, compress, root)
+        except (OSError, ValueError) as error:
+            print(f"{path}: {error}", file=sys.stderr)
+            status = 1
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            print(f"{path}: unexpected {type(error).__name__}: {error}", file=sys.stderr)
+            status = 1
+
+    return status
+
+
+def benchmark_data(path: str, data: bytes, algorithms: list, options) -> tuple[list, int]:
+    """Benchmark the algorithms with the data of one file.
+
+    An error of one algorithm is printed to the standard error and the rest of the algorithms
+    are still benchmarked.
+
+    Args:
+        path (str): The path of the file, used in the results.
+        data (bytes): The contents of the file.
+        algorithms (list): The algorithms to benchmark.
+        options (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        tuple of (list, int): A tuple containing the results and 1 if any of the algorithms
+                            failed, 0 otherwise.
+    """
+    status = 0
+    results = []
+    for algorithm in algorithms:
+        try:
+            text = data if algorithm.binary else data.decode("utf-8")
+            results.append(benchmark_text(algorithm, path, text, len(data),
+                                          options.repetitions, options.warmup))
+        except ValueError as error:
+            print(f"{path}: {algorithm.name}: {error}", file=sys.stderr)
+            status = 1
+
+    return results, status
+
+
+def benchmark_files(paths: list, options) -> int:
+    """Benchmark the algorithms with each file and print the results.
+
+    Each file is read only once, so the standard input can be benchmarked with all the
+    algorithms.
+
+    Args:
+        paths (list): The paths of the input files.
+        options (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+        int: 1 if any of the files failed, 0 otherwise.
+    """
+    if options.algorithm is None:
+        algorithms = create_algorithms()
+    else:
+        algorithms = [create_algorithm(get_algorithm_options(options))]
+
+    status = 0
+    results = []
+    for path in paths:
+        try:
+            data = read_input(path)
+        except OSError as error:
+            print(f"{path}: {error}", file=sys.stderr)
+            status = 1
+            continue
+        path_results, path_status = benchmark_data(path, data, algorithms, options)
+        results.extend(path_results)
+        status = max(status, path_status)
+    report_results(results, options)
+
+    return status
+
+
+def create_algorithm_parser() -> argparse.ArgumentParser:
+    """Create the parent parser of the options of the algorithm.
+
+    Returns:
+        argparse.ArgumentParser: The parser of the options of the algorithm.
+    """
+    algorithm_parser = argparse.ArgumentParser(add_help=False)
+    algorithm_parser.add_argument("-a", "--algorithm", choices=ALGORITHMS,
+                                  help=f"Defaults to {DEFAULT_ALGORITHM} when compressing and "
+                                  "to all the benchmarked algorithms in bench.")
+    algorithm_parser.add_argument("--engine", choices=ENGINES, help="The engine of lzw.")
+    algorithm_parser.add_argument("--max-bits", type=positive_int,
+                                  help="Bound the dictionary of lzw to this code width.")
+    algorithm_parser.add_argument("--max-code-length", type=positive_int,
+                                  help="Limit the length of the huffman codes.")
+    algorithm_parser.add_argument("--binary", action="store_true",
+                                  help="Compress the bytes of the file instead of its text.")
+    algorithm_parser.add_argument("--block-size", type=positive_int,
+                                  help="Compress independent blocks of this size in parallel.")
+
+    return algorithm_parser
+
+
+def create_output_parser() -> argparse.ArgumentParser:
+    """Create the parent parser of the input files and the output options.
+
+    Returns:
+        argparse.ArgumentParser: The parser of the input files and the output options.
+    """
+    output_parser = argparse.ArgumentParser(add_help=False)
+    output_parser.add_argument("inputs", nargs="*", default=[STDIO],
+                               help="The files or glob patterns. Defaults to the standard input.")
+    output_parser.add_argument("-o", "--output",
+                               help="The output file of a single input, or - for the standard "
+                               "output.")
+    output_parser.add_argument("--output-dir",
+                               help="The directory of the output files. Defaults to the "
+                               "directory of each input file.")
+    output_parser.add_argument("-f", "--force", action="store_true",
+                               help="Overwrite existing output files.")
+
+    return output_parser
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The parser with the subcommands compress, decompress and bench.
+    """
+    algorithm_parser = create_algorithm_parser()
+    output_parser = create_output_parser()
+
+    parser = argparse.ArgumentParser(description="Compress and decompress files without the "
+                                     "interactive user interface.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("compress", parents=[algorithm_parser, output_parser],
+                          help="Compress the files.")
+    subparsers.add_parser("decompress", parents=[output_parser],
+                          help="Decompress files compressed with the compress command.")
+    bench_parser = subparsers.add_parser("bench", parents=[algorithm_parser],
+                                         help="Benchmark the algorithms with the files.")
+    bench_parser.add_argument("inputs", nargs="+", help="The files or glob patterns.")
+    bench_parser.add_argument("--repetitions", type=positive_int, default=DEFAULT_REPETITIONS)
+    bench_parser.add_argument("--warmup", type=non_negative_int, default=DEFAULT_WARMUP)
+    bench_parser.add_argument("--json", help="Write the results into this JSON file.")
+    bench_parser.add_argument("--csv", help="Write the results into this CSV file.")
+
+    return parser
+
+
+def validate_options(parser: argparse.ArgumentParser, options, paths: list):
+    """Check the combination of the command line arguments before any file is processed.
+
+    Args:
+        parser (argparse.ArgumentParser): The parser used to report the errors.
+        options (argparse.Namespace): The parsed command line arguments.
+        paths (list): The paths of the input files.
+    """
+    if options.command == "bench" and options.algorithm is None:
+        if has_algorithm_options(options):
+            parser.error("the options of an algorithm require --algorithm")
+    elif options.command != "decompress":
+        try:
+            create_algorithm(get_algorithm_options(options))
+        except ValueError as error:
+            parser.error(str(error))
+    if options.command != "bench" and options.output is not None and len(paths) > 1:
+        parser.error("--output can be used only with a single input")
+
+
+def main(arguments=None) -> int:
+    """Run the command line interface.
+
+    Args:
+        arguments (list, optional): The command line arguments. Defaults to None, when the
+                                    arguments of the process are used.
+
+    Returns:
+        int: 1 if any of the files failed, 0 otherwise.
+    """
+    parser = create_parser()
+    options = parser.parse_args(arguments)
+    paths = expand_paths(options.inputs)
+    validate_options(parser, options, paths)
+
+    if options.command == "bench":
+        return benchmark_files(paths, options)
+
+    return convert_files(paths, options, options.command == "compress")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
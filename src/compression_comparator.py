@@ -1,4 +1,20 @@
 import time
+from utilities.instrumentation import get_recorder, track_memory
+
+DECOMPRESSION_COLUMNS = (6, 9, 10)
+TRACED_PEAK_COLUMNS = (8, 10)
+
+
+def to_kilobytes(size):
+    """Convert a measured size from bytes to kilobytes.
+
+    Args:
+        size (int): The size in bytes, or None if it was not measured.
+
+    Returns:
+        float: The size in kilobytes, or None if it was not measured.
+    """
+    return None if size is None else size / 1024
 
 
 class CompressionComparator():
@@ -11,6 +27,10 @@ class CompressionComparator():
         filehandler (Filehandler): An instance of FileHandler that is responsible for handling
                                 all file operations.
         original_file_size (bytes): The size of the file before compression in bytes.
+        phase_stats (list): The measured phases of the algorithms when the instrumentation is
+                            enabled. Each list element is a list with the format [algorithm
+                            name, filename, direction, phase, time, input size, output size,
+                            memory peak].
     """
 
     def __init__(self, filehandler) -> None:
@@ -21,6 +41,7 @@ class CompressionComparator():
         """
         self.filehandler = filehandler
         self.original_file_size = self.filehandler.get_file_size()
+        self.phase_stats = []
 
     def benchmark(self, algorithm):
         """Run the compression and decompression methods for given algorithm
@@ -32,37 +53,63 @@ class CompressionComparator():
         Returns:
             benchmark_results (list): A list containing the compression statistics with the format
                                     [algorithm name, filename, filesize, compressed filesize,
-                                    compression ratio, compression time, decompression time]
+                                    compression ratio, compression time, decompression time,
+                                    compression RSS peak, compression traced peak,
+                                    decompression RSS peak, decompression traced peak]
         """
         compression_stats = self.benchmark_compress(algorithm)
+        self.collect_phase_stats(algorithm, "compress")
         decompression_stats = self.benchmark_decompress(algorithm)
+        self.collect_phase_stats(algorithm, "decompress")
         benchmark_results = compression_stats
-        benchmark_results[6] = decompression_stats[6]
+        for i in DECOMPRESSION_COLUMNS:
+            benchmark_results[i] = decompression_stats[i]
 
         return benchmark_results
 
-    def compare(self, huffman, lzw):
+    def collect_phase_stats(self, algorithm, direction: str):
+        """Move the phases recorded by the instrumentation into the phase stats list.
+
+        If the instrumentation is disabled, nothing is done.
+
+        Args:
+            algorithm (HuffmanCoding or LZW): The algorithm that was measured.
+            direction (str): "compress" or "decompress".
+        """
+        recorder = get_recorder()
+        if recorder is None:
+            return
+
+        for record in recorder.take_records():
+            self.phase_stats.append(
+                [algorithm.name, self.filehandler.filename, direction, record.name,
+                 record.time_ns / 1e9, record.bytes_in, record.bytes_out,
+                 record.memory_peak / 1024])
+
+    def compare(self, *algorithms):
         """Run the benchmark method for each algorithm and store the results in the
         compression stats list.
 
+        Any number of algorithms can be compared, for example variants of the same algorithm
+        with different options, so the cost of an option in compression ratio is shown next to
+        the baseline.
+
         Args:
-            huffman (HuffmanCoding): An instance of HuffmanCoding algorithm.
-            lzw (LZW): An instance of LZW algorithm.
+            algorithms (HuffmanCoding or LZW): The algorithm instances to compare, for example
+                                            an instance of HuffmanCoding and an instance of LZW.
 
         Returns:
             algorithm_stats (list): A list containing the compression statistics for each algorithm.
                                 Each list element is a list with the format [algorithm name,
                                 filename, filesize, compressed filesize, compression ratio,
-                                compression time, decompression time]
+                                compression time, decompression time, compression RSS peak,
+                                compression traced peak, decompression RSS peak,
+                                decompression traced peak]
         """
 
         compression_stats = []
-
-        huffman = self.benchmark(huffman)
-        lzw = self.benchmark(lzw)
-
-        compression_stats.append(huffman)
-        compression_stats.append(lzw)
+        for algorithm in algorithms:
+            compression_stats.append(self.benchmark(algorithm))
 
         return compression_stats
 
@@ -73,12 +120,16 @@ class CompressionComparator():
         - The name of the algorithm
         - The name of the decompressed file
         - Decompression time in seconds
+        - The peak resident set size and the tracemalloc peak of the decompression in kB
 
 
         If the decompressed file is exactly the same size as the original, the compression time
-        compressed filesize and compression ratio are set to 0.0, as they are not measured in
-        this method. If the decompressed file size differs from the original, all statistics are
-        set to None, indicating a decompression error.
+        compressed filesize, compression ratio and the memory peaks of the compression are set to
+        0.0, as they are not measured in this method. If the decompressed file size differs from
+        the original, all statistics are set to None, indicating a decompression error.
+
+        The tracemalloc peak is measured only if tracemalloc is already tracing, and it is 0.0
+        otherwise.
 
         Args:
             algorithm (HuffanCoding or LZW): An algorithm object to use for decompression.
@@ -86,26 +137,30 @@ class CompressionComparator():
         Returns:
             decompression_stats: A list containing the decompression statistics with the format
                                 [algorithm name, filename, filesize, compressed filesize,
-                                compression ratio, compression time, decompression time]
+                                compression ratio, compression time, decompression time,
+                                compression RSS peak, compression traced peak,
+                                decompression RSS peak, decompression traced peak]
 
                                 If the decompressed file is the same size as the original,
-                                list type is [str, str, float, float, float, float, float],
-                                otherwise [str, str, float, None, None, None, None].
+                                all the values after the filename are floats, otherwise the
+                                values after the filesize are None.
         """
         decompression_stats = [
             algorithm.name, self.filehandler.filename, self.original_file_size / 1024]
 
-        start_decompress_time = time.time()
-        self.decompress(algorithm)
-        end_decompress_time = time.time()
+        with track_memory() as memory:
+            start_decompress_time = time.time()
+            self.decompress(algorithm)
+            end_decompress_time = time.time()
         decompression_time = end_decompress_time - start_decompress_time
 
         decompressed_file_size = self.filehandler.get_file_size()
         if decompressed_file_size == self.original_file_size:
-            stats = (0.0, 0.0, 0.0, decompression_time)
+            stats = (0.0, 0.0, 0.0, decompression_time, 0.0, 0.0,
+                     memory.rss_peak / 1024, to_kilobytes(memory.traced_peak))
 
         else:
-            stats = (None, None, None, None)
+            stats = (None,) * 8
 
         decompression_stats.extend(list(stats))
         return decompression_stats
@@ -120,21 +175,27 @@ class CompressionComparator():
         - The size of the compressed file in bytes
         - Compression ratio %
         - Compression time in seconds
+        - The peak resident set size and the tracemalloc peak of the compression in kB
 
-        The decompression time is set to 0.0, as it is not measured in this method.
+        The decompression time and the memory peaks of the decompression are set to 0.0, as they
+        are not measured in this method. The tracemalloc peak is measured only if tracemalloc is
+        already tracing, and it is None otherwise.
 
         Args:
             algorithm (HuffanCoding or LZW): An algorithm to use for compression.
 
         Returns:
-            compression_stats (list): A list type of [str, str, float, float, float, float, float]
-                                    containing the compression statistics with the format
+            compression_stats (list): A list of two strings followed by floats containing the
+                                    compression statistics with the format
                                     [algorithm name, filename, filesize, compressed filesize,
-                                    compression ratio, compression time, decompression time]
+                                    compression ratio, compression time, decompression time,
+                                    compression RSS peak, compression traced peak,
+                                    decompression RSS peak, decompression traced peak]
         """
-        start_compress_time = time.time()
-        self.compress(algorithm)
-        end_compress_time = time.time()
+        with track_memory() as memory:
+            start_compress_time = time.time()
+            self.compress(algorithm)
+            end_compress_time = time.time()
         compression_stats = [
             algorithm.name, self.filehandler.filename, self.original_file_size / 1024]
         compression_time = end_compress_time - start_compress_time
@@ -144,31 +205,12 @@ class CompressionComparator():
                              self.original_file_size) * 100
 
         stats = (compressed_file_size / 1024,
-                 compression_ratio, compression_time, 0.0)
+                 compression_ratio, compression_time, 0.0,
+                 memory.rss_peak / 1024, to_kilobytes(memory.traced_peak), 0.0, 0.0)
         compression_stats.extend(list(stats))
 
         return compression_stats
 
-    def convert_data_to_bytes(self, header_data):
-        """Convert a binary string to bytes.
-
-        This method converts a string of binary data into an array of bytes,
-        enabling that the data can be written into the file.
-
-        Args:
-            header_data (str): The string of binary data to be converted.
-
-        Returns:
-            encoded_bytes (bytearray): The converted data as an array of bytes.
-        """
-        encoded_bytes = bytearray()
-        for i in range(0, len(header_data), 8):
-            byte = header_data[i:i+8]
-            byte_value = int(byte, 2)
-            encoded_bytes.append(byte_value)
-
-        return encoded_bytes
-
     def compress(self, algorithm):
         """Compress the file given during initialization with chosen algorithm.
 
@@ -176,36 +218,30 @@ class CompressionComparator():
         content of the file, compresses the text, converts the text into a writable binary format
         and then calls a FileHandler object to write it into the file.
 
-        Before compression the name of the algorithm is checked.
-        - If the chosen algorithm is "LZW", this method invokes the filehandler to read the file and
-        check if it contains symbols outside the range of 0-255 unicode points. Any found symbol is
-        added to the extra supported symbols list which is then returned to this method. The list
-        containing the extra symbols is then given to the LZW algorithm.
+        If the chosen algorithm compresses bytes, the file is read as bytes without decoding.
 
         Args:
             algorithm (HuffmanCoding or LZW object): An algorithm object to use for compressing.
         """
-        if algorithm.name == "LZW":
-            supported = self.filehandler.find_extra_supported_symbols()
-            algorithm.set_extra_supported_symbols(supported)
-
-        text_to_compress = self.filehandler.read_file()
-        compressed_text = algorithm.compress(text_to_compress)
-        compressed_text_in_binary = self.convert_data_to_bytes(compressed_text)
+        if algorithm.binary:
+            text_to_compress = self.filehandler.read_file_as_bytes()
+        else:
+            text_to_compress = self.filehandler.read_file()
+        compressed_data = algorithm.compress(text_to_compress)
         self.filehandler.write_data_to_binary_file(
-            compressed_text_in_binary, algorithm.name)
+            compressed_data, algorithm.name)
 
     def decompress(self, algorithm):
         """Decompress the file given during initialization with chosen algorithm.
 
-        This method decompresses the file given in the FileHandler constructor. It reads the
-        content of the file, decompresses the text and calls FileHandler-object to write the text
-        into the file.
+        This method decompresses the file given in the FileHandler constructor. It maps the
+        content of the file into memory, decompresses the text directly from the mapped file and
+        calls FileHandler-object to write the text into the file.
 
         Args:
             algorithm (HuffmanCoding or LZW object): The algorithm object to use for decompressing.
         """
-        compressed_data = self.filehandler.read_binary_file(algorithm.name)
-        decoded_text = algorithm.decompress(compressed_data)
+        with self.filehandler.map_binary_data(algorithm.name) as compressed_data:
+            decoded_text = algorithm.decompress(compressed_data)
         self.filehandler.write_decoded_text_to_file(
             decoded_text, algorithm.name)
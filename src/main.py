@@ -1,9 +1,14 @@
+import os
 import sys
-from compression_comparator import CompressionComparator
+from concurrent.futures import ProcessPoolExecutor
+from benchmark import create_algorithms
+from compression_comparator import TRACED_PEAK_COLUMNS, CompressionComparator
 from utilities.filehandler import FileHandler
-from utilities.utils import list_non_empty_text_files
+from utilities.instrumentation import get_recorder
+from utilities.utils import FILE_DIRECTORY, list_non_empty_text_files
 from algorithms.huffman import HuffmanCoding
 from algorithms.lzw import LZW
+from algorithms.range_coder import RangeCoder
 from ui import UI
 
 
@@ -24,7 +29,8 @@ def action_loop(ui, comparator, algorithm, table):
         table (list): A list containing the compression statistics for each algorithm.
                     Each list element is a list with the format [algorithm name, filename,
                     filesize, compressed filesize, compression ratio, compression time,
-                    decompression time
+                    decompression time, compression RSS peak, compression traced peak,
+                    decompression RSS peak, decompression traced peak]
     """
 
     while True:
@@ -69,12 +75,12 @@ def create_filehandler(ui):
 def choose_algorithm_loop(ui, comparator):
     """Choose algorithm in a loop.
 
-    This method will create the instances of HuffmanCoding and LZW algorithms and initializes
-    an empty table to store the compression results.
+    This method will create the instances of HuffmanCoding, LZW and RangeCoder algorithms and
+    initializes an empty table to store the compression results.
 
     The user is prompted to choose an action:
-    - If "H" or "L", this method calls the action loop with the corresponding algorithm.
-    - If "C", the comparator is invoked to compare both algorithms
+    - If "H", "L" or "R", this method calls the action loop with the corresponding algorithm.
+    - If "C", the comparator is invoked to compare all the algorithms
       and display the results to the user.
     - If "E", the loop breaks.
 
@@ -87,6 +93,7 @@ def choose_algorithm_loop(ui, comparator):
     """
     huffman = HuffmanCoding()
     lzw = LZW()
+    range_coder = RangeCoder()
     table = []
     while True:
         print(f"Chosen file: {comparator.filehandler.filename}")
@@ -95,9 +102,11 @@ def choose_algorithm_loop(ui, comparator):
             action_loop(ui, comparator, huffman, table)
         if chosen_algorithm == "L":
             action_loop(ui, comparator, lzw, table)
+        if chosen_algorithm == "R":
+            action_loop(ui, comparator, range_coder, table)
         if chosen_algorithm == "C":
             ui.display_message("\nCalculating...")
-            ui.display_table(comparator.compare(huffman, lzw))
+            ui.display_table(comparator.compare(huffman, lzw, range_coder))
             break
         if chosen_algorithm == "E":
             break
@@ -108,7 +117,8 @@ def update_table(statistics_table, new_stats):
 
     This method uses the next function to find the first row in the table that matches the algorithm
     name.
-    - If a match is found, it updates the row with the new statistics.
+    - If a match is found, it updates the row with the new statistics. Values that are 0, and
+    traced peaks that are None, were not measured and they do not replace the old values.
     - If no match is found, a StopIteration exeption is catched and the new row is appended
     to the table.
 
@@ -120,13 +130,85 @@ def update_table(statistics_table, new_stats):
     try:
         row = next(row for row in statistics_table if row[0] == algorithm_name)
         for i in range(4, len(row)):
-            if new_stats[i] != 0:
-                row[i] = new_stats[i]
+            if new_stats[i] == 0 or (new_stats[i] is None and i in TRACED_PEAK_COLUMNS):
+                continue
+            row[i] = new_stats[i]
     except StopIteration:
         statistics_table.append(new_stats)
 
 
-def automatic_start():
+def create_automatic_algorithms() -> list:
+    """Create the algorithms that are compared in the automatic mode.
+
+    The algorithms are the same as in the benchmark, but only with the string engine of LZW.
+
+    Returns:
+        algorithms (list): New instances of the algorithms.
+    """
+    return create_algorithms(engine_variants=False)
+
+
+def benchmark_algorithm(filename: str, algorithm):
+    """Compress and decompress one file with one algorithm.
+
+    This function is called in the worker processes, so it creates its own FileHandler and
+    CompressionComparator. Only the decompressed file of the given algorithm is removed, because
+    the other workers may still be writing their own files into the same directory.
+
+    Args:
+        filename (str): The name of the file in the text file directory.
+        algorithm (HuffmanCoding, LZW or another algorithm): The algorithm to benchmark.
+
+    Returns:
+        tuple of (list, list): The compression statistics of the algorithm and the measured
+                            phases of the algorithm.
+    """
+    filehandler = FileHandler(filename)
+    comparator = CompressionComparator(filehandler)
+    result = comparator.benchmark(algorithm)
+    decompressed_path = filehandler.generate_new_path(f"_{algorithm.name}_decompressed.txt")
+    if os.path.exists(decompressed_path):
+        filehandler.remove_file(decompressed_path)
+
+    return result, comparator.phase_stats
+
+
+def run_automatic_benchmarks(filenames: list, max_workers=None) -> tuple[list, list]:
+    """Benchmark each algorithm with each file in worker processes.
+
+    Each pair of a file and an algorithm is a separate job. The jobs of the largest files are
+    started first, so the whole run takes about as long as the slowest single job, but the
+    results are returned in the order of the files and the algorithms. If only one worker is
+    allowed, the jobs are run in this process.
+
+    Args:
+        filenames (list): The names of the files in the text file directory.
+        max_workers (int, optional): The maximum number of processes. Defaults to None, when
+                                    the number of processors is used.
+
+    Returns:
+        tuple of (list, list): The compression statistics of each pair and the measured phases
+                            of all the pairs.
+    """
+    jobs = [(filename, algorithm)
+            for filename in filenames for algorithm in create_automatic_algorithms()]
+    if max_workers == 1:
+        results = [benchmark_algorithm(filename, algorithm) for filename, algorithm in jobs]
+    else:
+        largest_first = sorted(
+            range(len(jobs)), reverse=True,
+            key=lambda i: os.path.getsize(os.path.join(FILE_DIRECTORY, jobs[i][0])))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {i: executor.submit(benchmark_algorithm, *jobs[i]) for i in largest_first}
+            results = [futures[i].result() for i in range(len(jobs))]
+
+    table = [result for result, _ in results]
+    phase_table = [phase for _, phases in results for phase in phases]
+
+    return table, phase_table
+
+
+def automatic_start(max_workers=None):
     """Run the program automatically (non interactive mode).
 
     This method runs the compression and decompression algorithms automatically for all the non
@@ -135,32 +217,23 @@ def automatic_start():
     The process involves the following steps:
     1. Initialize the user interface.
     2. Get a list of all non empty text files in the directory.
-    3. For each file:
-        - Initialize HuffmanCoding and LZW compression algorithms.
-        - Create a FileHandler instance for the file.
-        - Initialize a CompressionComparator with the FileHandler.
-        - Compare the performance of HuffmanCoding and LZW algorithms using the Comparator.
-        - Store the results in a table.
-        - Remove the temporary files.
+    3. Benchmark each algorithm with each file in parallel with run_automatic_benchmarks.
     4. Display the compression statistics table to the user.
+    5. If the instrumentation is enabled, display the measured phases of the algorithms.
 
+    Args:
+        max_workers (int, optional): The maximum number of processes. Defaults to None, when
+                                    the number of processors is used.
     """
     ui = UI()
-    all_files = list_non_empty_text_files()
+    filenames = [file[1] for file in list_non_empty_text_files()]
 
-    table = []
     ui.display_message("Calculating...")
-    for file in all_files:
-        huffman = HuffmanCoding()
-        lzw = LZW()
-        filename = file[1]
-        filehandler = FileHandler(filename)
-        comparator = CompressionComparator(filehandler)
-        result = comparator.compare(huffman, lzw)
-        table.extend(result)
-        filehandler.tear_down()
+    table, phase_table = run_automatic_benchmarks(filenames, max_workers)
 
     ui.display_table(table)
+    if get_recorder() is not None:
+        ui.display_phase_table(phase_table)
 
 
 def start():
@@ -189,4 +262,4 @@ if __name__ == "__main__":
         if sys.argv[1] == "start":
             start()
         elif sys.argv[1] == "automatic_start":
-            automatic_start()
+            automatic_start(int(sys.argv[2]) if len(sys.argv) > 2 else None)
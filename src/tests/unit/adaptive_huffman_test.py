@@ -0,0 +1,73 @@
+import io
+import unittest
+import hypothesis.strategies as st
+from hypothesis import given
+from algorithms.adaptive_huffman import AdaptiveHuffman, iterate_bits
+from algorithms.block_compressor import BlockCompressor
+
+
+class TestAdaptiveHuffman(unittest.TestCase):
+    def setUp(self):
+        self.text = "TOBEORNOTTOBEORTOBEORNOT"
+        self.huffman = AdaptiveHuffman()
+
+    def test_first_symbol_is_written_after_empty_nyt_code(self):
+        compressed_data = self.huffman.compress("A")
+        self.assertEqual(compressed_data, bytes([0b00100000, 0b10000000, 7]))
+
+    def test_repeated_symbol_gets_one_bit_code(self):
+        self.huffman.compress("AA")
+        tree = self.huffman.tree
+        self.assertEqual(tree.get_code(tree.leaves["A"]), (1, 1))
+        self.assertEqual(tree.get_code(tree.nyt), (0, 1))
+
+    def test_weights_follow_positions_after_updates(self):
+        self.huffman.compress(self.text * 3)
+        tree = self.huffman.tree
+        weights = tree.weights
+        self.assertEqual(weights[0], len(self.text) * 3)
+        self.assertListEqual(weights, sorted(weights, reverse=True))
+        for node, left in enumerate(tree.lefts):
+            if left:
+                right = tree.rights[node]
+                self.assertEqual(weights[node], weights[left] + weights[right])
+
+    def test_text_is_same_after_compression_and_decompression(self):
+        for text in ("", "A", self.text, "𐀀“A™B“𐀀"):
+            self.assertEqual(self.huffman.decompress(self.huffman.compress(text)), text)
+
+    def test_data_is_same_after_compression_and_decompression_in_binary_mode(self):
+        huffman = AdaptiveHuffman(binary=True)
+        for data in (b"", b"\x00", bytes(range(256)) * 2):
+            self.assertEqual(huffman.decompress(memoryview(huffman.compress(data))), data)
+        self.assertEqual(huffman.name, "Huffman-adaptive-bytes")
+
+    def test_compress_stream_writes_same_data_as_compress(self):
+        text = self.text + "𐀀" * 20
+        writer = io.BytesIO()
+        self.huffman.compress_stream(io.StringIO(text), writer, chunk_size=5)
+        self.assertEqual(writer.getvalue(), AdaptiveHuffman().compress(text))
+
+    def test_text_is_same_after_stream_compression_and_decompression(self):
+        for chunk_size in (1, 2, 7):
+            compressed = io.BytesIO(self.huffman.compress(self.text * 10))
+            decompressed = io.StringIO()
+            self.huffman.decompress_stream(compressed, decompressed, chunk_size=chunk_size)
+            self.assertEqual(decompressed.getvalue(), self.text * 10)
+
+    def test_iterate_bits_stops_at_bit_count(self):
+        self.assertListEqual(list(iterate_bits(b"\xa5\xff", 10)), [1, 0, 1, 0, 0, 1, 0, 1, 1, 1])
+
+    def test_compress_in_blocks(self):
+        compressor = BlockCompressor(AdaptiveHuffman(), block_size=7, max_workers=1)
+        self.assertEqual(compressor.decompress(compressor.compress(self.text)), self.text)
+
+    @given(st.text())
+    def test_compression_decompression_consistency(self, text):
+        huffman = AdaptiveHuffman()
+        assert huffman.decompress(huffman.compress(text)) == text
+
+    @given(st.binary())
+    def test_compression_decompression_consistency_in_binary_mode(self, data):
+        huffman = AdaptiveHuffman(binary=True)
+        assert huffman.decompress(huffman.compress(data)) == data
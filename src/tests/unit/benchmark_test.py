@@ -0,0 +1,83 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from benchmark import (CSV_FIELDS, benchmark_file, find_regressions, main, measure,
+                       run_benchmarks, summarize, write_csv, write_json)
+from algorithms.huffman import HuffmanCoding
+from algorithms.lzw import LZW
+
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.results = run_benchmarks([HuffmanCoding(), LZW(max_bits=12, binary=True)],
+                                      ["sample1.txt"], repetitions=3, warmup=1)
+
+    def test_measure_calls_function_for_warmup_and_repetitions(self):
+        calls = []
+        samples, result = measure(calls.append, "A", repetitions=4, warmup=2)
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(len(samples), 4)
+        self.assertIsNone(result)
+
+    def test_summarize(self):
+        stats = summarize([4_000_000, 1_000_000, 2_000_000, 3_000_000], 5_000_000)
+        self.assertAlmostEqual(stats["median_ms"], 2.5)
+        self.assertAlmostEqual(stats["p95_ms"], 4.0)
+        self.assertAlmostEqual(stats["stddev_ms"], 1.2910, places=4)
+        self.assertAlmostEqual(stats["throughput_mb_s"], 2000.0)
+
+    def test_benchmark_file(self):
+        result = benchmark_file(HuffmanCoding(), "sample1.txt", repetitions=2, warmup=0)
+        self.assertEqual(result["algorithm"], "Huffman")
+        self.assertEqual(result["original_size"], 18)
+        self.assertEqual(result["compressed_size"], 15)
+        self.assertTrue(all(field in result for field in CSV_FIELDS))
+
+    def test_run_benchmarks_returns_result_for_each_algorithm(self):
+        self.assertListEqual([result["algorithm"] for result in self.results],
+                             ["Huffman", "LZW-12-bytes"])
+
+    def test_write_json_and_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "results.json")
+            csv_path = os.path.join(directory, "results.csv")
+            write_json(self.results, json_path)
+            write_csv(self.results, csv_path)
+            with open(json_path, encoding="utf-8") as file:
+                self.assertListEqual(json.load(file), self.results)
+            with open(csv_path, encoding="utf-8") as file:
+                rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 2)
+        self.assertListEqual(list(rows[0]), CSV_FIELDS)
+
+    def test_find_regressions(self):
+        baseline = [dict(result) for result in self.results]
+        self.assertListEqual(find_regressions(self.results, baseline), [])
+        baseline[0]["compress_median_ms"] = self.results[0]["compress_median_ms"] / 2
+        baseline[1]["compressed_size"] -= 1
+        regressions = find_regressions(self.results, baseline, threshold=0.5)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("Huffman sample1.txt: compress_median_ms"))
+        self.assertTrue(regressions[1].startswith("LZW-12-bytes sample1.txt: compressed_size"))
+
+    def test_repetitions_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            measure(len, "text", repetitions=0)
+        for arguments in (["--repetitions", "0"], ["--warmup", "-1"]):
+            with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+                main(["sample1.txt", *arguments])
+
+    def test_main_returns_error_code_after_regression(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            self.assertEqual(main(["sample1.txt", "--repetitions", "1", "--json", path]), 0)
+            with open(path, encoding="utf-8") as file:
+                baseline = json.load(file)
+            for result in baseline:
+                result["compressed_size"] = 0
+            write_json(baseline, path)
+            self.assertEqual(main(["sample1.txt", "--repetitions", "1", "--baseline", path]), 1)
@@ -0,0 +1,62 @@
+import unittest
+from utilities.bitstream import (BitWriter, bytes_to_bit_string, read_frame, unpack_fixed_width,
+                                 write_frame)
+
+
+class TestBitWriter(unittest.TestCase):
+    def setUp(self):
+        self.writer = BitWriter()
+
+    def test_write_pads_last_byte_with_zeros(self):
+        self.writer.write(0b101, 3)
+        self.assertEqual(self.writer.getvalue(), bytes([0b10100000]))
+
+    def test_write_values_across_byte_boundaries(self):
+        self.writer.write(0b1, 1)
+        self.writer.write(0b0000000011, 10)
+        self.writer.write(0b11111, 5)
+        self.assertEqual(self.writer.getvalue(), bytes([0b10000000, 0b01111111]))
+
+    def test_len_returns_number_of_written_bits(self):
+        self.writer.write(0, 70)
+        self.writer.write(1, 3)
+        self.assertEqual(len(self.writer), 73)
+
+    def test_write_symbols(self):
+        codes = {"A": (0b0, 1), "B": (0b10, 2), "C": (0b11, 2)}
+        self.writer.write_symbols("ABCA" * 20, codes)
+        expected = "010110" * 20
+        self.assertEqual(bytes_to_bit_string(self.writer.getvalue())[:120], expected)
+        self.assertEqual(len(self.writer), 120)
+
+    def test_write_symbols_in_context(self):
+        codes = {None: {"A": (0b0, 1), "B": (0b1, 1)},
+                 "A": {"A": (0b00, 2), "B": (0b01, 2)},
+                 "B": {"A": (0b1, 1), "B": (0b0, 1)}}
+        context = self.writer.write_symbols_in_context("ABBA", codes, None)
+        self.assertEqual(context, "A")
+        self.assertEqual(self.writer.getvalue(), bytes([0b00101000]))
+
+    def test_bytes_to_bit_string(self):
+        self.assertEqual(bytes_to_bit_string(bytes([1, 255])), "0000000111111111")
+
+    def test_frame_is_same_after_writing_and_reading(self):
+        for header in ("", "101", "1" * 16):
+            writer = write_frame(header, 42)
+            writer.write(0b1, 1)
+            data = writer.getvalue()
+            self.assertEqual(read_frame(data), (header, 42, len(data) - 1))
+
+    def test_unpack_fixed_width(self):
+        values = list(range(0, 1000, 7))
+        self.writer.write(0, 3)
+        self.writer.write_fixed_width(values, 10)
+        result = unpack_fixed_width(self.writer.getvalue(), 10, 3, len(values))
+        self.assertListEqual(result.tolist(), values)
+
+    def test_take_bytes_leaves_incomplete_byte(self):
+        self.writer.write(0b1010101011, 10)
+        self.assertEqual(self.writer.take_bytes(), bytes([0b10101010]))
+        self.writer.write(0b111111, 6)
+        self.assertEqual(self.writer.take_bytes(), bytes([0b11111111]))
+        self.assertEqual(self.writer.getvalue(), b"")
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from algorithms.block_compressor import BlockCompressor
+from algorithms.huffman import HuffmanCoding
+from algorithms.lzw import LZW
+
+
+class TestBlockCompressor(unittest.TestCase):
+    def setUp(self):
+        self.text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 40
+
+    def test_name_of_block_compressor(self):
+        self.assertEqual(BlockCompressor(LZW(max_bits=12)).name, "LZW-12-blocks")
+
+    def test_block_size_must_be_positive(self):
+        for block_size in (0, -5):
+            with self.assertRaises(ValueError):
+                BlockCompressor(HuffmanCoding(), block_size=block_size)
+
+    def test_split_blocks(self):
+        compressor = BlockCompressor(HuffmanCoding(), block_size=4)
+        self.assertListEqual(compressor.split_blocks("ABCDEFGHIJ"), ["ABCD", "EFGH", "IJ"])
+
+    def test_index_contains_parameters_for_each_block(self):
+        compressor = BlockCompressor(LZW(), block_size=300, max_workers=1)
+        complete_data = compressor.compress(self.text)
+        blocks = compressor.parse_index(complete_data)
+        self.assertEqual(len(blocks), 4)
+        self.assertListEqual([block[0] for block in blocks], [0, 300, 600, 900])
+        self.assertListEqual(blocks[0][3]["extra_supported_symbols"], ["𐀀"])
+
+    def test_text_is_same_after_compression_and_decompression_with_huffman(self):
+        compressor = BlockCompressor(HuffmanCoding(canonical=True), block_size=100,
+                                     max_workers=2)
+        complete_data = compressor.compress(self.text)
+        self.assertEqual(compressor.decompress(complete_data), self.text)
+
+    def test_text_is_same_after_compression_and_decompression_with_lzw(self):
+        compressor = BlockCompressor(LZW(max_bits=10), block_size=100, max_workers=2)
+        complete_data = compressor.compress(self.text)
+        self.assertEqual(compressor.decompress(complete_data), self.text)
+
+    def test_blocks_are_processed_serially_in_worker_process(self):
+        compressor = BlockCompressor(LZW(max_bits=10), block_size=100)
+        self.assertTrue(compressor._uses_pool(2))
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            self.assertFalse(executor.submit(compressor._uses_pool, 2).result())
+
+    def test_empty_text(self):
+        compressor = BlockCompressor(HuffmanCoding())
+        self.assertEqual(compressor.decompress(compressor.compress("")), "")
+
+    def test_decompress_range(self):
+        compressor = BlockCompressor(LZW(max_bits=10), block_size=100, max_workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "archive.bin")
+            with open(path, "wb") as file:
+                file.write(compressor.compress(self.text))
+            self.assertEqual(compressor.decompress_range(path, 150, 420), self.text[150:420])
+            self.assertEqual(compressor.decompress_range(path, 0, 5), self.text[:5])
+            self.assertEqual(compressor.decompress_range(path, 990, 2000), self.text[990:])
+            self.assertEqual(compressor.decompress_range(path, 50, 50), "")
+
+    def test_decompress_from_memoryview(self):
+        compressor = BlockCompressor(HuffmanCoding(), block_size=100, max_workers=2)
+        complete_data = memoryview(compressor.compress(self.text))
+        self.assertEqual(compressor.decompress(complete_data), self.text)
+
+    def test_data_is_same_after_compression_and_decompression_in_binary_mode(self):
+        data = self.text.encode("utf-8")
+        compressor = BlockCompressor(LZW(max_bits=10, binary=True), block_size=100,
+                                     max_workers=2)
+        self.assertEqual(compressor.decompress(compressor.compress(data)), data)
@@ -0,0 +1,168 @@
+import json
+import os
+import tempfile
+import unittest
+from argparse import Namespace
+from contextlib import redirect_stderr, redirect_stdout
+from io import BytesIO, StringIO, TextIOWrapper
+from unittest.mock import patch
+from cli import (ALGORITHMS, compress_data, create_algorithm, create_output_path,
+                 decompress_data, expand_paths, main)
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.text = "Vaka vanha Väinämöinen\nlaulaja iän-ikuinen\n" * 50
+        self.paths = []
+        for name in ("a.txt", "b.txt"):
+            path = os.path.join(self.directory.name, name)
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(self.text + name)
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _options(self, algorithm, **options):
+        return {"algorithm": algorithm, "engine": None, "max_bits": None,
+                "max_code_length": None, "binary": False, "block_size": None, **options}
+
+    def _read(self, path):
+        with open(path, "rb") as file:
+            return file.read()
+
+    def test_compress_and_decompress_data_with_each_algorithm(self):
+        data = self.text.encode("utf-8")
+        for algorithm in ALGORITHMS:
+            for binary in (False, True):
+                compressed_data = compress_data(data, self._options(algorithm, binary=binary))
+                self.assertEqual(decompress_data(compressed_data), data)
+
+    def test_compress_and_decompress_data_with_lzw_options(self):
+        data = self.text.encode("utf-8")
+        options = self._options("lzw", engine="integer", max_bits=12, block_size=100)
+        self.assertEqual(decompress_data(compress_data(data, options)), data)
+
+    def test_create_algorithm_rejects_unsupported_options(self):
+        with self.assertRaises(ValueError):
+            create_algorithm(self._options("range", max_bits=12))
+        with self.assertRaises(ValueError):
+            create_algorithm(self._options("lzw", max_code_length=12))
+        with self.assertRaises(ValueError):
+            create_algorithm(self._options("unknown"))
+
+    def test_decompress_data_rejects_other_data(self):
+        with self.assertRaises(ValueError):
+            decompress_data(self.text.encode("utf-8"))
+
+    def test_decompress_data_rejects_unknown_algorithm(self):
+        header = json.dumps({"options": {"algorithm": "unknown"}, "parameters": {}}).encode()
+        with self.assertRaises(ValueError):
+            decompress_data(len(header).to_bytes(8, "big") + header)
+        header = json.dumps({"parameters": {}}).encode()
+        with self.assertRaises(ValueError):
+            decompress_data(len(header).to_bytes(8, "big") + header)
+
+    def test_expand_paths(self):
+        pattern = os.path.join(self.directory.name, "*.txt")
+        missing = os.path.join(self.directory.name, "missing.txt")
+        self.assertListEqual(expand_paths([pattern, missing, "-"]),
+                             self.paths + [missing, "-"])
+
+    def test_create_output_path(self):
+        options = Namespace(output=None, output_dir="out")
+        self.assertEqual(create_output_path("dir/a.txt", options, True),
+                         os.path.join("out", "a.txt.bin"))
+        self.assertEqual(create_output_path("dir/a.txt.bin", options, False),
+                         os.path.join("out", "a.txt"))
+        self.assertEqual(create_output_path("dir/a.txt", options, False),
+                         os.path.join("out", "a.txt.out"))
+        self.assertEqual(create_output_path("-", options, True), "-")
+
+    def test_main_compresses_and_decompresses_glob(self):
+        pattern = os.path.join(self.directory.name, "*.txt")
+        output_dir = os.path.join(self.directory.name, "out")
+        self.assertEqual(main(["compress", pattern, "-a", "lzw", "--max-bits", "12"]), 0)
+        self.assertEqual(main(["decompress", pattern + ".bin", "--output-dir", output_dir]), 0)
+        for path in self.paths:
+            self.assertEqual(self._read(os.path.join(output_dir, os.path.basename(path))),
+                             self._read(path))
+
+    def test_main_does_not_overwrite_without_force(self):
+        with redirect_stderr(StringIO()) as errors:
+            self.assertEqual(main(["compress", self.paths[0]]), 0)
+            self.assertEqual(main(["compress", self.paths[0]]), 1)
+            self.assertEqual(main(["compress", self.paths[0], "--force"]), 0)
+        self.assertIn("a.txt", errors.getvalue())
+
+    def test_main_rejects_output_with_many_inputs(self):
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+            main(["compress", *self.paths, "-o", "out.bin"])
+
+    def test_main_bench_writes_json(self):
+        path = os.path.join(self.directory.name, "results.json")
+        with redirect_stdout(StringIO()) as output:
+            self.assertEqual(main(["bench", self.paths[0], "-a", "range", "--repetitions", "1",
+                                   "--warmup", "0", "--json", path]), 0)
+        with open(path, encoding="utf-8") as file:
+            results = json.load(file)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["algorithm"], "RangeCoder")
+        self.assertEqual(results[0]["file"], self.paths[0])
+        self.assertIn("RangeCoder", output.getvalue())
+
+    def test_main_bench_reads_standard_input_once(self):
+        path = os.path.join(self.directory.name, "results.json")
+        data = self.text.encode("utf-8")
+        with patch("sys.stdin", TextIOWrapper(BytesIO(data))), redirect_stdout(StringIO()):
+            self.assertEqual(main(["bench", "-", "--repetitions", "1", "--warmup", "0",
+                                   "--json", path]), 0)
+        with open(path, encoding="utf-8") as file:
+            results = json.load(file)
+        self.assertGreater(len(results), 1)
+        for result in results:
+            self.assertEqual(result["original_size"], len(data))
+
+    def test_main_rejects_unknown_algorithm(self):
+        with redirect_stderr(StringIO()) as errors, self.assertRaises(SystemExit):
+            main(["bench", self.paths[0], "-a", "unknown"])
+        self.assertIn("invalid choice", errors.getvalue())
+
+    def test_main_rejects_non_positive_numbers(self):
+        for arguments in (["--block-size", "0"], ["--block-size", "-5"], ["--max-bits", "0"],
+                          ["--max-code-length", "-1"]):
+            with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+                main(["compress", self.paths[0], *arguments])
+        with redirect_stderr(StringIO()), self.assertRaises(SystemExit):
+            main(["bench", self.paths[0], "--repetitions", "0"])
+
+    def test_main_keeps_directories_under_output_dir(self):
+        for directory in ("x", "y"):
+            os.makedirs(os.path.join(self.directory.name, "tree", directory))
+            with open(os.path.join(self.directory.name, "tree", directory, "n.txt"), "w",
+                      encoding="utf-8") as file:
+                file.write(directory)
+        pattern = os.path.join(self.directory.name, "tree", "**", "*.txt")
+        output_dir = os.path.join(self.directory.name, "pk")
+        self.assertEqual(main(["compress", pattern, "--output-dir", output_dir]), 0)
+        for directory in ("x", "y"):
+            path = os.path.join(output_dir, directory, "n.txt.bin")
+            self.assertEqual(decompress_data(self._read(path)), directory.encode())
+
+    def test_main_compresses_empty_file_in_batch(self):
+        empty_path = os.path.join(self.directory.name, "empty.txt")
+        open(empty_path, "w", encoding="utf-8").close()
+        for algorithm in ALGORITHMS:
+            output_dir = os.path.join(self.directory.name, algorithm)
+            self.assertEqual(main(["compress", empty_path, self.paths[0], "-a", algorithm,
+                                   "--output-dir", output_dir]), 0)
+            self.assertEqual(decompress_data(
+                self._read(os.path.join(output_dir, "empty.txt.bin"))), b"")
+
+    def test_main_continues_after_unexpected_error(self):
+        with patch("cli.compress_data", side_effect=[KeyError("x"), b"data"]), \
+                redirect_stderr(StringIO()) as errors:
+            self.assertEqual(main(["compress", *self.paths]), 1)
+        self.assertIn("KeyError", errors.getvalue())
+        self.assertEqual(self._read(self.paths[1] + ".bin"), b"data")
@@ -1,12 +1,18 @@
 import unittest
 import os
-from compression_comparator import CompressionComparator
+from compression_comparator import TRACED_PEAK_COLUMNS, CompressionComparator
 from utilities.filehandler import FileHandler
+from utilities.instrumentation import instrument
 from utilities.utils import FILE_DIRECTORY, list_non_empty_text_files
 from algorithms.huffman import HuffmanCoding
+from algorithms.context_huffman import ContextHuffman
 from algorithms.lzw import LZW
 
 
+def measured_values(stats):
+    return [value for i, value in enumerate(stats) if i not in TRACED_PEAK_COLUMNS]
+
+
 class TestCompressionComparator(unittest.TestCase):
     def setUp(self):
         self.all_text_files = list_non_empty_text_files()
@@ -44,6 +50,88 @@ class TestCompressionComparator(unittest.TestCase):
         self.assertGreater(lzw_stats[5], 0.0)
         self.assertGreater(lzw_stats[6], 0.0)
 
+    def test_compare_variants_of_algorithm(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        huffman = HuffmanCoding()
+        huffman_limited = HuffmanCoding(max_code_length=4)
+        compression_stats = comparator.compare(huffman, huffman_limited)
+
+        self.assertListEqual([stats[0] for stats in compression_stats],
+                             ["Huffman", "Huffman-L4"])
+        for stats in compression_stats:
+            self.assertFalse(None in measured_values(stats))
+        self._tear_down(filehandler)
+
+    def test_compare_algorithms_in_binary_mode(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        compression_stats = comparator.compare(
+            HuffmanCoding(binary=True), LZW(max_bits=12, binary=True))
+
+        self.assertListEqual([stats[0] for stats in compression_stats],
+                             ["Huffman-bytes", "LZW-12-bytes"])
+        for stats in compression_stats:
+            self.assertFalse(None in measured_values(stats))
+        self._tear_down(filehandler)
+
+    def test_compare_context_huffman_with_order0_baseline(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        compression_stats = comparator.compare(HuffmanCoding(), ContextHuffman())
+
+        self.assertListEqual([stats[0] for stats in compression_stats],
+                             ["Huffman", "Huffman-order1"])
+        for stats in compression_stats:
+            self.assertFalse(None in measured_values(stats))
+        self._tear_down(filehandler)
+
+    def test_compare_collects_phases_when_instrumented(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        with instrument():
+            comparator.compare(HuffmanCoding(), LZW())
+
+        phases = [(stats[0], stats[2], stats[3]) for stats in comparator.phase_stats]
+        self.assertIn(("Huffman", "compress", "encode_text"), phases)
+        self.assertIn(("Huffman", "decompress", "decode"), phases)
+        self.assertIn(("LZW", "compress", "encode"), phases)
+        self.assertIn(("LZW", "decompress", "unpack_codes"), phases)
+        for stats in comparator.phase_stats:
+            self.assertEqual(stats[1], "sample1.txt")
+            self.assertGreaterEqual(stats[4], 0.0)
+        self._tear_down(filehandler)
+
+    def test_compare_collects_no_phases_when_not_instrumented(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        comparator.compare(HuffmanCoding())
+
+        self.assertListEqual(comparator.phase_stats, [])
+        self._tear_down(filehandler)
+
+    def test_compare_reports_memory_peaks(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        stats = comparator.compare(HuffmanCoding())[0]
+
+        self.assertEqual(len(stats), 11)
+        self.assertGreater(stats[7], 0.0)
+        self.assertGreater(stats[9], 0.0)
+        self.assertIsNone(stats[8])
+        self.assertIsNone(stats[10])
+        self._tear_down(filehandler)
+
+    def test_compare_reports_traced_peaks_when_instrumented(self):
+        filehandler = FileHandler("sample1.txt")
+        comparator = CompressionComparator(filehandler)
+        with instrument():
+            stats = comparator.compare(LZW())[0]
+
+        self.assertGreater(stats[8], 0.0)
+        self.assertGreater(stats[10], 0.0)
+        self._tear_down(filehandler)
+
     def test_benchmark_decompress_returns_None_after_decompression_error_huffman(self):
         filename = self.all_text_files[0][1]
         filehandler = FileHandler(filename)
@@ -56,6 +144,7 @@ class TestCompressionComparator(unittest.TestCase):
         self.assertEqual(decompression_results[4], None)
         self.assertEqual(decompression_results[5], None)
         self.assertEqual(decompression_results[6], None)
+        self.assertEqual(decompression_results[10], None)
         self._tear_down(filehandler)
 
     def test_benchmark_decompress_returns_None_after_decompression_error_lzw(self):
@@ -70,6 +159,7 @@ class TestCompressionComparator(unittest.TestCase):
         self.assertEqual(decompression_results[4], None)
         self.assertEqual(decompression_results[5], None)
         self.assertEqual(decompression_results[6], None)
+        self.assertEqual(decompression_results[10], None)
         self._tear_down(filehandler)
 
     def test_list_only_non_empty_text_files(self):
@@ -0,0 +1,61 @@
+import random
+import unittest
+import hypothesis.strategies as st
+from hypothesis import given
+from algorithms.context_huffman import ContextHuffman
+from algorithms.huffman import HuffmanCoding
+
+
+class TestContextHuffman(unittest.TestCase):
+    def setUp(self):
+        self.text = "TOBEORNOTTOBEORTOBEORNOT"
+        self.huffman = ContextHuffman(min_context_count=1)
+
+    def test_count_contexts(self):
+        frequencies = ContextHuffman(min_context_count=1).count_contexts("ABCD" * 1000)
+        self.assertDictEqual(frequencies, {None: {"A": 1}, "A": {"B": 1000}, "B": {"C": 1000},
+                                           "C": {"D": 1000}, "D": {"A": 999}})
+
+    def test_rare_contexts_are_merged_into_fallback_table(self):
+        frequencies = ContextHuffman(min_context_count=3).count_contexts("ABAC")
+        self.assertDictEqual(frequencies, {None: {"A": 2, "B": 1, "C": 1}})
+
+    def test_context_without_savings_is_merged_into_fallback_table(self):
+        generator = random.Random(0)
+        text = "".join(generator.choice("ABCDEFGHIJKLMNOP") for _ in range(2000))
+        frequencies = ContextHuffman(min_context_count=1).count_contexts(text)
+        self.assertNotIn("A", frequencies)
+        frequencies = ContextHuffman(min_context_count=1).count_contexts("AB" * 500)
+        self.assertNotIn("A", frequencies)
+
+    def test_header_is_same_after_encoding_and_parsing(self):
+        self.huffman.compress(self.text * 50 + "𐀀")
+        context_codes = self.huffman.context_codes
+        self.assertDictEqual(self.huffman.parse_header(self.huffman.encode_header()),
+                             context_codes)
+
+    def test_text_is_same_after_compression_and_decompression(self):
+        for text in ("", "A", "AB", self.text, self.text * 100 + "𐀀“A™B“𐀀"):
+            self.assertEqual(self.huffman.decompress(self.huffman.compress(text)), text)
+        self.assertEqual(self.huffman.name, "Huffman-order1")
+
+    def test_compresses_text_with_strong_context_better_than_order0(self):
+        text = "".join(chr(65 + (i * 7) % 26) for i in range(5000))
+        compressed_data = ContextHuffman().compress(text)
+        self.assertLess(len(compressed_data), len(HuffmanCoding().compress(text)) // 2)
+
+    def test_long_codes_are_decoded_with_subtables(self):
+        text = "".join(chr(65 + i) * (1 << i) for i in range(14)) * 4
+        huffman = ContextHuffman(min_context_count=1)
+        self.assertEqual(huffman.decompress(huffman.compress(text)), text)
+
+    def test_data_is_same_after_compression_and_decompression_in_binary_mode(self):
+        huffman = ContextHuffman(binary=True)
+        for data in (b"", b"\x00", bytes(range(256)) * 50):
+            self.assertEqual(huffman.decompress(memoryview(huffman.compress(data))), data)
+        self.assertEqual(huffman.name, "Huffman-order1-bytes")
+
+    @given(st.text(), st.integers(min_value=1, max_value=4))
+    def test_compression_decompression_consistency(self, text, min_context_count):
+        huffman = ContextHuffman(min_context_count=min_context_count, max_code_length=12)
+        assert huffman.decompress(huffman.compress(text)) == text
@@ -0,0 +1,62 @@
+import unittest
+from algorithms.decode_table import DecodeTable
+from utilities.bitstream import BitWriter
+
+
+class TestDecodeTable(unittest.TestCase):
+    def setUp(self):
+        self.codes = {"A": (0b10, 2), "B": (0b000, 3), "C": (0b11, 2),
+                      "D": (0b001, 3), "E": (0b01, 2)}
+        self.text = "AAAAAABCCCCCCDDEEEEE"
+
+    def _encode(self, text, codes, padding=0):
+        writer = BitWriter()
+        writer.write(0, padding)
+        writer.write_symbols(text, codes)
+        return len(writer), writer.getvalue()
+
+    def test_primary_entry_contains_multiple_symbols(self):
+        table = DecodeTable(self.codes, table_bits=8)
+        self.assertEqual(table.symbols[0b10101010], "AAAA")
+        self.assertEqual(table.lengths[0b10101010], 8)
+
+    def test_single_symbol_entries(self):
+        table = DecodeTable(self.codes, table_bits=8, multi_symbol=False)
+        self.assertEqual(table.symbols[0b10101010], "A")
+        self.assertEqual(table.lengths[0b10101010], 2)
+
+    def test_decode(self):
+        end, data = self._encode(self.text * 10, self.codes)
+        table = DecodeTable(self.codes, table_bits=4)
+        self.assertEqual(table.decode(data, 0, end), self.text * 10)
+
+    def test_decode_from_unaligned_start(self):
+        end, data = self._encode(self.text, self.codes, padding=5)
+        table = DecodeTable(self.codes)
+        self.assertEqual(table.decode(data, 5, end), self.text)
+
+    def test_decode_codes_longer_than_table_bits(self):
+        codes = {"A": (0b0, 1), "B": (0b10, 2), "C": (0b110, 3),
+                 "D": (0b11100, 5), "E": (0b11101, 5), "F": (0b1111, 4)}
+        text = "ABCDEFFEDCBA" * 30
+        end, data = self._encode(text, codes)
+        table = DecodeTable(codes, table_bits=2)
+        self.assertEqual(len(table.subtables), 1)
+        self.assertEqual(table.decode(data, 0, end), text)
+
+    def test_decode_symbol_resolves_short_and_long_codes(self):
+        codes = {"A": (0b0, 1), "B": (0b10, 2), "C": (0b110, 3), "D": (0b111, 3)}
+        table = DecodeTable(codes, table_bits=2, multi_symbol=False)
+        self.assertEqual(table.decode_symbol(0b1011, 4), ("B", 2))
+        self.assertEqual(table.decode_symbol(0b1101, 4), ("C", 3))
+
+    def test_decode_empty_range(self):
+        table = DecodeTable(self.codes)
+        self.assertEqual(table.decode(b"\x00", 8, 8), "")
+
+    def test_decode_partial_leaves_incomplete_code(self):
+        end, data = self._encode(self.text, self.codes)
+        table = DecodeTable(self.codes, table_bits=4)
+        decoded, position = table.decode_partial(data, 0, end)
+        self.assertGreater(position, end - 4)
+        self.assertEqual(decoded + table.decode(data, position, end), self.text)
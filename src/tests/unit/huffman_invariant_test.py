@@ -5,6 +5,7 @@ import heapq
 import math
 import unittest
 
+from algorithms.canonical_codes import calculate_limited_code_lengths
 from algorithms.huffman import HuffmanCoding, Node
 
 
@@ -69,6 +70,20 @@ class TestInvariantHuffmanCoding(unittest.TestCase):
         decompressed_text = huffman.decompress(compressed_text)
         assert decompressed_text == text
 
+    @given(st.text(min_size=1))
+    def test_canonical_compression_decompression_consistency(self, text):
+        huffman = HuffmanCoding(canonical=True)
+        compressed_text = huffman.compress(text)
+        decompressed_text = huffman.decompress(compressed_text)
+        assert decompressed_text == text
+
+    @given(st.dictionaries(st.characters(), st.integers(min_value=1), min_size=1, max_size=64),
+           st.integers(min_value=6, max_value=12))
+    def test_limited_code_lengths_consistency(self, frequency_dict, max_code_length):
+        code_lengths = calculate_limited_code_lengths(frequency_dict, max_code_length)
+        assert max(code_lengths.values()) <= max_code_length
+        assert sum(2 ** -length for length in code_lengths.values()) <= 1
+
     @given(st.text(min_size=1))
     def test_len_header_consistency_multiple_compressions(self, text):
         huffman = HuffmanCoding()
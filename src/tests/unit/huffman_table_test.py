@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from algorithms.huffman import HuffmanCoding
+from algorithms.huffman_table import HuffmanTable, load_huffman_table, train_huffman_table
+
+
+class TestHuffmanTable(unittest.TestCase):
+    def setUp(self):
+        self.samples = ["TOBEORNOTTOBEORTOBEORNOT", "AAAAAABCCCCCCDDEEEEE"]
+        self.table = train_huffman_table([sample * 100 for sample in self.samples], table_id=7,
+                                         max_code_length=15)
+
+    def test_trained_table_contains_all_latin1_characters(self):
+        self.assertTrue(all(chr(i) in self.table.code_lengths for i in range(256)))
+        self.assertLessEqual(max(self.table.code_lengths.values()), 15)
+
+    def test_table_id_must_fit_into_header(self):
+        with self.assertRaises(ValueError):
+            HuffmanTable(1 << 16, {"A": 1})
+
+    def test_save_and_load(self):
+        table = train_huffman_table(["𐀀AB"], table_id=3)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.json")
+            table.save(path)
+            loaded = load_huffman_table(path)
+        self.assertEqual(loaded.table_id, 3)
+        self.assertDictEqual(loaded.code_lengths, table.code_lengths)
+
+    def test_compress_with_table_stores_only_table_id(self):
+        huffman = HuffmanCoding(table=self.table)
+        text = "TOBEORNOTTOBEORTOBEORNOT"
+        compressed_data = huffman.compress(text)
+        self.assertTrue(huffman.table_used)
+        self.assertEqual(huffman.header, "1" + format(7, "016b"))
+        self.assertLess(len(compressed_data), len(HuffmanCoding().compress(text)))
+        self.assertEqual(huffman.decompress(compressed_data), text)
+        self.assertEqual(huffman.name, "Huffman-table-7")
+
+    def test_compress_falls_back_to_inline_header(self):
+        huffman = HuffmanCoding(table=self.table)
+        text = "TOBEORNOT𐀀"
+        compressed_data = huffman.compress(text)
+        self.assertFalse(huffman.table_used)
+        self.assertEqual(huffman.decompress(compressed_data), text)
+
+    def test_decompress_with_different_table_raises_error(self):
+        compressed_data = HuffmanCoding(table=self.table).compress("TOBE")
+        huffman = HuffmanCoding(table=train_huffman_table(self.samples, table_id=8))
+        huffman.set_parameters({"min_bits": 8, "min_bits_char": 0})
+        with self.assertRaises(ValueError):
+            huffman.decompress(compressed_data)
+
+    def test_table_in_binary_mode(self):
+        table = train_huffman_table([b"\x00\x01\x02"], table_id=1, binary=True)
+        huffman = HuffmanCoding(binary=True, table=table)
+        data = bytes(range(256))
+        self.assertEqual(huffman.decompress(huffman.compress(data)), data)
+        with self.assertRaises(ValueError):
+            HuffmanCoding(table=table)
@@ -1,5 +1,7 @@
+import io
 import unittest
-from algorithms.huffman import HuffmanCoding
+from algorithms.canonical_codes import calculate_limited_code_lengths, create_canonical_codes
+from algorithms.huffman import HuffmanCoding, Node
 import heapq
 
 
@@ -14,6 +16,18 @@ class TestHuffmanCoding(unittest.TestCase):
         result = self.huffman.create_frequency_dict(self.text)
         self.assertDictEqual(result, expected_result)
 
+    def test_create_frequency_dict_updates_given_frequencies(self):
+        frequency = self.huffman.create_frequency_dict("AAB")
+        result = self.huffman.create_frequency_dict("BC", frequency)
+        self.assertDictEqual(result, {"A": 2, "B": 2, "C": 1})
+        self.assertListEqual(list(result), ["A", "B", "C"])
+
+    def test_create_frequency_dict_in_parallel(self):
+        text = self.text * 50
+        result = self.huffman.create_frequency_dict_in_parallel(text, max_workers=3, min_size=0)
+        self.assertDictEqual(result, self.huffman.create_frequency_dict(text))
+        self.assertListEqual(list(result), ["A", "B", "C", "D", "E"])
+
     def test_bit_string_defaults_to_zero(self):
         expected_result = {"A": "0"}
         huffman = HuffmanCoding()
@@ -62,23 +76,22 @@ class TestHuffmanCoding(unittest.TestCase):
         self.assertEqual(self.huffman.header, expected)
 
     def test_creating_complete_data(self):
-        expected = "00110001000001110000010100000000001010000101010001001010001010101000001101000011000001010101010100001111111111110010010101010101"
+        expected = bytes.fromhex("3107050028544a2a834305550fff2555")
         self.huffman.build_huffman_tree(self.text)
         self.huffman.create_bit_strings_dict()
         result = self.huffman.create_complete_data(self.text)
         self.assertEqual(result, expected)
 
     def test_extract_data(self):
-        complete_compressed_data = "00110001000001110000010100000000001010000101010001001010001010101000001101000011000001010101010100001111111111110010010101010101"
+        complete_compressed_data = bytes.fromhex("3107050028544a2a834305550fff2555")
         expected_header_data = "0001010000101010001001010001010101000001101000011"
-        expected_actual_data = "1010101010100001111111111110010010101010101"
+        expected_data_starting_index = 85
         self.huffman.min_bits = 8
-        header_result, actual_data_result = self.huffman.parse_data(
+        header_result, data_starting_index_result = self.huffman.parse_data(
             complete_compressed_data)
-        print(header_result)
-        print(actual_data_result)
         self.assertTupleEqual(
-            (header_result, actual_data_result), (expected_header_data, expected_actual_data))
+            (header_result, data_starting_index_result),
+            (expected_header_data, expected_data_starting_index))
 
     def test_rebuild_huffman_tree(self):
         self.huffman.min_bits_char = 8
@@ -103,7 +116,7 @@ class TestHuffmanCoding(unittest.TestCase):
         self.assertEqual(result, expected)
 
     def test_compress(self):
-        expected_result = "00110001000001110000010100000000001010000101010001001010001010101000001101000011000001010101010100001111111111110010010101010101"
+        expected_result = bytes.fromhex("3107050028544a2a834305550fff2555")
         result = self.huffman.compress(self.text)
         self.assertEqual(result, expected_result)
 
@@ -111,7 +124,7 @@ class TestHuffmanCoding(unittest.TestCase):
         expected_result = self.text
         self.huffman.min_bits_char = 8
         self.huffman.min_bits = 8
-        compressed_data = "00110001000001110000010100000000001010000101010001001010001010101000001101000011000001010101010100001111111111110010010101010101"
+        compressed_data = bytes.fromhex("3107050028544a2a834305550fff2555")
         result = self.huffman.decompress(compressed_data)
         self.assertEqual(result, expected_result)
 
@@ -175,3 +188,114 @@ class TestHuffmanCoding(unittest.TestCase):
         compressed_text = huffman.compress(text)
         decompressed_text = huffman.decompress(compressed_text)
         self.assertEqual(decompressed_text, text)
+
+    def test_calculate_code_lengths(self):
+        self.huffman.build_huffman_tree(self.text)
+        expected = {"B": 3, "D": 3, "E": 2, "A": 2, "C": 2}
+        self.assertDictEqual(self.huffman.calculate_code_lengths(), expected)
+
+    def test_calculate_code_lengths_of_deep_tree(self):
+        root = Node("0")
+        for i in range(1, 5000):
+            merged = Node(None, i)
+            merged.left = Node(str(i))
+            merged.right = root
+            root = merged
+        self.huffman.root = root
+        code_lengths = self.huffman.calculate_code_lengths()
+        self.assertEqual(code_lengths["0"], 4999)
+        self.assertEqual(code_lengths["4999"], 1)
+
+    def test_create_canonical_codes(self):
+        code_lengths = {"B": 3, "D": 3, "E": 2, "A": 2, "C": 2}
+        expected_codes = {"A": (0b00, 2), "C": (0b01, 2), "E": (0b10, 2),
+                          "B": (0b110, 3), "D": (0b111, 3)}
+        self.huffman.codes = create_canonical_codes(code_lengths)
+        self.assertDictEqual(self.huffman.codes, expected_codes)
+        self.assertEqual(self.huffman.bit_strings["D"], "111")
+
+    def test_encode_and_parse_canonical_header(self):
+        huffman = HuffmanCoding(canonical=True)
+        huffman.compress(self.text)
+        expected = {"B": 3, "D": 3, "E": 2, "A": 2, "C": 2}
+        self.assertEqual(len(huffman.header), 59)
+        self.assertDictEqual(huffman.canonical_codes.parse_header(huffman.header), expected)
+
+    def test_text_is_same_after_canonical_compression_and_decompression(self):
+        huffman = HuffmanCoding(canonical=True)
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀"
+        compressed_text = huffman.compress(text)
+        decompressed_text = huffman.decompress(compressed_text)
+        self.assertEqual(huffman.name, "Huffman-canonical")
+        self.assertEqual(decompressed_text, text)
+
+    def test_calculate_limited_code_lengths(self):
+        frequency = {"A": 1, "B": 1, "C": 2, "D": 4, "E": 8}
+        expected = {"A": 3, "B": 3, "C": 3, "D": 3, "E": 1}
+        self.assertDictEqual(calculate_limited_code_lengths(frequency, 3), expected)
+
+    def test_calculate_limited_code_lengths_raises_error_with_too_many_characters(self):
+        frequency = {"A": 1, "B": 1, "C": 2, "D": 4, "E": 8}
+        with self.assertRaises(ValueError):
+            calculate_limited_code_lengths(frequency, 2)
+
+    def test_compress_limits_code_lengths(self):
+        huffman = HuffmanCoding(max_code_length=4)
+        text = "A" + "B" + "C" * 2 + "D" * 4 + "E" * 8 + "F" * 16 + "G" * 32
+        compressed_text = huffman.compress(text)
+        self.assertEqual(huffman.name, "Huffman-L4")
+        self.assertEqual(max(length for _, length in huffman.codes.values()), 4)
+        self.assertEqual(huffman.decompress(compressed_text), text)
+
+    def test_decode_table_is_indexed_with_longest_code(self):
+        huffman = HuffmanCoding(max_code_length=40)
+        compressed_text = huffman.compress("hello world")
+        header_data, _ = huffman.parse_data(compressed_text)
+        longest = max(length for _, length in huffman.codes.values())
+        self.assertEqual(huffman.create_decode_table(header_data).table_bits, longest)
+        self.assertEqual(huffman.decompress(compressed_text), "hello world")
+
+    def test_empty_text_is_same_after_compression_and_decompression(self):
+        for huffman in (HuffmanCoding(), HuffmanCoding(canonical=True),
+                        HuffmanCoding(binary=True)):
+            text = b"" if huffman.binary else ""
+            self.assertEqual(huffman.decompress(huffman.compress(text)), text)
+
+    def test_zero_bytes_are_same_after_compression_and_decompression(self):
+        for huffman, text in ((HuffmanCoding(binary=True), b"\x00" * 3000),
+                              (HuffmanCoding(), "\x00" * 30)):
+            self.assertEqual(huffman.decompress(huffman.compress(text)), text)
+            self.assertEqual(huffman.get_min_bits_char(), 8)
+
+    def test_max_code_length_must_fit_header(self):
+        for max_code_length in (0, -1, 256):
+            with self.assertRaises(ValueError):
+                HuffmanCoding(max_code_length=max_code_length)
+
+    def test_compress_stream_writes_same_data_as_compress(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 20
+        writer = io.BytesIO()
+        self.huffman.compress_stream(io.StringIO(text), writer, chunk_size=7)
+        self.assertEqual(writer.getvalue(), HuffmanCoding().compress(text))
+
+    def test_text_is_same_after_stream_compression_and_decompression(self):
+        huffman = HuffmanCoding(canonical=True)
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 20
+        compressed = io.BytesIO()
+        huffman.compress_stream(io.StringIO(text), compressed, chunk_size=7)
+        compressed.seek(0)
+        decompressed = io.StringIO()
+        huffman.decompress_stream(compressed, decompressed, chunk_size=3)
+        self.assertEqual(decompressed.getvalue(), text)
+
+    def test_decompress_from_memoryview(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 20
+        compressed_text = self.huffman.compress(text)
+        self.assertEqual(self.huffman.decompress(memoryview(compressed_text)), text)
+
+    def test_text_is_same_after_compression_and_decompression_in_binary_mode(self):
+        data = bytes(range(256)) + b"\x00\xff" * 50
+        for huffman in (HuffmanCoding(binary=True), HuffmanCoding(canonical=True, binary=True)):
+            compressed_data = huffman.compress(data)
+            self.assertEqual(huffman.decompress(compressed_data), data)
+        self.assertEqual(huffman.name, "Huffman-canonical-bytes")
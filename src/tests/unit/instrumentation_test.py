@@ -0,0 +1,109 @@
+import unittest
+import tracemalloc
+from utilities import instrumentation
+from utilities.instrumentation import get_recorder, instrument, phase, track_memory
+from algorithms.huffman import HuffmanCoding
+from algorithms.lzw import LZW
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.text = "ABRACADABRA" * 100
+
+    def test_disabled_phase_records_nothing(self):
+        self.assertIsNone(get_recorder())
+        with phase("count_frequencies", 10) as record:
+            record.bytes_out = 5
+        self.assertIs(phase("decode"), phase("encode"))
+
+    def test_instrument_restores_disabled_state(self):
+        with instrument() as recorder:
+            self.assertIs(get_recorder(), recorder)
+            self.assertTrue(tracemalloc.is_tracing())
+        self.assertIsNone(get_recorder())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_phase_records_time_and_sizes(self):
+        with instrument() as recorder:
+            with phase("allocate", 3) as record:
+                data = [0] * 100000
+                record.bytes_out = len(data)
+        records = recorder.take_records()
+
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0].name, "allocate")
+        self.assertEqual(records[0].bytes_in, 3)
+        self.assertEqual(records[0].bytes_out, 100000)
+        self.assertGreater(records[0].time_ns, 0)
+        self.assertGreaterEqual(records[0].memory_peak, 800000)
+        self.assertEqual(recorder.take_records(), [])
+
+    def test_nested_phase_peak_is_included_in_outer_phase(self):
+        with instrument() as recorder:
+            with phase("outer"):
+                with phase("inner"):
+                    data = [0] * 100000
+                    del data
+        inner, outer = recorder.take_records()
+
+        self.assertEqual(inner.name, "inner")
+        self.assertEqual(outer.name, "outer")
+        self.assertGreaterEqual(outer.memory_peak, inner.memory_peak)
+        self.assertGreaterEqual(inner.memory_peak, 800000)
+
+    def test_track_memory_without_tracing_measures_rss_peak_only(self):
+        with track_memory() as memory:
+            data = bytearray(10000000)
+            del data
+
+        self.assertGreater(memory.rss_peak, 0)
+        self.assertIsNone(memory.traced_peak)
+
+    def test_track_memory_inside_phase(self):
+        with instrument() as recorder:
+            with phase("outer"):
+                with track_memory() as memory:
+                    data = [0] * 100000
+                    del data
+        outer = recorder.take_records()[0]
+
+        self.assertGreaterEqual(memory.traced_peak, 800000)
+        self.assertGreaterEqual(outer.memory_peak, memory.traced_peak)
+
+    def test_huffman_phases(self):
+        huffman = HuffmanCoding()
+        with instrument() as recorder:
+            compressed_data = huffman.compress(self.text)
+            compress_records = recorder.take_records()
+            huffman.decompress(compressed_data)
+            decompress_records = recorder.take_records()
+
+        self.assertListEqual([record.name for record in compress_records],
+                             ["count_frequencies", "build_tree", "create_codes",
+                              "write_header", "encode_text"])
+        self.assertListEqual([record.name for record in decompress_records],
+                             ["parse_header", "create_decode_table", "decode"])
+        self.assertEqual(compress_records[0].bytes_in, len(self.text))
+        self.assertEqual(compress_records[0].bytes_out, 5)
+        self.assertEqual(compress_records[-1].bytes_out, len(compressed_data))
+        self.assertEqual(decompress_records[-1].bytes_out, len(self.text))
+
+    def test_lzw_phases(self):
+        lzw = LZW(max_bits=12)
+        with instrument() as recorder:
+            compressed_data = lzw.compress(self.text)
+            compress_records = recorder.take_records()
+            lzw.decompress(compressed_data)
+            decompress_records = recorder.take_records()
+
+        self.assertListEqual([record.name for record in compress_records],
+                             ["find_symbols", "init_table", "encode", "write_codes"])
+        self.assertListEqual([record.name for record in decompress_records],
+                             ["init_table", "unpack_codes", "decode"])
+        self.assertEqual(compress_records[2].bytes_out, compress_records[3].bytes_in)
+        self.assertEqual(compress_records[3].bytes_out, len(compressed_data))
+        self.assertEqual(decompress_records[1].bytes_out, compress_records[2].bytes_out)
+        self.assertEqual(decompress_records[-1].bytes_out, len(self.text))
+
+    def test_environment_variable_name(self):
+        self.assertEqual(instrumentation.INSTRUMENTATION_ENV, "COMPRESSION_INSTRUMENTATION")
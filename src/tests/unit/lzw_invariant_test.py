@@ -1,9 +1,12 @@
 import hypothesis.strategies as st
 from hypothesis import given
+import io
 import unittest
 import math
 
 from algorithms.lzw import LZW
+from algorithms.lzw_integer import encode_with_integer_keys
+from algorithms.lzw_preset import LZWPreset
 from utilities.utils import calculate_min_bits_needed
 
 
@@ -32,13 +35,69 @@ class TestInvariantLZW(unittest.TestCase):
 
     @given(st.text(min_size=1))
     def test_compression_decompression_consistency_with_extra_symbols(self, text):
-        extra_supported_symbols = self._find_extra_symbols(text)
         lzw = LZW()
+        compressed_text = lzw.compress(text)
+        decompressed_text = lzw.decompress(compressed_text)
+        assert decompressed_text == text
+
+    @given(st.text(min_size=1), st.integers(min_value=9, max_value=12))
+    def test_compression_decompression_consistency_with_bounded_dictionary(self, text, max_bits):
+        extra_supported_symbols = self._find_extra_symbols(text)
+        lzw = LZW(max_bits=max_bits)
+        lzw.set_extra_supported_symbols(extra_supported_symbols)
+        compressed_text = lzw.compress(text)
+        decompressed_text = lzw.decompress(compressed_text)
+        assert decompressed_text == text
+
+    @given(st.text(min_size=1), st.one_of(st.none(), st.integers(min_value=9, max_value=10)))
+    def test_integer_engine_produces_same_codes(self, text, max_bits):
+        extra_supported_symbols = self._find_extra_symbols(text)
+        codes = []
+        for engine in ("string", "integer"):
+            lzw = LZW(max_bits=max_bits, engine=engine)
+            lzw.set_extra_supported_symbols(extra_supported_symbols)
+            lzw._init_table(compress=True)
+            if engine == "string":
+                codes.append(lzw.encode(text))
+            else:
+                codes.append(encode_with_integer_keys(lzw, text))
+        assert codes[0] == codes[1]
+
+    @given(st.text(min_size=1), st.one_of(st.none(), st.integers(min_value=9, max_value=10)))
+    def test_integer_engine_compression_decompression_consistency(self, text, max_bits):
+        extra_supported_symbols = self._find_extra_symbols(text)
+        lzw = LZW(max_bits=max_bits, engine="integer")
         lzw.set_extra_supported_symbols(extra_supported_symbols)
         compressed_text = lzw.compress(text)
         decompressed_text = lzw.decompress(compressed_text)
         assert decompressed_text == text
 
+    @given(st.text(min_size=1), st.integers(min_value=9, max_value=10),
+           st.integers(min_value=1, max_value=16))
+    def test_stream_compression_decompression_consistency(self, text, max_bits, chunk_size):
+        lzw = LZW(max_bits=max_bits)
+        compressed = io.BytesIO()
+        lzw.compress_stream(io.StringIO(text, newline=""), compressed, chunk_size)
+        compressed.seek(0)
+        decompressed = io.StringIO(newline="")
+        lzw.decompress_stream(compressed, decompressed, chunk_size)
+        assert decompressed.getvalue() == text
+
+    @given(st.binary(min_size=1), st.one_of(st.none(), st.integers(min_value=9, max_value=10)),
+           st.sampled_from(("string", "integer")))
+    def test_binary_mode_compression_decompression_consistency(self, data, max_bits, engine):
+        lzw = LZW(max_bits=max_bits, engine=engine, binary=True)
+        compressed_data = lzw.compress(data)
+        assert lzw.decompress(compressed_data) == data
+
+    @given(st.text(min_size=1), st.one_of(st.none(), st.integers(min_value=9, max_value=10)),
+           st.sampled_from(("string", "integer")))
+    def test_preset_compression_decompression_consistency(self, text, max_bits, engine):
+        preset = LZWPreset(["ab", "ab𐀀", "ba"])
+        lzw = LZW(max_bits=max_bits, engine=engine, preset=preset)
+        compressed_text = lzw.compress(text)
+        assert lzw.decompress(compressed_text) == text
+
     @given(st.lists(st.characters(min_codepoint=256), min_size=1))
     def test_set_extra_supported_symbols(self, extra_symbols):
         lzw = LZW()
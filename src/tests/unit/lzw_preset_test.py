@@ -0,0 +1,80 @@
+import io
+import os
+import tempfile
+import unittest
+from algorithms.lzw import LZW
+from algorithms.lzw_preset import LZWPreset, load_lzw_preset, train_lzw_preset
+
+
+class TestLZWPreset(unittest.TestCase):
+    def setUp(self):
+        self.samples = ["TOBEORNOTTOBEORTOBEORNOT" * 20, "AAAAAABCCCCCCDDEEEEE" * 20]
+        self.preset = train_lzw_preset(self.samples, max_phrases=100)
+
+    def test_trained_phrases_are_prefix_closed(self):
+        phrases = self.preset.phrases
+        self.assertLessEqual(len(phrases), 100)
+        self.assertIn("TOBE", phrases)
+        for index, phrase in enumerate(phrases):
+            self.assertGreater(len(phrase), 1)
+            if len(phrase) > 2:
+                self.assertIn(phrase[:-1], phrases[:index])
+
+    def test_phrase_without_prefix_raises_error(self):
+        with self.assertRaises(ValueError):
+            LZWPreset(["ABC"])
+        with self.assertRaises(ValueError):
+            LZWPreset(["A"])
+
+    def test_save_and_load(self):
+        preset = LZWPreset(["A𐀀", "A𐀀B"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "preset.json")
+            preset.save(path)
+            loaded = load_lzw_preset(path)
+        self.assertListEqual(loaded.phrases, preset.phrases)
+        self.assertFalse(loaded.binary)
+
+    def test_init_table_adds_phrases_after_clear_code(self):
+        lzw = LZW(max_bits=12, preset=LZWPreset(["TO", "TOB"]))
+        lzw._init_table(compress=True)
+        self.assertEqual(lzw.get_table()["TO"], 257)
+        self.assertEqual(lzw.get_table()["TOB"], 258)
+        self.assertEqual(lzw.code_space.get_first_free_code(), 259)
+
+    def test_preset_shortens_small_texts(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT"
+        for max_bits in (None, 12):
+            for engine in ("string", "integer"):
+                lzw = LZW(max_bits=max_bits, engine=engine, preset=self.preset)
+                compressed_text = lzw.compress(text)
+                self.assertLess(len(compressed_text), len(LZW(max_bits=max_bits).compress(text)))
+                self.assertEqual(lzw.decompress(compressed_text), text)
+        self.assertEqual(lzw.name, "LZW-12-integer-preset")
+
+    def test_engines_produce_same_codes_with_preset(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 50
+        compressed_text = LZW(max_bits=9, preset=self.preset).compress(text)
+        lzw = LZW(max_bits=9, engine="integer", preset=self.preset)
+        self.assertEqual(lzw.compress(text), compressed_text)
+        self.assertEqual(lzw.decompress(compressed_text), text)
+
+    def test_stream_compression_with_preset(self):
+        lzw = LZW(max_bits=10, preset=LZWPreset(["A𐀀", "A𐀀A"]))
+        text = "A𐀀A𐀀BA" * 100
+        compressed = io.BytesIO()
+        lzw.compress_stream(io.StringIO(text), compressed, chunk_size=7)
+        self.assertEqual(compressed.getvalue(), lzw.compress(text))
+        compressed.seek(0)
+        decompressed = io.StringIO()
+        lzw.decompress_stream(compressed, decompressed, chunk_size=3)
+        self.assertEqual(decompressed.getvalue(), text)
+
+    def test_preset_in_binary_mode(self):
+        preset = train_lzw_preset([b"\x00\x01\x02" * 50], max_phrases=20, binary=True)
+        data = b"\x00\x01\x02" * 10 + bytes(range(256))
+        for engine in ("string", "integer"):
+            lzw = LZW(engine=engine, binary=True, preset=preset)
+            self.assertEqual(lzw.decompress(lzw.compress(data)), data)
+        with self.assertRaises(ValueError):
+            LZW(preset=preset)
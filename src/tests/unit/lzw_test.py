@@ -1,5 +1,7 @@
+import io
 import unittest
 from algorithms.lzw import LZW
+from algorithms.lzw_integer import decode_text_with_arrays, encode_with_integer_keys
 from utilities.utils import calculate_min_bits_needed
 
 
@@ -22,6 +24,12 @@ class TestLZW(unittest.TestCase):
         result_table = self.lzw.get_table()
         self.assertDictEqual(result_table, expected_table)
 
+    def test_reset_table_removes_added_sequences(self):
+        self.lzw.reset_table(compress=True)
+        self.lzw.encode(self.text)
+        self.lzw.reset_table(compress=True)
+        self.assertDictEqual(self.lzw.get_table(), {chr(i): i for i in range(256)})
+
     def test_encode(self):
         self.lzw._init_table(compress=True)
         expected = [87, 89, 83, 42, 256, 71, 256, 258, 262, 262, 71]
@@ -30,22 +38,22 @@ class TestLZW(unittest.TestCase):
 
     def test_create_header(self):
         self.lzw._init_table(compress=True)
-        expected_result = "0000010100000001010111001011001001010011000101010100000000001000111100000000100000010100000110100000110001000111"
+        expected_result = bytes.fromhex("05015cb253154008f008141a0c47")
         encoded_text = self.lzw.encode(self.text)
         result = self.lzw.create_header(encoded_text)
         self.assertEqual(result, expected_result)
 
     def test_parse_data(self):
-        expected = "000000000001010111000000000001011001000000000001010011000000000000101010000000000100000111000000000001000111000000000100000111000000000100001001000000000100001101000000000100001101000000000001000111"
-        header_data = "0000001000000000000001010111000000000001011001000000000001010011000000000000101010000000000100000111000000000001000111000000000100000111000000000100001001000000000100001101000000000100001101000000000001000111"
-        result = self.lzw.parse_data(header_data)
+        expected = 13
+        complete_data = bytes.fromhex("05015cb253154008f008141a0c47")
+        result = self.lzw.parse_data(complete_data)
         self.assertEqual(result, expected)
 
     def test_decode_data(self):
-        data = "001010111001011001001010011000101010100000000001000111100000000100000010100000110100000110001000111"
-        decoded_data = self.lzw.decode_data(data)
+        complete_data = bytes.fromhex("05015cb253154008f008141a0c47")
+        decoded_data = self.lzw.decode_data(complete_data, 13)
         expected_data = [87, 89, 83, 42, 256, 71, 256, 258, 262, 262, 71]
-        self.assertListEqual(decoded_data, expected_data)
+        self.assertListEqual(decoded_data.tolist(), expected_data)
 
     def test_decode_text(self):
         self.lzw._init_table(compress=False)
@@ -55,14 +63,14 @@ class TestLZW(unittest.TestCase):
         self.assertEqual(result, expected_result)
 
     def test_compress(self):
-        expected_result = "0000010100000001010111001011001001010011000101010100000000001000111100000000100000010100000110100000110001000111"
+        expected_result = bytes.fromhex("05015cb253154008f008141a0c47")
         result = self.lzw.compress(self.text)
         self.assertEqual(result, expected_result)
 
     def test_decompress(self):
         self.lzw._init_table(compress=False)
         expected_result = self.text
-        binary_data_array = "0000010100000001010111001011001001010011000101010100000000001000111100000000100000010100000110100000110001000111"
+        binary_data_array = bytes.fromhex("05015cb253154008f008141a0c47")
         result = self.lzw.decompress(binary_data_array)
         self.assertEqual(result, expected_result)
 
@@ -120,9 +128,119 @@ class TestLZW(unittest.TestCase):
 
     def test_text_is_same_after_compression_and_decompression_with_large_unicode_value(self):
         text = "𐀀"
-        extra_symbols = ["𐀀"]
         lzw = LZW()
-        lzw.set_extra_supported_symbols(extra_symbols)
         compressed_text = lzw.compress(text)
         decompressed_text = lzw.decompress(compressed_text)
         self.assertEqual(decompressed_text, text)
+
+    def test_compress_finds_extra_symbols(self):
+        lzw = LZW()
+        lzw.compress("“A™B“𐀀")
+        self.assertListEqual(lzw.extra_supported_symbols, ["“", "™", "𐀀"])
+
+    def test_encode_with_bounded_dictionary(self):
+        lzw = LZW(max_bits=9)
+        lzw._init_table(compress=True)
+        text = "".join(chr(i) for i in range(256)) * 2
+        encoded = lzw.encode(text)
+        clear_code = lzw.code_space.get_clear_code()
+        self.assertEqual(clear_code, 256)
+        self.assertEqual(encoded.count(clear_code), 1)
+        self.assertEqual(encoded[:256], list(range(256)))
+        self.assertEqual(encoded[256], clear_code)
+
+    def test_code_limit_raises_error_if_initial_characters_do_not_fit(self):
+        lzw = LZW(max_bits=9)
+        lzw.set_extra_supported_symbols([chr(i) for i in range(256, 512)])
+        with self.assertRaises(ValueError):
+            lzw.code_space.get_code_limit()
+
+    def test_variable_width_codes_grow_with_dictionary(self):
+        lzw = LZW(max_bits=12)
+        code_values = [65] * 300
+        complete_data = lzw.write_variable_width_codes(code_values)
+        widths = [9] * 256 + [10] * 44
+        self.assertEqual(len(complete_data), (sum(widths) + 7) // 8)
+        self.assertListEqual(lzw.decode_variable_width_data(complete_data).tolist(), code_values)
+
+    def test_text_is_same_after_compression_and_decompression_with_bounded_dictionary(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT" * 100
+        lzw = LZW(max_bits=9)
+        compressed_text = lzw.compress(text)
+        decompressed_text = lzw.decompress(compressed_text)
+        self.assertEqual(lzw.name, "LZW-9")
+        self.assertEqual(decompressed_text, text)
+
+    def test_encode_with_integer_keys(self):
+        self.lzw._init_table(compress=True)
+        expected = [87, 89, 83, 42, 256, 71, 256, 258, 262, 262, 71]
+        encoded_array = encode_with_integer_keys(self.lzw, self.text)
+        self.assertListEqual(encoded_array, expected)
+        self.assertEqual(self.lzw.next_code, 266)
+
+    def test_unknown_engine_raises_error(self):
+        with self.assertRaises(ValueError):
+            LZW(engine="unknown")
+
+    def test_text_is_same_after_compression_and_decompression_with_integer_engine(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT"
+        lzw = LZW(engine="integer")
+        compressed_text = lzw.compress(text)
+        self.assertEqual(compressed_text, LZW().compress(text))
+        self.assertEqual(lzw.name, "LZW-integer")
+        self.assertEqual(lzw.decompress(compressed_text), text)
+
+    def test_decode_text_with_arrays(self):
+        self.lzw._init_table(compress=False)
+        decoded_data = [87, 89, 83, 42, 256, 71, 256, 258, 262, 262, 71]
+        result = decode_text_with_arrays(self.lzw, decoded_data)
+        self.assertEqual(result, self.text)
+
+    def test_decode_text_with_arrays_with_repeated_sequence(self):
+        text = "A" * 100 + "𐀀" * 50
+        lzw = LZW(engine="integer")
+        lzw.set_extra_supported_symbols(["𐀀"])
+        compressed_text = lzw.compress(text)
+        self.assertEqual(lzw.decompress(compressed_text), text)
+
+    def test_compress_stream_writes_same_data_as_compress(self):
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 20
+        writer = io.BytesIO()
+        LZW(max_bits=9).compress_stream(io.StringIO(text), writer, chunk_size=7)
+        self.assertEqual(writer.getvalue(), LZW(max_bits=9).compress(text))
+
+    def test_text_is_same_after_stream_compression_and_decompression(self):
+        lzw = LZW(max_bits=9)
+        text = "TOBEORNOTTOBEORTOBEORNOT𐀀" * 100
+        compressed = io.BytesIO()
+        lzw.compress_stream(io.StringIO(text), compressed, chunk_size=7)
+        compressed.seek(0)
+        decompressed = io.StringIO()
+        lzw.decompress_stream(compressed, decompressed, chunk_size=3)
+        self.assertEqual(decompressed.getvalue(), text)
+
+    def test_stream_compression_requires_bounded_dictionary(self):
+        with self.assertRaises(ValueError):
+            self.lzw.compress_stream(io.StringIO(self.text), io.BytesIO())
+
+    def test_decompress_from_memoryview(self):
+        for lzw in (LZW(), LZW(max_bits=9, engine="integer")):
+            compressed_text = lzw.compress(self.text)
+            self.assertEqual(lzw.decompress(memoryview(compressed_text)), self.text)
+
+    def test_data_is_same_after_compression_and_decompression_in_binary_mode(self):
+        data = self.text.encode("utf-8") * 20 + bytes(range(256))
+        for lzw in (LZW(binary=True), LZW(max_bits=9, engine="integer", binary=True)):
+            compressed_data = lzw.compress(data)
+            self.assertEqual(lzw.decompress(compressed_data), data)
+        self.assertEqual(lzw.name, "LZW-9-integer-bytes")
+
+    def test_binary_mode_produces_same_codes_as_text_mode(self):
+        text = "TOBEORNOTTOBEORTOBEORNOTÄ"
+        lzw = LZW(binary=True)
+        self.assertEqual(lzw.compress(text.encode("latin-1")), self.lzw.compress(text))
+
+    def test_empty_text_is_same_after_compression_and_decompression(self):
+        for lzw in (LZW(), LZW(max_bits=12), LZW(binary=True)):
+            text = b"" if lzw.binary else ""
+            self.assertEqual(lzw.decompress(lzw.compress(text)), text)
@@ -0,0 +1,54 @@
+import unittest
+import os
+from compression_comparator import TRACED_PEAK_COLUMNS
+from main import (benchmark_algorithm, create_automatic_algorithms, run_automatic_benchmarks,
+                  update_table)
+from utilities.utils import FILE_DIRECTORY
+from algorithms.huffman import HuffmanCoding
+
+
+def measured_values(row):
+    return [value for i, value in enumerate(row) if i not in TRACED_PEAK_COLUMNS]
+
+
+class TestAutomaticStart(unittest.TestCase):
+    def setUp(self):
+        self.filenames = ["sample1.txt", "sample2.txt"]
+
+    def _constructed_files(self):
+        return [file for file in os.listdir(FILE_DIRECTORY)
+                if file.endswith("_decompressed.txt") or file.endswith(".bin")]
+
+    def test_benchmark_algorithm_removes_its_files(self):
+        result, phases = benchmark_algorithm("sample1.txt", HuffmanCoding())
+
+        self.assertEqual(result[0], "Huffman")
+        self.assertFalse(None in measured_values(result))
+        self.assertListEqual(phases, [])
+        self.assertListEqual(self._constructed_files(), [])
+
+    def test_parallel_results_are_in_order_of_files_and_algorithms(self):
+        table, _ = run_automatic_benchmarks(self.filenames, max_workers=2)
+        names = [algorithm.name for algorithm in create_automatic_algorithms()]
+
+        self.assertListEqual([(row[1], row[0]) for row in table],
+                             [(filename, name) for filename in self.filenames
+                              for name in names])
+        for row in table:
+            self.assertFalse(None in measured_values(row))
+        self.assertListEqual(self._constructed_files(), [])
+
+    def test_parallel_and_serial_sizes_are_equal(self):
+        parallel_table, _ = run_automatic_benchmarks(self.filenames, max_workers=2)
+        serial_table, _ = run_automatic_benchmarks(self.filenames, max_workers=1)
+
+        self.assertListEqual([row[:5] for row in parallel_table],
+                             [row[:5] for row in serial_table])
+
+    def test_update_table_keeps_measured_traced_peaks(self):
+        table = [["Huffman", "sample1.txt", 1.0, 0.5, 50.0, 0.1, 0.0, 10.0, 2.0, 0.0, 0.0]]
+        update_table(table, ["Huffman", "sample1.txt", 1.0, 0.0, 0.0, 0.0, 0.2, 0.0, 0.0,
+                             12.0, None])
+
+        self.assertListEqual(table[0], ["Huffman", "sample1.txt", 1.0, 0.5, 50.0, 0.1, 0.2,
+                                        10.0, 2.0, 12.0, 0.0])
@@ -0,0 +1,60 @@
+import random
+import unittest
+import hypothesis.strategies as st
+from collections import Counter
+from hypothesis import given
+from algorithms.huffman import HuffmanCoding
+from algorithms.range_coder import MIN_TOTAL_BITS, RangeCoder
+
+
+class TestRangeCoder(unittest.TestCase):
+    def setUp(self):
+        self.text = "TOBEORNOTTOBEORTOBEORNOT"
+        self.coder = RangeCoder()
+
+    def test_scaled_frequencies_sum_up_to_power_of_two(self):
+        frequencies = self.coder.scale_frequencies(Counter(self.text))
+        self.assertEqual(sum(frequencies.values()), 1 << MIN_TOTAL_BITS)
+        self.assertGreater(frequencies["O"], frequencies["B"])
+        self.assertTrue(all(frequency >= 1 for frequency in frequencies.values()))
+
+    def test_total_grows_with_number_of_characters(self):
+        frequencies = self.coder.scale_frequencies(Counter(map(chr, range(40000))))
+        self.assertEqual(self.coder.total_bits, 17)
+        self.assertEqual(sum(frequencies.values()), 1 << 17)
+
+    def test_header_is_same_after_encoding_and_parsing(self):
+        frequencies = self.coder.scale_frequencies(Counter(self.text + "𐀀"))
+        self.assertDictEqual(self.coder.parse_header(self.coder.encode_header()), frequencies)
+
+    def test_create_intervals(self):
+        self.coder.frequencies = {"B": 3, "A": 1}
+        self.assertDictEqual(self.coder.create_intervals(), {"A": (0, 1), "B": (1, 3)})
+
+    def test_text_is_same_after_compression_and_decompression(self):
+        for text in ("", "A", "AB", self.text, self.text * 100 + "𐀀“A™B“𐀀"):
+            self.assertEqual(self.coder.decompress(self.coder.compress(text)), text)
+        self.assertEqual(self.coder.name, "RangeCoder")
+
+    def test_skewed_text_is_compressed_below_one_bit_per_character(self):
+        text = "".join(random.Random(0).choices("AB", weights=[99, 1], k=20000))
+        compressed_data = self.coder.compress(text)
+        self.assertLess(len(compressed_data) * 8, len(text) // 4)
+        self.assertLess(len(compressed_data), len(HuffmanCoding().compress(text)) // 4)
+        self.assertEqual(self.coder.decompress(compressed_data), text)
+
+    def test_carry_is_propagated(self):
+        data = bytes(random.Random(1).choices(range(256), k=50000))
+        coder = RangeCoder(binary=True)
+        self.assertEqual(coder.decompress(memoryview(coder.compress(data))), data)
+        self.assertEqual(coder.name, "RangeCoder-bytes")
+
+    @given(st.text())
+    def test_compression_decompression_consistency(self, text):
+        coder = RangeCoder()
+        assert coder.decompress(coder.compress(text)) == text
+
+    @given(st.binary())
+    def test_compression_decompression_consistency_in_binary_mode(self, data):
+        coder = RangeCoder(binary=True)
+        assert coder.decompress(coder.compress(data)) == data
@@ -53,7 +53,8 @@ class UI:
         If the input is:
         - H : Huffman coding
         - L : Lempel-Ziv-Welch
-        - C : Compare both algorithms
+        - R : Range coder
+        - C : Compare all the algorithms
         - E : Exit
         If the input is anything else, the user will be prompted again.
 
@@ -61,13 +62,14 @@ class UI:
             algorithm (str): A character representing the chosen algorithm.
         """
         while True:
-            print("\nChoose one algorithm or both")
+            print("\nChoose one algorithm or all")
             algorithm = input(
                 "Press H: Huffman coding\n"
                 "Press L: LZW\n"
-                "Press C: Compare both\n"
+                "Press R: Range coder\n"
+                "Press C: Compare all\n"
                 "Press E: Exit\n").upper()
-            if algorithm in ["H", "L", "C", "E"]:
+            if algorithm in ["H", "L", "R", "C", "E"]:
                 return algorithm
             print("Invalid choice. Please enter a valid character.")
 
@@ -117,28 +119,51 @@ class UI:
 
         This method will create a prettyTable object that has field names
         Algorithm, Filename, Size, Compressed size, Compression ratio, Compression time,
-        Decompression time. Each algorithm that has not any None values are added to the table
-        as a row. If the algorithm has any None values, it is indicating a decompression error,
-        and it will be printed to the console.
+        Decompression time and the peak memory of the compression and the decompression.
+        Each algorithm is added to the table as a row. If the algorithm has None values in the
+        sizes, times or the compression RSS peak, it is indicating a decompression error, and it
+        will be printed to the console. A traced peak that was not measured is None, and it is
+        shown as n/a.
 
         Args:
             compression_stats (list): A list containing the compression statistics for each 
                                     algorithm. Each list element is a list with the format
                                     [algorithm name, filename, filesize, compressed filesize,
-                                    compression ratio, compression time, decompression time]
+                                    compression ratio, compression time, decompression time,
+                                    compression RSS peak, compression traced peak,
+                                    decompression RSS peak, decompression traced peak]
         """
         table = PrettyTable()
         table.field_names = ["Algorithm", "Filename", "Size (kB)", "Compressed size (kB)",
                              "Compression ratio (%)", "Compression time (s)",
-                             "Decompression time (s)"]
+                             "Decompression time (s)", "Compression RSS peak (kB)",
+                             "Compression traced peak (kB)", "Decompression RSS peak (kB)",
+                             "Decompression traced peak (kB)"]
         table.float_format = ".4"
 
         for algorithm_stats in compression_stats:
             if algorithm_stats is not None:
-                if self.has_none_value(algorithm_stats[3:]):
+                if self.has_none_value(algorithm_stats[3:8]):
                     algorithm_name = algorithm_stats[0]
                     print(
                         f"Decompressed filesize differs from the original "
                         f"with algorithm {algorithm_name}.")
-                table.add_row(algorithm_stats)
+                table.add_row(["n/a" if value is None else value for value in algorithm_stats])
+        print(str(table))
+
+    def display_phase_table(self, phase_stats):
+        """Print the measured phases of the algorithms to the user.
+
+        Args:
+            phase_stats (list): A list containing the measured phases. Each list element is a
+                                list with the format [algorithm name, filename, direction, phase,
+                                time, input size, output size, memory peak]
+        """
+        table = PrettyTable()
+        table.field_names = ["Algorithm", "Filename", "Direction", "Phase", "Time (s)",
+                             "Input size", "Output size", "Memory peak (kB)"]
+        table.float_format = ".4"
+
+        for phase_stats_row in phase_stats:
+            table.add_row(phase_stats_row)
         print(str(table))
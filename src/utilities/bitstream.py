@@ -0,0 +1,264 @@
+from array import array
+from utilities.utils import calculate_padding_length
+
+FRAME_LENGTH_BYTES = 8
+
+
+class BitWriter:
+    """Class that packs bits directly into an array of bytes.
+
+    Bits are collected into an integer accumulator and whole bytes are flushed into the
+    buffer as soon as enough bits are available, so the written data is never represented
+    as a string of "0" and "1" characters.
+
+    Attributes:
+        buffer (bytearray): The bytes written so far.
+        accumulator (int): The bits that have not been flushed into the buffer yet.
+        bit_count (int): The number of bits in the accumulator.
+    """
+
+    FLUSH_THRESHOLD = 64
+
+    def __init__(self):
+        """Create a new instance of BitWriter."""
+        self.buffer = bytearray()
+        self.accumulator = 0
+        self.bit_count = 0
+
+    def __len__(self):
+        """Return the total number of bits written so far.
+
+        Returns:
+            int: The number of bits written.
+        """
+        return len(self.buffer) * 8 + self.bit_count
+
+    def _flush(self):
+        """Move all the complete bytes from the accumulator into the buffer."""
+        byte_count = self.bit_count >> 3
+        if byte_count:
+            self.bit_count -= byte_count << 3
+            self.buffer += (self.accumulator >> self.bit_count).to_bytes(byte_count, "big")
+            self.accumulator &= (1 << self.bit_count) - 1
+
+    def write(self, value, width):
+        """Write the value using exactly the given number of bits.
+
+        Args:
+            value (int): The non-negative integer value to be written.
+            width (int): The number of bits used to represent the value.
+        """
+        self.accumulator = (self.accumulator << width) | value
+        self.bit_count += width
+        if self.bit_count >= self.FLUSH_THRESHOLD:
+            self._flush()
+
+    def write_symbols(self, symbols, codes):
+        """Write the code of each symbol in the given sequence.
+
+        This is the hot loop of the encoders, so the accumulator is kept in local variables
+        and the attributes are updated only once after all the symbols are written.
+
+        Args:
+            symbols (iterable): The symbols to be encoded.
+            codes (dict): A dictionary where keys are symbols and values are tuples
+                        of (code, length of the code in bits).
+        """
+        buffer = self.buffer
+        accumulator = self.accumulator
+        bit_count = self.bit_count
+        threshold = self.FLUSH_THRESHOLD
+
+        for symbol in symbols:
+            code, length = codes[symbol]
+            accumulator = (accumulator << length) | code
+            bit_count += length
+            if bit_count >= threshold:
+                byte_count = bit_count >> 3
+                bit_count -= byte_count << 3
+                buffer += (accumulator >> bit_count).to_bytes(byte_count, "big")
+                accumulator &= (1 << bit_count) - 1
+
+        self.accumulator = accumulator
+        self.bit_count = bit_count
+
+    def write_symbols_in_context(self, symbols, context_codes, context):
+        """Write the code of each symbol with the codes selected by the previous symbol.
+
+        Args:
+            symbols (iterable): The symbols to be encoded.
+            context_codes (dict): A dictionary where keys are previous symbols and values are
+                                dictionaries of codes like in the method write_symbols.
+            context: The context of the first symbol.
+
+        Returns:
+            The context after the last symbol, which is the last symbol itself.
+        """
+        buffer = self.buffer
+        accumulator = self.accumulator
+        bit_count = self.bit_count
+        threshold = self.FLUSH_THRESHOLD
+
+        for symbol in symbols:
+            code, length = context_codes[context][symbol]
+            context = symbol
+            accumulator = (accumulator << length) | code
+            bit_count += length
+            if bit_count >= threshold:
+                byte_count = bit_count >> 3
+                bit_count -= byte_count << 3
+                buffer += (accumulator >> bit_count).to_bytes(byte_count, "big")
+                accumulator &= (1 << bit_count) - 1
+
+        self.accumulator = accumulator
+        self.bit_count = bit_count
+
+        return context
+
+    def write_fixed_width(self, values, width):
+        """Write each value in the given sequence using the same number of bits.
+
+        Args:
+            values (iterable): The non-negative integer values to be written.
+            width (int): The number of bits used to represent each value.
+        """
+        buffer = self.buffer
+        accumulator = self.accumulator
+        bit_count = self.bit_count
+        threshold = self.FLUSH_THRESHOLD
+
+        for value in values:
+            accumulator = (accumulator << width) | value
+            bit_count += width
+            if bit_count >= threshold:
+                byte_count = bit_count >> 3
+                bit_count -= byte_count << 3
+                buffer += (accumulator >> bit_count).to_bytes(byte_count, "big")
+                accumulator &= (1 << bit_count) - 1
+
+        self.accumulator = accumulator
+        self.bit_count = bit_count
+
+    def take_bytes(self) -> bytes:
+        """Remove and return all the complete bytes written so far.
+
+        The bits of an incomplete byte stay in the accumulator, so the data can be written
+        out incrementally and the writer keeps only a few bytes in memory.
+
+        Returns:
+            bytes: The complete bytes written since the previous call.
+        """
+        self._flush()
+        data = bytes(self.buffer)
+        self.buffer.clear()
+
+        return data
+
+    def getvalue(self) -> bytes:
+        """Return the written data as bytes.
+
+        If the number of written bits is not dividable by 8, the last byte is padded
+        with zeros.
+
+        Returns:
+            bytes: The written data.
+        """
+        self._flush()
+        data = bytes(self.buffer)
+        if self.bit_count:
+            data += (self.accumulator << (8 - self.bit_count)).to_bytes(1, "big")
+
+        return data
+
+
+def bytes_to_bit_string(data) -> str:
+    """Format each byte to an 8-bit representation and concatenate them into one string.
+
+    Args:
+        data (bytes): The data to be formatted.
+
+    Returns:
+        str: The data as a string of binary data.
+    """
+    return "".join(format(byte, "08b") for byte in data)
+
+
+def write_frame(header: str, text_length: int) -> BitWriter:
+    """Write the frame of the compressed data into a new BitWriter.
+
+    The frame includes:
+    - The length of the header in bits (FRAME_LENGTH_BYTES bytes)
+    - The number of characters in the text (FRAME_LENGTH_BYTES bytes)
+    - The header, padded with zeros at the start to a whole number of bytes
+
+    Args:
+        header (str): The header as a string of binary data.
+        text_length (int): The number of characters in the text.
+
+    Returns:
+        BitWriter: The writer containing the frame, ready for the compressed data.
+    """
+    writer = BitWriter()
+    writer.write(len(header), FRAME_LENGTH_BYTES * 8)
+    writer.write(text_length, FRAME_LENGTH_BYTES * 8)
+    writer.write(int(header or "0", base=2), calculate_padding_length(len(header)) + len(header))
+
+    return writer
+
+
+def read_frame(data) -> tuple[str, int, int]:
+    """Read the frame written by the function write_frame from the start of the data.
+
+    Args:
+        data (bytes or memoryview): The complete data.
+
+    Returns:
+        tuple of (str, int, int): A tuple containing the header as a string of binary data,
+                                the number of characters in the text and the index of the byte
+                                where the compressed data starts.
+    """
+    header_length = int.from_bytes(data[:FRAME_LENGTH_BYTES], "big")
+    text_length = int.from_bytes(data[FRAME_LENGTH_BYTES:2 * FRAME_LENGTH_BYTES], "big")
+    padding_length = calculate_padding_length(header_length)
+    data_start = 2 * FRAME_LENGTH_BYTES + (padding_length + header_length) // 8
+    header = bytes_to_bit_string(data[2 * FRAME_LENGTH_BYTES:data_start])
+
+    return header[padding_length:], text_length, data_start
+
+
+UNPACK_BLOCK_SIZE = 64
+
+
+def unpack_fixed_width(data, width: int, start: int, count: int) -> array:
+    """Unpack values of the same width directly from the packed data.
+
+    The values are unpacked a block at a time. The bytes of a block are converted into one
+    integer, and the values are taken from it with shifts and a mask, so no string of binary
+    data is created.
+
+    Args:
+        data (bytes): The packed data.
+        width (int): The number of bits used to represent each value.
+        start (int): The index of the bit where the first value starts.
+        count (int): The number of values to unpack.
+
+    Returns:
+        array: An array of unsigned integers containing the unpacked values.
+    """
+    values = array("I")
+    mask = (1 << width) - 1
+    position = start
+
+    while count > 0:
+        block_size = min(count, UNPACK_BLOCK_SIZE)
+        block_bits = block_size * width
+        first_byte = position >> 3
+        last_byte = (position + block_bits + 7) >> 3
+        block = int.from_bytes(data[first_byte:last_byte], "big")
+        block >>= (last_byte << 3) - position - block_bits
+        values.extend([(block >> shift) & mask
+                       for shift in range(block_bits - width, -1, -width)])
+        position += block_bits
+        count -= block_size
+
+    return values
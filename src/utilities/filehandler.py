@@ -1,4 +1,6 @@
+import mmap
 import os.path
+from contextlib import contextmanager
 from utilities.utils import FILE_DIRECTORY
 
 
@@ -62,25 +64,16 @@ class FileHandler():
 
         return text
 
-    def find_extra_supported_symbols(self) -> list:
-        """Find all the symbols that are outside the range of 0-255 unicode points and are present
-        in the text.
-
-        This method is used before compressing with the LZW algorithm, so that the dictionary of
-        characters is initialized properly.
+    def read_file_as_bytes(self) -> bytes:
+        """Read a file and return its contents as bytes without decoding them.
 
         Returns:
-           extra_supported_symbols (list): A list containing all the symbols outside the range of
-                                        0-255 unicode points that are found in the text.
+            data (bytes): The content of the file.
         """
-        text = self.read_file()
-        extra_supported_symbols = []
-        for char in text:
-            unicode = ord(char)
-            if unicode > 255 and char not in extra_supported_symbols:
-                extra_supported_symbols.append(char)
+        with open(self.path, "rb") as file:
+            data = file.read()
 
-        return extra_supported_symbols
+        return data
 
     def remove_file(self, path):
         """Remove given file.
@@ -109,34 +102,48 @@ class FileHandler():
         The size of the new file will be stored into the attribute file_size.
 
         Args:
-            data (str): The decoded text to be written into the file.
+            data (str or bytes): The decoded text to be written into the file. Bytes are
+                                written as they are.
         """
         new_path = self.generate_new_path(
             f"_{algorithm_name}_decompressed.txt")
 
-        with open(new_path, "w", encoding="utf-8") as file:
-            file.write(data)
+        if isinstance(data, bytes):
+            with open(new_path, "wb") as file:
+                file.write(data)
+        else:
+            with open(new_path, "w", encoding="utf-8") as file:
+                file.write(data)
 
         self.set_file_size(os.path.getsize(new_path))
 
-    def read_binary_file(self, algorithm_name: str) -> str:
-        """Read a binary file and return its content as a string of binary data.
+    @contextmanager
+    def map_binary_data(self, algorithm_name: str):
+        """Map a binary file into memory and provide its content as a memoryview.
 
-        This method reads the content of the binary file, formats each byte to an 8-bit
-        representation, and concatenates them into a one string. The binary file is then removed.
+        The content is not read into memory, the pages of the file are loaded by the operating
+        system when the decoder reads them. The memoryview is valid only inside the with block,
+        and the binary file is removed after the block, also if the block raises an exception.
 
-        Returns:
-            binary_data: The content of the binary file formatted as a string.
+        Args:
+            algorithm_name (str): The name of the algorithm used for compressing the file.
+
+        Yields:
+            memoryview: A read-only view of the content of the binary file.
         """
         new_path = self.generate_new_path(f"_{algorithm_name}.bin")
-        with open(new_path, "rb") as file:
-            bytes_data = file.read()
-            binary_data = "".join(format(byte, "08b") for byte in bytes_data)
-
-        self.remove_file(new_path)
-        return binary_data
-
-    def write_data_to_binary_file(self, data: bytearray, algorithm_name: str):
+        try:
+            with open(new_path, "rb") as file:
+                if os.path.getsize(new_path) == 0:
+                    yield memoryview(b"")
+                else:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                        with memoryview(mapped_file) as bytes_data:
+                            yield bytes_data
+        finally:
+            self.remove_file(new_path)
+
+    def write_data_to_binary_file(self, data: bytes, algorithm_name: str):
         """Write given data to binary file.
 
         This method creates a new binary file with the same filename as original text file,
@@ -145,7 +152,7 @@ class FileHandler():
         The size of the new file will be stored into the attribute file_size.
 
         Args:
-            data (bytearray): The content to be written.
+            data (bytes): The content to be written.
         """
         new_path = self.generate_new_path(f"_{algorithm_name}.bin")
         with open(new_path, "wb") as file:
@@ -0,0 +1,279 @@
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+INSTRUMENTATION_ENV = "COMPRESSION_INSTRUMENTATION"
+PROC_STATUS = "/proc/self/status"
+PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+class PhaseRecord:
+    """Class for the measurements of one phase of an algorithm.
+
+    Attributes:
+        name (str): The name of the phase.
+        time_ns (int): The wall time of the phase in nanoseconds.
+        bytes_in (int): The size of the input of the phase, in characters, bytes or codes.
+        bytes_out (int): The size of the output of the phase, in characters, bytes or codes.
+        memory_peak (int): The largest amount of memory allocated during the phase in bytes,
+                        compared with the memory allocated when the phase started.
+        memory_delta (int): The amount of memory that stayed allocated after the phase in bytes.
+    """
+
+    __slots__ = ("name", "time_ns", "bytes_in", "bytes_out", "memory_peak", "memory_delta")
+
+    def __init__(self, name: str, bytes_in=0):
+        """Create a new PhaseRecord.
+
+        Args:
+            name (str): The name of the phase.
+            bytes_in (int, optional): The size of the input of the phase. Defaults to 0.
+        """
+        self.name = name
+        self.time_ns = 0
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+        self.memory_peak = 0
+        self.memory_delta = 0
+
+
+class MemoryRecord:
+    """Class for the memory measurements of one compression or decompression.
+
+    Attributes:
+        rss_peak (int): The peak resident set size of the process in bytes.
+        traced_peak (int): The largest amount of memory allocated by Python in bytes, compared
+                        with the memory allocated when the measurement started. It is None if
+                        tracemalloc was not tracing.
+    """
+
+    __slots__ = ("rss_peak", "traced_peak")
+
+    def __init__(self):
+        """Create a new MemoryRecord."""
+        self.rss_peak = 0
+        self.traced_peak = None
+
+
+class _DisabledPhase:
+    """Context returned for every phase when the instrumentation is disabled.
+
+    The same instance is used for all the phases, so a disabled phase does not allocate
+    anything or read the clock.
+    """
+
+    record = PhaseRecord("disabled")
+
+    def __enter__(self):
+        return self.record
+
+    def __exit__(self, *exception):
+        return False
+
+
+_DISABLED_PHASE = _DisabledPhase()
+
+
+_peaks = []
+
+
+def _start_traced_peak() -> int:
+    """Start measuring the tracemalloc peak of a nested measurement.
+
+    Tracemalloc has only one peak for the whole process, and it is reset when a measurement
+    starts. The peak of each open measurement is kept in a stack and updated from the
+    measurements nested inside it.
+
+    Returns:
+        int: The amount of memory allocated when the measurement started in bytes.
+    """
+    memory_start, peak = tracemalloc.get_traced_memory()
+    if _peaks:
+        _peaks[-1] = max(_peaks[-1], peak)
+    tracemalloc.reset_peak()
+    _peaks.append(memory_start)
+
+    return memory_start
+
+
+def _stop_traced_peak() -> tuple[int, int]:
+    """Stop the measurement started last with the function _start_traced_peak.
+
+    Returns:
+        tuple of (int, int): The amount of memory allocated when the measurement stopped and
+                            the peak during the measurement in bytes.
+    """
+    memory_end, peak = tracemalloc.get_traced_memory()
+    peak = max(_peaks.pop(), peak)
+    if _peaks:
+        _peaks[-1] = max(_peaks[-1], peak)
+
+    return memory_end, peak
+
+
+def reset_rss_peak():
+    """Reset the peak resident set size of the process to the current resident set size.
+
+    The peak can be reset only on Linux. On other systems the peak of the whole process is
+    measured.
+    """
+    try:
+        with open(PROC_CLEAR_REFS, "w", encoding="ascii") as file:
+            file.write("5")
+    except OSError:
+        pass
+
+
+def get_rss_peak() -> int:
+    """Get the peak resident set size of the process.
+
+    Returns:
+        int: The peak resident set size in bytes, or 0 if it cannot be measured.
+    """
+    try:
+        with open(PROC_STATUS, "r", encoding="ascii") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    if resource is None:
+        return 0
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss_peak if sys.platform == "darwin" else rss_peak * 1024
+
+
+@contextmanager
+def track_memory():
+    """Measure the peak memory of the code inside the with block.
+
+    The peak resident set size is always measured. The tracemalloc peak is measured only if
+    tracemalloc is already tracing, for example when the instrumentation is enabled, because
+    tracing makes the algorithms many times slower.
+
+    Yields:
+        MemoryRecord: The record of the measurements, filled in when the with block ends.
+    """
+    record = MemoryRecord()
+    tracing = tracemalloc.is_tracing()
+    reset_rss_peak()
+    if tracing:
+        memory_start = _start_traced_peak()
+    try:
+        yield record
+    finally:
+        if tracing:
+            _, peak = _stop_traced_peak()
+            record.traced_peak = peak - memory_start
+        record.rss_peak = get_rss_peak()
+
+
+class Recorder:
+    """Class that records the phases while the instrumentation is enabled.
+
+    Attributes:
+        records (list): The records of the completed phases in the order they completed.
+    """
+
+    def __init__(self):
+        """Create a new Recorder."""
+        self.records = []
+
+    @contextmanager
+    def phase(self, name: str, bytes_in=0):
+        """Measure the wall time and the memory of the code inside the with block.
+
+        Args:
+            name (str): The name of the phase.
+            bytes_in (int, optional): The size of the input of the phase. Defaults to 0.
+
+        Yields:
+            PhaseRecord: The record of the phase. The size of the output can be set to it.
+        """
+        record = PhaseRecord(name, bytes_in)
+        memory_start = _start_traced_peak()
+        start = time.perf_counter_ns()
+        try:
+            yield record
+        finally:
+            record.time_ns = time.perf_counter_ns() - start
+            memory_end, peak = _stop_traced_peak()
+            record.memory_peak = peak - memory_start
+            record.memory_delta = memory_end - memory_start
+            self.records.append(record)
+
+    def take_records(self) -> list:
+        """Remove and return the records of the completed phases.
+
+        Returns:
+            records (list): The records completed since the previous call.
+        """
+        records = self.records
+        self.records = []
+
+        return records
+
+
+_RECORDER = ContextVar(
+    "recorder", default=Recorder() if os.environ.get(INSTRUMENTATION_ENV) else None)
+if _RECORDER.get() is not None:
+    tracemalloc.start()
+
+
+def get_recorder():
+    """Return the recorder of the enabled instrumentation.
+
+    Returns:
+        Recorder: The recorder, or None if the instrumentation is disabled.
+    """
+    return _RECORDER.get()
+
+
+def phase(name: str, bytes_in=0):
+    """Return a context manager that measures a phase of an algorithm.
+
+    Args:
+        name (str): The name of the phase.
+        bytes_in (int, optional): The size of the input of the phase. Defaults to 0.
+
+    Returns:
+        A context manager that yields the PhaseRecord of the phase. If the instrumentation is
+        disabled, the record is shared by all the phases and nothing is recorded.
+    """
+    recorder = _RECORDER.get()
+    if recorder is None:
+        return _DISABLED_PHASE
+    return recorder.phase(name, bytes_in)
+
+
+@contextmanager
+def instrument():
+    """Enable the instrumentation inside the with block.
+
+    The recorder is stored in a context variable, so the instrumentation is enabled only in the
+    current thread. The instrumentation is also enabled for the whole process if the environment
+    variable INSTRUMENTATION_ENV is set when this module is imported.
+
+    Yields:
+        Recorder: The recorder of the phases completed inside the with block.
+    """
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    recorder = Recorder()
+    token = _RECORDER.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _RECORDER.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
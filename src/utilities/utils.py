@@ -1,7 +1,9 @@
+import argparse
 import math
 import os
 # Constants
 FILE_DIRECTORY = "src/textfiles"
+DEFAULT_CHUNK_SIZE = 1 << 16
 
 # Utility functions
 
@@ -17,12 +19,24 @@ def add_padding(binary_code: str, header_size: int) -> tuple[int, str]:
         tuple of (int, str): A tuple containing the length of the padding added 
                             and the padded code.
     """
-    padding_length = (8 - header_size) % 8
+    padding_length = calculate_padding_length(header_size)
     padded_code = "0" * padding_length + binary_code
 
     return padding_length, padded_code
 
 
+def calculate_padding_length(size: int) -> int:
+    """Calculate the length of the padding needed to make the given size dividable by 8.
+
+    Args:
+        size (int): The length of the data in bits.
+
+    Returns:
+        int: The number of padding bits needed.
+    """
+    return (8 - size) % 8
+
+
 def calculate_min_bits_needed(value):
     """Calculate the minimum number of bits needed to represent the given value.
 
@@ -37,6 +51,94 @@ def calculate_min_bits_needed(value):
     return bits_needed
 
 
+def positive_int(value: str) -> int:
+    """Convert a command line argument into an integer that is at least 1.
+
+    Args:
+        value (str): The value of the argument.
+
+    Returns:
+        int: The integer value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer or it is less than 1.
+    """
+    return _parse_int(value, 1)
+
+
+def non_negative_int(value: str) -> int:
+    """Convert a command line argument into an integer that is at least 0.
+
+    Args:
+        value (str): The value of the argument.
+
+    Returns:
+        int: The integer value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer or it is negative.
+    """
+    return _parse_int(value, 0)
+
+
+def _parse_int(value: str, minimum: int) -> int:
+    """Convert a command line argument into an integer that is at least the minimum.
+
+    Args:
+        value (str): The value of the argument.
+        minimum (int): The smallest allowed value.
+
+    Returns:
+        int: The integer value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer or it is too small.
+    """
+    try:
+        number = int(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(f"invalid integer value: {value!r}") from error
+    if number < minimum:
+        raise argparse.ArgumentTypeError(f"the value must be at least {minimum}: {value}")
+
+    return number
+
+
+def read_chunks(reader, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read the given file object in chunks until the end of the file.
+
+    Args:
+        reader (file object): A text or binary file object opened for reading.
+        chunk_size (int, optional): The maximum number of characters or bytes in a chunk.
+                                    Defaults to DEFAULT_CHUNK_SIZE.
+
+    Yields:
+        str or bytes: The next chunk of the file.
+    """
+    while True:
+        chunk = reader.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def find_extra_supported_symbols(text) -> list:
+    """Find all the symbols that are outside the range of 0-255 unicode points and are present
+    in the text.
+
+    The distinct symbols are collected into a set in one pass over the text, so only the
+    distinct symbols are checked and sorted.
+
+    Args:
+        text (str or iterable of str): The text or the symbols to search for the symbols.
+
+    Returns:
+        extra_supported_symbols (list): A sorted list containing all the symbols outside the
+                                    range of 0-255 unicode points.
+    """
+    return sorted(char for char in set(text) if ord(char) > 255)
+
+
 def list_non_empty_text_files():
     """Create a list of text files that can be compressed.
 
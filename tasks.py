@@ -4,8 +4,16 @@ import os
 pty = os.sys.platform.startswith("linux")
 
 @task
-def start(ctx, function):
-    ctx.run(f"python3 src/main.py {function}", pty=pty)
+def start(ctx, function, workers=""):
+    ctx.run(f"python3 src/main.py {function} {workers}", pty=pty)
+
+@task
+def benchmark(ctx, options=""):
+    ctx.run(f"python3 src/benchmark.py {options}", pty=pty)
+
+@task
+def cli(ctx, options=""):
+    ctx.run(f"python3 src/cli.py {options}", pty=pty)
 
 @task
 def format(ctx):